@@ -1,8 +1,13 @@
 import copy
 import os
-import yaml
-import logging
-from typing import Mapping, Sequence
+import sys
+from collections.abc import Mapping, Sequence
+from . import columnar as _columnar
+from . import compression as _compression
+from . import instrument
+from . import lazy as _lazy
+from . import numeric as _numeric
+from . import query as _query
 
 
 def _freeze(x, shouldFreeze=True):
@@ -13,49 +18,301 @@ def _freeze(x, shouldFreeze=True):
         x.freeze(shouldFreeze)
 
 
+def _read_yaml(
+        filename,
+        encoding='utf-8',
+        Loader=None,
+        lint=None,
+        lint_mode="eager",
+        include_cache=None,
+):
+    """
+    Read YAML content from a file, an S3 URI or a string.
+
+    Returns plain Python objects, with any `!include` tags resolved.  If
+    `lint` (a logger or logging function) is given, a file is checked with
+    `yaml_check` as set by `lint_mode` (see `Dict.load`).  A file that fails
+    to parse is always checked, so that the error raised explains what is
+    wrong with it.
+    """
+    from . import include
+    if Loader is None:
+        import yaml
+        Loader = yaml.SafeLoader
+    source = None
+    if isinstance(filename, str) and filename.startswith("s3://"):
+        # AWS S3 URI, load from there
+        bucket, key = filename[5:].split("/", 1)
+        from .s3 import read_s3
+        source = filename
+        timer = instrument.start()
+        raw = read_s3(bucket, key)
+        instrument.stop("load.read", timer, nbytes=len(raw))
+        timer = instrument.start()
+        content, includes = include.parse(raw, Loader)
+        instrument.stop("load.parse", timer, nbytes=len(raw))
+    elif isinstance(filename, str) and '\n' not in filename:
+        # single line string, treat as a filename
+        from .yaml_checker import yaml_check, yaml_check_background
+        if not os.path.exists(filename):
+            raise FileNotFoundError(filename)
+        if lint_mode not in ("eager", "background", "on_error"):
+            raise ValueError(f"unknown lint mode {lint_mode!r}")
+        source = os.path.abspath(filename)
+        signature = include.local_signature(source) if include_cache is not None else None
+        cached = include_cache.get(source, signature) if include_cache is not None else None
+        if cached is not None:
+            content, includes = cached
+        else:
+            with _compression.open_text(filename, 'r', encoding) as f:
+                # read the text once to share it between the linter and parser
+                timer = instrument.start()
+                if lint is not None or timer is not None:
+                    text = f.read()
+                    instrument.stop("load.read", timer, nbytes=len(text))
+                else:
+                    text = None
+                if lint is not None and lint_mode == "eager":
+                    timer = instrument.start()
+                    yaml_check(filename, logger=lint, content=text)
+                    instrument.stop("load.lint", timer, nbytes=len(text))
+                elif lint is not None and lint_mode == "background":
+                    yaml_check_background(filename, logger=lint, content=text)
+                try:
+                    timer = instrument.start()
+                    content, includes = include.parse(f if text is None else text, Loader)
+                    instrument.stop("load.parse", timer, nbytes=0 if text is None else len(text))
+                    if isinstance(content, str):
+                        raise ValueError(content)
+                except Exception as err:
+                    from io import StringIO
+                    buffer = StringIO()
+                    err_logger = lambda x: buffer.write(f"{x}\n")
+                    yaml_check(filename, logger=err_logger, encoding=encoding, content=text)
+                    raise ValueError(buffer.getvalue()) from err
+            if include_cache is not None:
+                include_cache.put(source, signature, content, includes)
+    else:
+        # multi line string, treat as yaml content
+        timer = instrument.start()
+        content, includes = include.parse(filename, Loader)
+        instrument.stop("load.parse", timer, nbytes=len(filename) if isinstance(filename, str) else 0)
+    if isinstance(content, str):
+        raise ValueError(content)
+    if includes:
+        timer = instrument.start()
+        content = include.resolve(
+            content, includes, source, Loader, encoding, cache=include_cache,
+        )
+        instrument.stop("load.include", timer)
+    elif include_cache is not None and source is not None and not source.startswith("s3://"):
+        # forget the files that an earlier version of this one included
+        include_cache._set_graph(source, {source})
+    return content
+
+
+def _load_worker(filename, encoding, Loader, lint):
+    """
+    Read YAML content in a `Dict.load_many` worker.
+
+    Returns a (content, error, messages) tuple, so that the lint diagnostics
+    reach the caller even when loading fails.
+    """
+    messages = []
+    try:
+        content = _read_yaml(
+            filename, encoding, Loader, lint=messages.append if lint else None,
+        )
+    except Exception as err:
+        return None, err, messages
+    return content, None, messages
+
+
+def _dump_yaml(data, target=None, **kwargs):
+    """
+    Emit plain Python objects as YAML.
+
+    If `target` is None the YAML is returned as a string, otherwise it is
+    written to that file (which must not already exist) or S3 URI.
+    """
+    import yaml
+    dumper = kwargs.pop('Dumper', None) or yaml.SafeDumper
+    if target is None or target.startswith("s3://"):
+        timer = instrument.start()
+        content = yaml.dump(data, Dumper=dumper, **kwargs)
+        instrument.stop("dump.emit", timer, nbytes=len(content))
+        if target is None:
+            return content
+        bucket, key = target[5:].split("/", 1)
+        from .s3 import write_s3
+        timer = instrument.start()
+        write_s3(content.encode(), bucket, key)
+        instrument.stop("dump.write", timer, nbytes=len(content))
+        return
+    if os.path.exists(target):
+        raise FileExistsError(target)
+    dirname = os.path.dirname(target)
+    if dirname and not os.path.exists(dirname):
+        os.makedirs(dirname)
+    with _compression.open_text(target, 'w', encoding=None) as f:
+        if instrument.enabled:
+            # emit to a string first, to time emitting and writing apart
+            content = _dump_yaml(data, Dumper=dumper, **kwargs)
+            timer = instrument.start()
+            f.write(content)
+            instrument.stop("dump.write", timer, nbytes=len(content))
+        else:
+            yaml.dump(data, f, Dumper=dumper, **kwargs)
+
+
+async def _adump(data, args, executor, kwargs):
+    import asyncio
+    import functools
+    target = args[0] if len(args) and isinstance(args[0], str) else None
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(_dump_yaml, data, target, **kwargs),
+    )
+
+
 class List(list):
 
-    __slots__ = ()
+    # only set on Lists with an index, see `index_by`
+    __slots__ = ('_indexes',)
     _Mapping = None
 
     def freeze(self, shouldFreeze=True):
         for val in self:
-            if isinstance(val, (self._Mapping, type(self))):
+            if isinstance(val, (self._Mapping, List)):
+                val.freeze(shouldFreeze)
+            elif isinstance(val, _numeric.ARRAY_TYPES):
+                _numeric.freeze(val, shouldFreeze)
+            elif isinstance(val, _columnar.ColumnarList):
                 val.freeze(shouldFreeze)
 
     def _unspecialize(self):
         return self.to_list()
 
-    def to_list(self):
+    def __getstate__(self):
+        # the indexes (see `index_by`) are not kept; with no state at all,
+        # Lists pickle at every protocol, despite their slot
+        return None
+
+    def to_columns(self, numeric='array'):
+        """
+        Store this List of records (mappings with the same keys) by column.
+
+        Returns an `addicty.columnar.ColumnarList`, which builds each row as
+        a Dict only when it is read.  See `Dict.load` for `numeric`.
+        """
+        dict_class = self._Mapping
+        if self and isinstance(self[0], dict_class):
+            # rows are built with the class of the records, e.g. a subclass
+            dict_class = type(self[0])
+        return _columnar.ColumnarList.from_records(self, numeric, dict_class=dict_class)
+
+    def index_by(self, *keys):
+        """
+        Index the records (mappings) of this List by one or more keys.
+
+        The index stays consistent as the List is changed, and asking again
+        for the same keys gives the same index.
+
+        Parameters
+        ----------
+        *keys
+            The keys to index by.  With several keys, look up records by a
+            tuple of their values.
+
+        Returns
+        -------
+        addicty.index.Index
+            With `get(key)` for the first record with a key, and
+            `filter(key)` for all of them.
+        """
+        if not keys:
+            raise TypeError("index_by() needs at least one key")
+        from .index import Index, indexed_class
+        cls = indexed_class(type(self))
+        if type(self) is not cls:
+            self.__class__ = cls
+            self._indexes = {}
+        index = self._indexes.get(keys)
+        if index is None:
+            index = self._indexes[keys] = Index(self, keys)
+        return index
+
+    def to_list(self, lazy='force'):
+        """
+        Convert this List to a plain list, recursively.
+
+        See `Dict.to_dict` for `lazy`.  A `addicty.lazy.Lazy` item is
+        evaluated here too, but stays in this List, as reading it would.
+        """
+        if lazy not in ('force', 'keep'):
+            raise ValueError(f"lazy must be 'force' or 'keep', not {lazy!r}")
+        with_lazy = _lazy.created
         base = []
         for value in self:
-            if isinstance(value, type(self)):
+            if with_lazy and type(value) is _lazy.Lazy:
+                if lazy == 'keep' and not value.evaluated:
+                    base += [value]
+                    continue
+                value = value.resolve(self._Mapping._hook)
+            if isinstance(value, List):
+                base += [value.to_list(lazy)]
+            elif isinstance(value, self._Mapping):
+                base += [value.to_dict(lazy)]
+            elif isinstance(value, _numeric.ARRAY_TYPES):
+                base += [value.tolist()]
+            elif isinstance(value, _columnar.ColumnarList):
                 base += [value.to_list()]
-            if isinstance(value, self._Mapping):
-                base += [value.to_dict()]
             else:
                 base += [value]
         return base
 
-    def dump(self, *args, **kwargs):
+    @staticmethod
+    def _dump_kwargs(kwargs):
         if 'default_flow_style' not in kwargs:
             kwargs['default_flow_style'] = False
         if 'indent' not in kwargs:
             kwargs['indent'] = 2
-        if len(args) and isinstance(args[0], str):
-            if isinstance(args[0], str) and args[0].startswith("s3://"):
-                bucket, key = args[0][5:].split("/", 1)
-                from .s3 import to_s3
-                return to_s3(self, bucket, key, **kwargs)
-            if os.path.exists(args[0]):
-                raise FileExistsError(args[0])
-            dirname = os.path.dirname(args[0])
-            if not os.path.exists(dirname):
-                os.makedirs(dirname)
-            with open(args[0], 'w') as f:
-                yaml.safe_dump(self.to_list(), f, **kwargs)
-        else:
-            return yaml.safe_dump(self.to_list(), **kwargs)
+        return kwargs
+
+    def dump(self, *args, lazy='force', **kwargs):
+        target = args[0] if len(args) and isinstance(args[0], str) else None
+        timer = instrument.start()
+        data = self.to_list(lazy)
+        instrument.stop("dump.to_dict", timer)
+        if lazy == 'keep':
+            kwargs['Dumper'] = _lazy.dumper()
+        return _dump_yaml(data, target, **self._dump_kwargs(kwargs))
+
+    async def adump(self, *args, executor=None, lazy='force', **kwargs):
+        """
+        Dump this List without blocking the event loop.
+
+        See `Dict.adump`.
+        """
+        data = self.to_list(lazy)
+        if lazy == 'keep':
+            kwargs['Dumper'] = _lazy.dumper()
+        return await _adump(data, args, executor, self._dump_kwargs(kwargs))
+
+    def __eq__(self, other):
+        try:
+            return list.__eq__(self, other)
+        except ValueError:
+            # a NumPy array in the List compares element by element
+            if not isinstance(other, list):
+                raise
+            return _numeric.equal(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
 
     def __repr__(self):
         return self.dump(
@@ -66,26 +323,54 @@ class List(list):
 
 class Dict(dict):
 
+    # The state of each Dict is kept in slots: an instance __dict__ of a
+    # dict subclass does not share its keys with other instances, so it
+    # would cost a hash table of its own on every node.  Rarely used state
+    # (memoized queries, validation, checkpoints) goes in `__extra`.
+    __slots__ = ('__parent', '__key', '__frozen', '__tracker', '__extra', '__weakref__')
+
     _Sequence = List
 
     def __init__(__self, *args, **kwargs):
-        object.__setattr__(__self, '__parent', kwargs.pop('__parent', None))
-        object.__setattr__(__self, '__key', kwargs.pop('__key', None))
-        object.__setattr__(__self, '__frozen', False)
+        parent = kwargs.pop('__parent', None)
+        object.__setattr__(__self, '_Dict__parent', parent)
+        object.__setattr__(__self, '_Dict__key', kwargs.pop('__key', None))
+        object.__setattr__(__self, '_Dict__frozen', False)
+        object.__setattr__(__self, '_Dict__tracker', None)
+        object.__setattr__(__self, '_Dict__extra', None)
+        numeric = kwargs.pop('__numeric', None)
+        intern = kwargs.pop('__intern', False)
+        hook = __self._hook
         for arg in args:
             if not arg:
                 continue
             elif isinstance(arg, dict):
-                for key, val in arg.items():
-                    __self[key] = __self._hook(val)
+                if parent is None and type(__self).__setitem__ is Dict.__setitem__:
+                    # a new Dict needs none of the work of __setitem__, and
+                    # updating from a dict sizes the table once
+                    if intern:
+                        items = {
+                            sys.intern(key) if type(key) is str else key: hook(val, numeric, True)
+                            for key, val in arg.items()
+                        }
+                    else:
+                        items = {key: hook(val, numeric) for key, val in arg.items()}
+                    dict.update(__self, items)
+                    if _lazy.created and _lazy.holds_lazy(items.values()):
+                        object.__setattr__(__self, '__class__', _lazy.lazy_class(type(__self)))
+                else:
+                    for key, val in arg.items():
+                        if intern and type(key) is str:
+                            key = sys.intern(key)
+                        __self[key] = hook(val, numeric, intern)
             elif isinstance(arg, tuple) and (not isinstance(arg[0], tuple)):
-                __self[arg[0]] = __self._hook(arg[1])
+                __self[arg[0]] = hook(arg[1], numeric, intern)
             else:
                 for key, val in iter(arg):
-                    __self[key] = __self._hook(val)
+                    __self[key] = hook(val, numeric, intern)
 
         for key, val in kwargs.items():
-            __self[key] = __self._hook(val)
+            __self[key] = hook(val, numeric, intern)
 
     def __setattr__(self, name, value):
         if hasattr(self.__class__, name):
@@ -95,21 +380,30 @@ class Dict(dict):
             self[name] = value
 
     def __setitem__(self, name, value):
-        isFrozen = (hasattr(self, '__frozen') and
-                    object.__getattribute__(self, '__frozen'))
-        if isFrozen and name not in super(Dict, self).keys():
-                raise KeyError(name)
-        super(Dict, self).__setitem__(name, value)
         try:
-            p = object.__getattribute__(self, '__parent')
-            key = object.__getattribute__(self, '__key')
+            isFrozen = object.__getattribute__(self, '_Dict__frozen')
         except AttributeError:
-            p = None
-            key = None
+            # unpickling sets the items before __setstate__ sets the slots
+            super(Dict, self).__setitem__(name, value)
+            return
+        if isFrozen:
+            if name not in super(Dict, self).keys():
+                raise KeyError(name)
+            _query.invalidate()
+        if type(value) is _Missing:
+            # store what the placeholder stands for, not the placeholder
+            value = _missing_class(value)()
+        super(Dict, self).__setitem__(name, value)
+        if type(value) is _lazy.Lazy and not isinstance(self, _lazy._WithLazy):
+            object.__setattr__(self, '__class__', _lazy.lazy_class(type(self)))
+        tracker = self.__tracker
+        if tracker is not None:
+            tracker[0].add(tracker[1] + (name,))
+        p = self.__parent
         if p is not None:
-            p[key] = self
-            object.__delattr__(self, '__parent')
-            object.__delattr__(self, '__key')
+            p[self.__key] = self
+            object.__setattr__(self, '_Dict__parent', None)
+            object.__setattr__(self, '_Dict__key', None)
 
     def __add__(self, other):
         if not self.keys():
@@ -121,67 +415,103 @@ class Dict(dict):
             raise TypeError(msg.format(self_type, other_type))
 
     @classmethod
-    def _hook(cls, item):
-        if isinstance(item, dict):
+    def _hook(cls, item, numeric=None, intern=False):
+        if type(item) is _Missing:
+            return _missing_class(item)()
+        elif isinstance(item, dict):
+            if numeric or intern:
+                return cls(item, __numeric=numeric, __intern=intern)
             return cls(item)
         elif isinstance(item, list):
+            if numeric:
+                array = _numeric.convert(item, numeric)
+                if array is not None:
+                    return array
             _List = cls._Sequence
             try:
-                return _List(cls._hook(elem) for elem in item)
+                return _List(cls._hook(elem, numeric, intern) for elem in item)
             except TypeError:
                 # some subclasses don't implement a constructor that
                 # accepts a generator, e.g. namedtuple
-                return _List(*(cls._hook(elem) for elem in item))
+                return _List(*(cls._hook(elem, numeric, intern) for elem in item))
         elif isinstance(item, tuple):
             try:
-                return type(item)(cls._hook(elem) for elem in item)
+                return type(item)(cls._hook(elem, numeric, intern) for elem in item)
             except TypeError:
                 # some subclasses don't implement a constructor that
                 # accepts a generator, e.g. namedtuple
-                return type(item)(*(cls._hook(elem) for elem in item))
+                return type(item)(*(cls._hook(elem, numeric, intern) for elem in item))
         return item
 
     def __getattr__(self, item):
         return self.__getitem__(item)
 
     def __missing__(self, name):
-        if object.__getattribute__(self, '__frozen'):
+        if object.__getattribute__(self, '_Dict__frozen'):
             raise KeyError(name)
-        return self.__class__(__parent=self, __key=name)
+        return _Missing(self, name)
 
     def __delattr__(self, name):
         del self[name]
 
+    def __delitem__(self, name):
+        super(Dict, self).__delitem__(name)
+        tracker = self.__tracker
+        if tracker is not None:
+            tracker[0].add(tracker[1] + (name,))
+
+    def _extra(self):
+        # the rarely used state of this Dict, made on first use
+        extra = self.__extra
+        if extra is None:
+            extra = {}
+            object.__setattr__(self, '_Dict__extra', extra)
+        return extra
+
     def _unspecialize(self):
         return self.to_dict()
 
-    def to_dict(self):
+    def to_dict(self, lazy='force'):
+        """
+        Convert this Dict to a plain dict, recursively.
+
+        Parameters
+        ----------
+        lazy : {'force', 'keep'}, default 'force'
+            Whether to evaluate the `addicty.lazy.Lazy` values (and keep the
+            results in this Dict, as reading them would), or to leave them
+            in the result unevaluated.
+        """
+        if lazy not in ('force', 'keep'):
+            raise ValueError(f"lazy must be 'force' or 'keep', not {lazy!r}")
+        cls = _lazy.plain_class(type(self))
+        with_lazy = cls is not type(self)
         base = {}
         for key, value in self.items():
-            if isinstance(value, type(self)):
-                base[key] = value._unspecialize()
+            if with_lazy and type(value) is _lazy.Lazy:
+                if lazy == 'keep' and not value.evaluated:
+                    base[key] = value
+                    continue
+                value = self[key]
+            if isinstance(value, cls):
+                base[key] = value.to_dict(lazy) if lazy == 'keep' else value._unspecialize()
             elif isinstance(value, self._Sequence):
-                try:
-                    base[key] = list(
-                        item._unspecialize() if isinstance(item, (type(self), self._Sequence)) else
-                        item for item in value)
-                except TypeError:
-                    # some subclasses don't implement a constructor that
-                    # accepts a generator, e.g. namedtuple
-                    base[key] = list(*(
-                        item._unspecialize() if isinstance(item, (type(self), self._Sequence)) else
-                        item for item in value))
+                base[key] = value.to_list(lazy)
             elif isinstance(value, (list, tuple)):
                 try:
                     base[key] = type(value)(
-                        item._unspecialize() if isinstance(item, (type(self), self._Sequence)) else
+                        item._unspecialize() if isinstance(item, (cls, self._Sequence)) else
                         item for item in value)
                 except TypeError:
                     # some subclasses don't implement a constructor that
                     # accepts a generator, e.g. namedtuple
                     base[key] = type(value)(*(
-                        item._unspecialize() if isinstance(item, (type(self), self._Sequence)) else
+                        item._unspecialize() if isinstance(item, (cls, self._Sequence)) else
                         item for item in value))
+            elif isinstance(value, _numeric.ARRAY_TYPES):
+                base[key] = value.tolist()
+            elif isinstance(value, _columnar.ColumnarList):
+                base[key] = value.to_list()
             else:
                 base[key] = value
         return base
@@ -193,7 +523,7 @@ class Dict(dict):
         return copy.deepcopy(self)
 
     def __deepcopy__(self, memo):
-        other = self.__class__()
+        other = _lazy.plain_class(type(self))()
         memo[id(self)] = other
         for key, value in self.items():
             other[copy.deepcopy(key, memo)] = copy.deepcopy(value, memo)
@@ -214,19 +544,41 @@ class Dict(dict):
             else:
                 self[k].update(v)
 
+    def __eq__(self, other):
+        try:
+            return dict.__eq__(self, other)
+        except ValueError:
+            # a NumPy array in the Dict compares element by element
+            if not isinstance(other, dict):
+                raise
+            return _numeric.equal(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
     def __getnewargs__(self):
         return tuple(self.items())
 
     def __getstate__(self):
-        state = self.to_dict()
-        isFrozen = (hasattr(self, '__frozen') and
-                    object.__getattribute__(self, '__frozen'))
-        state['__addict__frozen__'] = isFrozen
+        # Lazy values are left as they are, so copying does not compute them
+        state = self.to_dict(lazy='keep')
+        state['__addict__frozen__'] = self.__frozen
         return state
 
     def __setstate__(self, state):
+        Dict.__init__(self)
         shouldFreeze = state.pop('__addict__frozen__', False)
-        self.update(state)
+        # a pickle restores the items (arrays and all) before the state, and
+        # a copy after it, so only the keys not already here are set
+        hook = self._hook
+        for key, value in state.items():
+            if not dict.__contains__(self, key):
+                self[key] = hook(value)
+        if _lazy.holds_lazy(dict.values(self)) and not isinstance(self, _lazy._WithLazy):
+            object.__setattr__(self, '__class__', _lazy.lazy_class(type(self)))
         self.freeze(shouldFreeze)
 
     def __or__(self, other):
@@ -255,9 +607,14 @@ class Dict(dict):
             return default
 
     def freeze(self, shouldFreeze=True):
-        object.__setattr__(self, '__frozen', shouldFreeze)
+        object.__setattr__(self, '_Dict__frozen', shouldFreeze)
+        _query.invalidate()
         for key, val in self.items():
-            if isinstance(val, (type(self), self._Sequence)):
+            if isinstance(val, (_lazy.plain_class(type(self)), self._Sequence)):
+                val.freeze(shouldFreeze)
+            elif isinstance(val, _numeric.ARRAY_TYPES):
+                _numeric.freeze(val, shouldFreeze)
+            elif isinstance(val, _columnar.ColumnarList):
                 val.freeze(shouldFreeze)
         return self
 
@@ -270,8 +627,13 @@ class Dict(dict):
             filename,
             logger=None,
             encoding='utf-8',
-            Loader=yaml.SafeLoader,
+            Loader=None,
             freeze=True,
+            lint="eager",
+            include_cache=None,
+            schema=None,
+            numeric=None,
+            intern_keys=False,
     ):
         """
         Load a Dict from a YAML file.
@@ -291,76 +653,273 @@ class Dict(dict):
             Defaults to the SafeLoader.
         freeze : bool, default True
             Whether to freeze this Dict after loading.
+        lint : {'eager', 'background', 'on_error'}, default 'eager'
+            When a `logger` is given, whether a file is checked with
+            `yaml_check` before it is parsed, in a background thread (with
+            the results logged when ready), or only if parsing fails.  Lint
+            results are cached by file content, so reloading an unchanged
+            file is not checked again.
+        include_cache : addicty.include.IncludeCache, optional
+            Parsed files to reuse when the content has `!include` tags (see
+            below), so that loading again re-parses only changed files.
+        schema : dict or addicty.schema.Validator, optional
+            A schema to check the loaded content against (see
+            `addicty.schema.validate`),
+            raising `addicty.schema.ValidationError` if it does not match.
+            Each distinct schema is compiled only once.
+        numeric : {None, 'array', 'numpy'}, default None
+            How to store lists holding only numbers: as a `List` of Python
+            numbers, as a compact `addicty.numeric.Array`, or as a NumPy
+            array (nested lists of equal length become one array of two or
+            more dimensions).  Freezing makes the arrays read-only, and
+            `to_dict` and `dump` turn them back into lists.
+        intern_keys : bool, default False
+            Intern the string keys (see `sys.intern`), so that all the
+            mappings with the same key share one string object for it,
+            instead of each keeping the copy made by the parser.  This saves
+            much memory when loading many records with the same keys.
 
         Returns
         -------
         Dict
+
+        Notes
+        -----
+        A value tagged as `!include other.yaml` is replaced by the content
+        of that file (or `s3://` URI), found relative to the including file.
+        Included files may include others; each file is parsed only once,
+        the files at each level are loaded in parallel, and circular
+        includes raise a ValueError.
         """
-        from .yaml_checker import yaml_check
-        if isinstance(filename, str) and filename.startswith("s3://"):
-            # AWS S3 URI, load from there
-            bucket, key = filename[5:].split("/", 1)
-            from .s3 import from_s3
-            result = from_s3(cls, bucket, key)
-        elif isinstance(filename, str) and '\n' not in filename:
-            # single line string, treat as a filename
-            if not os.path.exists(filename):
-                raise FileNotFoundError(filename)
-            if logger is not None:
-                yaml_check(filename, logger=logger)
-            with open(filename, 'r', encoding=encoding) as f:
-                try:
-                    content = yaml.load(f, Loader=Loader)
-                    if isinstance(content, Mapping):
-                        result = cls(content)
-                    elif isinstance(content, str):
-                        raise ValueError(content)
-                    elif isinstance(content, Sequence):
-                        result = cls._Sequence(content)
-                    else:
-                        result = cls({'_top_': content})['_top_']
-                except Exception as err:
-                    from io import StringIO
-                    buffer = StringIO()
-                    err_logger = lambda x: buffer.write(f"{x}\n")
-                    yaml_check(filename, logger=err_logger)
-                    raise ValueError(buffer.getvalue()) from err
+        content = _read_yaml(
+            filename, encoding, Loader, lint=logger, lint_mode=lint,
+            include_cache=include_cache,
+        )
+        result = cls._finish_load(content, freeze, numeric, intern_keys)
+        if schema is not None:
+            from .schema import Validator, compile_schema
+            if not isinstance(schema, Validator):
+                schema = compile_schema(schema)
+            schema.validate(result)
+        return result
+
+    @classmethod
+    def load_many(
+            cls,
+            filenames,
+            executor="process",
+            max_workers=None,
+            logger=None,
+            encoding='utf-8',
+            Loader=None,
+            freeze=True,
+            return_exceptions=False,
+    ):
+        """
+        Load a number of Dicts from YAML files in parallel.
+
+        Each source is read and parsed in a worker, which sends back plain
+        Python containers (which are much cheaper to pickle than Dicts); the
+        conversion to Dict happens in the calling process.
+
+        Parameters
+        ----------
+        filenames : Iterable[str]
+            Anything accepted by `Dict.load`, including `s3://` URIs, in
+            any mix.
+        executor : {'process', 'thread'} or concurrent.futures.Executor
+            Where to run the workers.  Parsing YAML is CPU-bound, so
+            processes are usually faster unless the sources are few or
+            small.  An existing executor is used without shutting it down.
+        max_workers : int, optional
+            The number of workers for a newly created pool.
+        logger : logging.Logger, optional
+            A logger for error messages.  If given, each file is checked
+            with `yaml_check` in its worker, and the diagnostics are
+            logged here, in the order of `filenames`.
+        encoding : str, default 'utf-8'
+            The encoding of the files to be loaded.
+        Loader : yaml.Loader, optional
+            Defaults to the SafeLoader.
+        freeze : bool, default True
+            Whether to freeze the Dicts after loading.
+        return_exceptions : bool, default False
+            If True, a source that fails to load is represented by its
+            exception in the result, instead of that exception being raised.
+
+        Returns
+        -------
+        list
+            One loaded Dict (or List, or exception) per source, in order.
+        """
+        from concurrent.futures import (
+            Executor, ProcessPoolExecutor, ThreadPoolExecutor,
+        )
+        filenames = list(filenames)
+        if isinstance(executor, Executor):
+            pool = executor
+        elif executor == "process":
+            pool = ProcessPoolExecutor(max_workers)
+        elif executor == "thread":
+            pool = ThreadPoolExecutor(max_workers)
         else:
-            # multi line string, treat as yaml content
-            content = yaml.load(filename, Loader=Loader)
-            if isinstance(content, Mapping):
-                result = cls(content)
-            elif isinstance(content, str):
-                raise ValueError(content)
-            elif isinstance(content, Sequence):
-                result = cls._Sequence(content)
-            else:
-                result = cls({'_top_': content})['_top_']
+            raise ValueError(f"unknown executor {executor!r}")
+        try:
+            futures = [
+                pool.submit(_load_worker, filename, encoding, Loader, logger is not None)
+                for filename in filenames
+            ]
+            outcomes = [future.result() for future in futures]
+        finally:
+            if pool is not executor:
+                pool.shutdown()
+        return cls._from_outcomes(outcomes, logger, freeze, return_exceptions)
+
+    @classmethod
+    async def aload(
+            cls,
+            filename,
+            logger=None,
+            encoding='utf-8',
+            Loader=None,
+            freeze=True,
+            executor=None,
+    ):
+        """
+        Load a Dict from a YAML file without blocking the event loop.
+
+        Reading (including from S3) and parsing run in `executor`, which
+        defaults to the event loop's default executor.  The arguments are
+        otherwise as for `Dict.load`.  Many files can be loaded concurrently
+        with `asyncio.gather` or `Dict.aload_many`.
+        """
+        result, = await cls.aload_many(
+            [filename], logger=logger, encoding=encoding, Loader=Loader,
+            freeze=freeze, executor=executor,
+        )
+        return result
+
+    @classmethod
+    async def aload_many(
+            cls,
+            filenames,
+            logger=None,
+            encoding='utf-8',
+            Loader=None,
+            freeze=True,
+            executor=None,
+            return_exceptions=False,
+    ):
+        """
+        Load a number of Dicts concurrently without blocking the event loop.
+
+        The arguments are as for `Dict.load_many`, except that `executor`
+        must be None (the event loop's default executor) or an Executor.
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        outcomes = await asyncio.gather(*(
+            loop.run_in_executor(
+                executor, _load_worker, filename, encoding, Loader, logger is not None,
+            )
+            for filename in filenames
+        ))
+        return cls._from_outcomes(outcomes, logger, freeze, return_exceptions)
+
+    @classmethod
+    def _from_outcomes(cls, outcomes, logger, freeze, return_exceptions):
+        if logger is not None:
+            from .yaml_checker import _log_function
+            log = _log_function(logger)
+            for content, error, messages in outcomes:
+                for message in messages:
+                    log(message)
+        results = []
+        for content, error, messages in outcomes:
+            if error is not None:
+                if not return_exceptions:
+                    raise error
+                results.append(error)
+                continue
+            results.append(cls._finish_load(content, freeze))
+        return results
+
+    @classmethod
+    def _finish_load(cls, content, freeze, numeric=None, intern_keys=False):
+        nodes = instrument.count_nodes(content) if instrument.enabled else 0
+        timer = instrument.start()
+        result = cls._from_content(content, numeric, intern_keys)
+        instrument.stop("load.hook", timer, nodes=nodes)
         if freeze:
-            result.freeze(True)
+            timer = instrument.start()
+            if isinstance(result, _numeric.ARRAY_TYPES):
+                _numeric.freeze(result)
+            else:
+                result.freeze(True)
+            instrument.stop("load.freeze", timer)
         return result
 
-    def dump(self, *args, **kwargs):
+    @classmethod
+    def _from_content(cls, content, numeric=None, intern_keys=False):
+        if isinstance(content, Mapping):
+            if numeric or intern_keys:
+                return cls(content, __numeric=numeric, __intern=intern_keys)
+            return cls(content)
+        elif isinstance(content, Sequence):
+            if numeric:
+                array = _numeric.convert(content, numeric)
+                if array is not None:
+                    return array
+            return cls._Sequence(content)
+        else:
+            return cls({'_top_': content})['_top_']
+
+    @staticmethod
+    def _dump_kwargs(kwargs):
         if 'default_flow_style' not in kwargs:
             kwargs['default_flow_style'] = False
         if 'indent' not in kwargs:
             kwargs['indent'] = 2
         if 'sort_keys' not in kwargs:
             kwargs['sort_keys'] = False
-        if len(args) and isinstance(args[0], str):
-            if isinstance(args[0], str) and args[0].startswith("s3://"):
-                bucket, key = args[0][5:].split("/", 1)
-                from .s3 import to_s3
-                return to_s3(self, bucket, key, **kwargs)
-            if os.path.exists(args[0]):
-                raise FileExistsError(args[0])
-            dirname = os.path.dirname(args[0])
-            if dirname and not os.path.exists(dirname):
-                os.makedirs(dirname)
-            with open(args[0], 'w') as f:
-                yaml.safe_dump(self.to_dict(), f, **kwargs)
-        else:
-            return yaml.safe_dump(self.to_dict(), **kwargs)
+        return kwargs
+
+    def dump(self, *args, lazy='force', **kwargs):
+        target = args[0] if len(args) and isinstance(args[0], str) else None
+        timer = instrument.start()
+        data = self.to_dict(lazy)
+        instrument.stop("dump.to_dict", timer)
+        if lazy == 'keep':
+            kwargs['Dumper'] = _lazy.dumper()
+        return _dump_yaml(data, target, **self._dump_kwargs(kwargs))
+
+    async def adump(self, *args, executor=None, lazy='force', **kwargs):
+        """
+        Dump this Dict without blocking the event loop.
+
+        The content is converted to plain Python objects on the calling
+        thread, so later changes to this Dict do not affect the output;
+        emitting the YAML and writing it to a file or S3 run in `executor`.
+
+        Parameters
+        ----------
+        *args, **kwargs
+            As for `Dict.dump`.
+        executor : concurrent.futures.Executor, optional
+            Defaults to the event loop's default executor.
+        lazy : {'force', 'keep'}, default 'force'
+            As for `to_dict`; with 'keep', unevaluated Lazy values are
+            written as their `!lazy` tags.
+
+        Returns
+        -------
+        str or None
+            The YAML content, if no file or URI was given.
+        """
+        data = self.to_dict(lazy)
+        if lazy == 'keep':
+            kwargs['Dumper'] = _lazy.dumper()
+        return await _adump(data, args, executor, self._dump_kwargs(kwargs))
 
     def __repr__(self):
         return self.dump(
@@ -369,4 +928,87 @@ class Dict(dict):
         ).rstrip("\n")
 
 
+class _Missing(dict):
+    """
+    What reading a missing key of an unfrozen Dict returns.
+
+    This stands in for the empty child Dict that the key would hold: it is
+    an empty dict (so it is falsy, and `json` writes it as ``{}``), and
+    reading from it gives more placeholders.  Real Dicts are only created
+    along the path when something is assigned through it (or a Dict method
+    is called on it), so reading optional settings allocates one small
+    object per level instead of a Dict and its attributes.
+
+    Every attribute that is not a Dict method reads as a key, so the state
+    of a placeholder is kept in name-mangled slots and handled by the
+    functions below, which no key can hide.
+    """
+
+    __slots__ = ('__parent', '__key')
+
+    def __init__(self, parent, key):
+        object.__setattr__(self, '_Missing__parent', parent)
+        object.__setattr__(self, '_Missing__key', key)
+
+    def __getattribute__(self, name):
+        if name[:2] == '__':
+            return object.__getattribute__(self, name)
+        if hasattr(_missing_class(self), name):
+            return getattr(_materialize(self), name)
+        return _Missing(self, name)
+
+    def __getitem__(self, name):
+        return _Missing(self, name)
+
+    def __setattr__(self, name, value):
+        setattr(_materialize(self, attach=True), name, value)
+
+    def __setitem__(self, name, value):
+        _materialize(self, attach=True)[name] = value
+
+    def __delattr__(self, name):
+        raise KeyError(name)
+
+    def __delitem__(self, name):
+        raise KeyError(name)
+
+    def __add__(self, other):
+        return other
+
+    def __repr__(self):
+        return repr(_missing_class(self)())
+
+
+_missing_parent = _Missing._Missing__parent.__get__
+_missing_key = _Missing._Missing__key.__get__
+
+
+def _missing_class(missing):
+    """The Dict class that a placeholder stands in for."""
+    node = missing
+    while type(node) is _Missing:
+        node = _missing_parent(node)
+    return _lazy.plain_class(type(node)) if isinstance(node, Dict) else Dict
+
+
+def _materialize(missing, attach=False):
+    """
+    Get the Dict at the path of a placeholder, creating it if need be.
+
+    A new Dict is put in its parent if `attach`, and otherwise is only
+    attached once a value is set in it, like an autovivified Dict.
+    """
+    parent, key = _missing_parent(missing), _missing_key(missing)
+    if type(parent) is _Missing:
+        parent = _materialize(parent, attach)
+    value = dict.get(parent, key, _Missing)
+    if isinstance(value, dict):
+        return value
+    cls = _lazy.plain_class(type(parent)) if isinstance(parent, Dict) else Dict
+    if attach:
+        child = parent[key] = cls()
+        return child
+    return cls(__parent=parent, __key=key)
+
+
 List._Mapping = Dict
@@ -0,0 +1,178 @@
+"""
+Atomic, skip-if-unchanged YAML checkpoints of a Dict, made by `checkpoint`.
+
+A checkpoint is written to a temporary file in the same directory and
+renamed over the target, so readers see either the old or the new file,
+never a partial one.  The YAML of each top-level key is kept from one
+checkpoint to the next, and only the keys whose content changed are emitted
+again; when nothing changed and the file is as it was left, nothing is
+written at all.
+"""
+
+import hashlib
+import os
+import stat
+import tempfile
+import threading
+
+import yaml
+
+from . import compression
+from . import instrument
+
+# dump options under which the YAML of a block mapping is the YAML of its
+# items, one after another
+_WHOLE_DOCUMENT_OPTIONS = ('explicit_start', 'explicit_end', 'version', 'tags', 'canonical')
+
+
+def _digest(text):
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def atomic_write(filename, content, fsync=False):
+    """
+    Replace the content of a file atomically.
+
+    The content is written to a temporary file next to `filename`, which
+    is then renamed over it.  With `fsync`, the file (and on POSIX the
+    directory holding it) is flushed to disk before this returns, so the
+    new content survives a crash as well.
+    """
+    dirname = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(dirname, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(filename).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, temp = tempfile.mkstemp(dir=dirname, prefix=f".{os.path.basename(filename)}.", suffix='.tmp')
+    os.close(fd)
+    try:
+        # mkstemp makes the file private, so keep the mode of the file it replaces
+        os.chmod(temp, mode)
+        with compression.open_text(temp, 'w', 'utf-8', compression.from_extension(filename)) as f:
+            f.write(content)
+        if fsync:
+            # after closing, so that a compressed file is complete
+            with open(temp, 'ab') as f:
+                os.fsync(f.fileno())
+        os.replace(temp, filename)
+    except BaseException:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+    if fsync and hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(dirname, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class Checkpoint(object):
+    """
+    The state kept between checkpoints of one Dict to one file.
+
+    Parameters
+    ----------
+    filename : str
+        The file to write.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._options = None
+        self._fragments = {}
+        self._digest = None
+        self._stat = None
+
+    def _emit(self, data, kwargs):
+        if not data or kwargs.get('default_flow_style') is not False or any(
+                kwargs.get(k) for k in _WHOLE_DOCUMENT_OPTIONS):
+            self._fragments = {}
+            return yaml.safe_dump(data, **kwargs)
+        keys = sorted(data) if kwargs.get('sort_keys', True) else data
+        old, new = self._fragments, {}
+        for key in keys:
+            value = {key: data[key]}
+            # repr tells True, 1 and 1.0 apart, which == does not
+            digest = _digest(repr(value))
+            fragment = old.get(key)
+            if fragment is None or fragment[0] != digest:
+                fragment = (digest, yaml.safe_dump(value, **kwargs))
+            new[key] = fragment
+        self._fragments = new
+        return ''.join(fragment[1] for fragment in new.values())
+
+    def _unchanged_on_disk(self):
+        try:
+            st = os.stat(self.filename)
+        except OSError:
+            return False
+        return self._stat == (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def write(self, data, fsync=False, **kwargs):
+        """
+        Write plain Python objects as YAML, unless the file already has them.
+
+        Returns
+        -------
+        bool
+            Whether the file was written.
+        """
+        with self._lock:
+            options = repr(sorted(kwargs.items()))
+            if options != self._options:
+                self._options, self._fragments = options, {}
+            timer = instrument.start()
+            content = self._emit(data, kwargs)
+            instrument.stop("dump.emit", timer, nbytes=len(content))
+            digest = _digest(content)
+            if digest == self._digest and self._unchanged_on_disk():
+                return False
+            timer = instrument.start()
+            atomic_write(self.filename, content, fsync)
+            instrument.stop("dump.write", timer, nbytes=len(content))
+            st = os.stat(self.filename)
+            self._digest, self._stat = digest, (st.st_mtime_ns, st.st_size, st.st_ino)
+            return True
+
+
+def checkpoint(d, filename, fsync=False, **kwargs):
+    """
+    Save a Dict to a YAML file, atomically and only if it changed.
+
+    Unlike `Dict.dump`, this overwrites `filename`, by writing a temporary
+    file next to it and renaming that over it, so readers never see a
+    partial file.  The YAML of each top-level key is kept from the last
+    checkpoint of the same Dict to the same file, and only keys whose
+    content changed are emitted again; if the whole content is the same
+    and the file was not touched since, nothing is written.
+
+    Parameters
+    ----------
+    d : Dict
+    filename : str
+        A local file.
+    fsync : bool, default False
+        Flush the file to disk before returning, so the checkpoint
+        survives a crash of the machine, not just of the process.
+    **kwargs
+        Other arguments passed to `yaml.safe_dump`, as for `Dict.dump`.
+
+    Returns
+    -------
+    bool
+        Whether the file was written.
+    """
+    checkpoints = d._extra().setdefault('checkpoints', {})
+    path = os.path.abspath(filename)
+    state = checkpoints.get(path)
+    if state is None:
+        state = checkpoints.setdefault(path, Checkpoint(path))
+    timer = instrument.start()
+    data = d.to_dict()
+    instrument.stop("dump.to_dict", timer)
+    return state.write(data, fsync, **d._dump_kwargs(kwargs))
@@ -0,0 +1,224 @@
+"""
+Column storage for tables kept as a List of Dict records.
+
+>>> trips = config.trips.to_columns()
+>>> trips.columns.fare        # one compact array for the whole column
+>>> trips[3].fare             # a row, built as a Dict when asked for
+"""
+
+from collections.abc import Mapping, Sequence
+from . import numeric as _numeric
+
+
+class ColumnarList(Sequence):
+    """
+    A table of records with the same keys, stored as one column per key.
+
+    Columns of numbers are stored as `addicty.numeric.Array` or NumPy
+    arrays (see `numeric`), and other columns as lists, so the table holds
+    no object per row.  Indexing with an int builds that row as a Dict;
+    the row is a copy, so change a value through `columns` instead.
+    Slicing gives a new ColumnarList.
+
+    Parameters
+    ----------
+    columns : Mapping
+        The column for each key, all of the same length.
+    numeric : {'array', 'numpy', None}, default 'array'
+        How to store the columns that hold only numbers (see
+        `Dict.load`).  Columns that are already arrays are kept as they are.
+    dict_class : type, optional
+        The class of the rows, `addicty.Dict` by default.
+    """
+
+    def __init__(self, columns, numeric='array', dict_class=None):
+        if dict_class is None:
+            from .addict import Dict as dict_class
+        self._dict_class = dict_class
+        self._frozen = False
+        self.columns = dict_class()
+        length = None
+        for key, values in columns.items():
+            if not isinstance(values, _numeric.ARRAY_TYPES):
+                values = list(values)
+                if numeric:
+                    array = _numeric.convert(values, numeric)
+                    if array is not None:
+                        values = array
+            if length is None:
+                length = len(values)
+            elif len(values) != length:
+                raise ValueError(
+                    f"column {key!r} has {len(values)} values, not {length}"
+                )
+            self.columns[key] = values
+        self._length = length or 0
+
+    @classmethod
+    def from_records(cls, records, numeric='array', dict_class=None):
+        """
+        Make a table from mappings that all have the same keys.
+
+        Raises
+        ------
+        ValueError
+            If a record is not a mapping, or its keys differ from the first.
+        """
+        records = list(records)
+        keys = list(records[0]) if records else []
+        key_set = set(keys)
+        columns = {key: [] for key in keys}
+        appends = [(key, columns[key].append) for key in keys]
+        for i, record in enumerate(records):
+            if not isinstance(record, Mapping) or record.keys() != key_set:
+                raise ValueError(f"record {i} does not have the keys {keys}")
+            for key, append in appends:
+                append(record[key])
+        return cls(columns, numeric=numeric, dict_class=dict_class)
+
+    @classmethod
+    def from_pandas(cls, df, dict_class=None):
+        """Make a table from a pandas DataFrame, sharing its numeric columns."""
+        columns = {}
+        for key in df.columns:
+            series = df[key]
+            if series.dtype.kind in 'iuf':
+                columns[key] = series.to_numpy()
+            else:
+                columns[key] = series.tolist()
+        return cls(columns, numeric='numpy', dict_class=dict_class)
+
+    def keys(self):
+        return list(self.columns)
+
+    def __len__(self):
+        return self._length
+
+    def _row(self, i):
+        return self._dict_class(
+            (key, _item(values, i)) for key, values in dict.items(self.columns)
+        )
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return type(self)(
+                {key: values[i] for key, values in dict.items(self.columns)},
+                numeric=None, dict_class=self._dict_class,
+            )
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("ColumnarList index out of range")
+        return self._row(i)
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield self._row(i)
+
+    def append(self, record):
+        """
+        Add a record, which must have the same keys as the table.
+
+        Raises
+        ------
+        ValueError
+            If the keys of the record differ from those of the table.
+        TypeError
+            If a value does not fit its column (e.g. a float in a column of
+            ints stored as an `Array`).  No column is changed.
+        """
+        if self._frozen:
+            raise TypeError("a frozen ColumnarList is read-only")
+        if set(record) != set(self.columns):
+            raise ValueError(f"the record does not have the keys {self.keys()}")
+        # convert every value before changing any column, so that a value
+        # that does not fit leaves the table as it was
+        converted = {}
+        for key, values in dict.items(self.columns):
+            value = record[key]
+            if isinstance(values, _numeric.Array):
+                value = _numeric.Array(values.typecode, [value])
+            elif not isinstance(values, list):
+                # NumPy arrays are not resized in place, so this copies
+                import numpy
+                value = numpy.append(values, value)
+            converted[key] = value
+        for key, value in converted.items():
+            values = dict.__getitem__(self.columns, key)
+            if isinstance(values, list):
+                values.append(value)
+            elif isinstance(values, _numeric.Array):
+                values.extend(value)
+            else:
+                self.columns[key] = value
+        self._length += 1
+
+    def freeze(self, shouldFreeze=True):
+        """Make the table and its array columns read-only."""
+        self._frozen = shouldFreeze
+        self.columns.freeze(shouldFreeze)
+        return self
+
+    def to_rows(self):
+        """The records as a `List` of Dicts."""
+        return self._dict_class._Sequence(self)
+
+    def to_list(self):
+        """The records as a list of plain dicts."""
+        columns = [
+            values.tolist() if isinstance(values, _numeric.ARRAY_TYPES) else
+            [_plain(v) for v in values]
+            for values in dict.values(self.columns)
+        ]
+        keys = list(self.columns)
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+
+    # like array.array and NumPy arrays
+    tolist = _unspecialize = to_list
+
+    def to_numpy(self):
+        """A dict of NumPy arrays, one per column (sharing array data)."""
+        import numpy
+        return {
+            key: numpy.asarray(values)
+            for key, values in dict.items(self.columns)
+        }
+
+    def to_pandas(self):
+        """A pandas DataFrame, with a column per key."""
+        import pandas
+        return pandas.DataFrame(self.to_numpy(), columns=self.keys())
+
+    def dump(self, *args, **kwargs):
+        from .addict import _dump_yaml
+        target = args[0] if len(args) and isinstance(args[0], str) else None
+        return _dump_yaml(
+            self.to_list(), target, **self._dict_class._Sequence._dump_kwargs(kwargs)
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, ColumnarList):
+            other = other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == [_plain(v) for v in other]
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"<ColumnarList of {self._length} records with keys {self.keys()}>"
+
+
+def _item(values, i):
+    value = values[i]
+    if isinstance(values, (list, _numeric.Array)):
+        return value
+    # NumPy scalars are given back as Python numbers, as in the records
+    return value.item() if value.ndim == 0 else value
+
+
+def _plain(value):
+    if hasattr(value, '_unspecialize'):
+        return value._unspecialize()
+    return value
+
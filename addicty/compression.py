@@ -0,0 +1,109 @@
+"""
+Compressed local YAML files, for `Dict.load` and `Dict.dump`.
+
+A file is compressed if its name ends in one of the extensions below, or
+(when reading) if it starts with the magic bytes of one of the formats.
+Files are decompressed and compressed as a stream, a block at a time, so
+the whole file is never held in memory in either form.
+
+=========  ================  =====================================
+Format     Extensions        Module
+=========  ================  =====================================
+gzip       .gz, .gzip        `gzip`
+bzip2      .bz2              `bz2`
+xz         .xz, .lzma        `lzma`
+zstd       .zst, .zstd       `compression.zstd` (Python 3.14+) or
+                             the `zstandard` package
+=========  ================  =====================================
+"""
+
+import os
+
+EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.lzma': 'xz',
+    '.zst': 'zstd',
+    '.zstd': 'zstd',
+}
+
+MAGIC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+
+
+def _zstd_open(filename, mode, **kwargs):
+    try:
+        from compression import zstd
+    except ImportError:
+        try:
+            import zstandard as zstd
+        except ImportError:
+            raise ImportError(
+                "reading or writing zstd files needs Python 3.14+ or the zstandard package"
+            ) from None
+    return zstd.open(filename, mode, **kwargs)
+
+
+def _opener(name):
+    if name == 'gzip':
+        import gzip
+        return gzip.open
+    if name == 'bz2':
+        import bz2
+        return bz2.open
+    if name == 'xz':
+        import lzma
+        return lzma.open
+    if name == 'zstd':
+        return _zstd_open
+    raise ValueError(f"unknown compression {name!r}")
+
+
+def from_extension(filename):
+    """The compression implied by the name of a file, or None."""
+    return EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+def detect(filename):
+    """
+    The compression of an existing file, or None if it is not compressed.
+
+    The extension is trusted if it names a format, and otherwise the first
+    bytes of the file are checked.
+    """
+    name = from_extension(filename)
+    if name is not None:
+        return name
+    with open(filename, 'rb') as f:
+        head = f.read(6)
+    for magic, name in MAGIC:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def open_text(filename, mode='r', encoding='utf-8', compression='infer'):
+    """
+    Open a local file as text, compressed or not.
+
+    Parameters
+    ----------
+    filename : str
+    mode : {'r', 'w'}
+    encoding : str, default 'utf-8'
+    compression : str or None, default 'infer'
+        One of 'gzip', 'bz2', 'xz' or 'zstd', None for a plain file, or
+        'infer' to use `detect` when reading and `from_extension` when
+        writing.
+    """
+    if compression == 'infer':
+        compression = detect(filename) if mode == 'r' else from_extension(filename)
+    if compression is None:
+        return open(filename, mode, encoding=encoding)
+    return _opener(compression)(filename, mode + 't', encoding=encoding)
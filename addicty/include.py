@@ -0,0 +1,223 @@
+import os
+import posixpath
+import threading
+import yaml
+from . import compression
+from . import lazy
+
+
+class Include(object):
+    """A placeholder for an `!include` tag, until it is resolved."""
+
+    __slots__ = ('path', 'source')
+
+    def __init__(self, path, source=None):
+        self.path = path
+        self.source = source
+
+    def __repr__(self):
+        return f"Include({self.path!r})"
+
+
+def _construct_include(loader, node):
+    include = Include(loader.construct_scalar(node))
+    loader.__dict__.setdefault('_addicty_includes', []).append(include)
+    return include
+
+
+_loaders = {}
+
+
+def include_loader(Loader):
+    """A subclass of `Loader` that understands the `!include` and `!lazy` tags."""
+    result = _loaders.get(Loader)
+    if result is None:
+        result = type(Loader.__name__, (Loader,), {})
+        result.add_constructor('!include', _construct_include)
+        result.add_constructor('!lazy', lazy.construct)
+        _loaders[Loader] = result
+    return result
+
+
+def parse(stream, Loader=yaml.SafeLoader):
+    """
+    Parse YAML content, which may contain `!include` tags.
+
+    Returns
+    -------
+    content : Any
+        Plain Python objects, with an `Include` in place of each tag.
+    includes : list[Include]
+        The `Include` placeholders in `content`.
+    """
+    loader = include_loader(Loader)(stream)
+    try:
+        content = loader.get_single_data()
+        return content, loader.__dict__.get('_addicty_includes', [])
+    finally:
+        loader.dispose()
+
+
+def local_signature(source):
+    """A cheap fingerprint of a local file, or None for an S3 URI."""
+    if source.startswith("s3://"):
+        return None
+    st = os.stat(source)
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def join(base, path):
+    """Find an included file, relative to the file (or URI) including it."""
+    if path.startswith("s3://"):
+        return path
+    if base is not None and base.startswith("s3://"):
+        if path.startswith("/"):
+            bucket = base[5:].split("/", 1)[0]
+            return f"s3://{bucket}{posixpath.normpath(path)}"
+        return "s3://" + posixpath.normpath(posixpath.join(posixpath.dirname(base[5:]), path))
+    if base is not None:
+        path = os.path.join(os.path.dirname(base), path)
+    return os.path.abspath(path)
+
+
+class IncludeCache(object):
+    """
+    Parsed files of `!include` graphs, to be reused by later loads.
+
+    A local file is parsed again only when its modification time, size or
+    inode change, so reloading a graph in which one file was edited re-parses
+    only that file.  Content from S3 is not cached between loads.
+    """
+
+    def __init__(self):
+        self._files = {}
+        self._graphs = {}
+        self._lock = threading.Lock()
+
+    def get(self, source, signature):
+        if signature is None:
+            return None
+        with self._lock:
+            entry = self._files.get(source)
+        if entry is not None and entry[0] == signature:
+            return entry[1], entry[2]
+        return None
+
+    def put(self, source, signature, content, includes):
+        if signature is not None:
+            with self._lock:
+                self._files[source] = (signature, content, includes)
+
+    def dependencies(self, source):
+        """All the files in the graph last loaded from `source`."""
+        with self._lock:
+            return self._graphs.get(source, {source})
+
+    def _set_graph(self, source, sources):
+        with self._lock:
+            self._graphs[source] = sources
+
+
+def _load_source(source, Loader, encoding, cache):
+    """Read and parse an included file, returning (content, includes)."""
+    if source.startswith("s3://"):
+        from .s3 import read_s3
+        bucket, key = source[5:].split("/", 1)
+        return parse(read_s3(bucket, key), Loader)
+    signature = local_signature(source)
+    cached = cache.get(source, signature)
+    if cached is not None:
+        return cached
+    with compression.open_text(source, 'r', encoding) as f:
+        try:
+            content, includes = parse(f, Loader)
+        except yaml.YAMLError as err:
+            raise ValueError(f"cannot parse included file {source}\n{err}") from err
+    for include in includes:
+        include.source = join(source, include.path)
+    cache.put(source, signature, content, includes)
+    return content, includes
+
+
+def resolve(
+        content,
+        includes,
+        source=None,
+        Loader=yaml.SafeLoader,
+        encoding='utf-8',
+        cache=None,
+        max_workers=8,
+):
+    """
+    Replace `!include` placeholders with the content of the included files.
+
+    The included files are found relative to `source` (the file or URI that
+    `content` came from, or None for the current directory).  Each distinct
+    file is read and parsed once, however many times it is included, and
+    the files at each level of the graph are loaded in parallel.
+
+    Raises
+    ------
+    ValueError
+        If the includes are circular.
+    """
+    if cache is None:
+        cache = IncludeCache()
+    for include in includes:
+        if include.source is None:
+            include.source = join(source, include.path)
+    parsed = {source: (content, includes)}
+    frontier = sorted({include.source for include in includes})
+    while frontier:
+        if len(frontier) == 1:
+            loaded = [_load_source(frontier[0], Loader, encoding, cache)]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(min(max_workers, len(frontier))) as pool:
+                loaded = list(pool.map(
+                    lambda s: _load_source(s, Loader, encoding, cache), frontier,
+                ))
+        parsed.update(zip(frontier, loaded))
+        frontier = sorted({
+            include.source
+            for _, child_includes in loaded
+            for include in child_includes
+            if include.source not in parsed
+        })
+
+    # depth first, to detect cycles and assemble the leaves first
+    assembled = {}
+    active = [source]
+    stack = [(source, iter({i.source for i in includes}))]
+    while stack:
+        node, children = stack[-1]
+        for child in children:
+            if child in assembled:
+                continue
+            if child in active:
+                cycle = active[active.index(child):] + [child]
+                raise ValueError("circular !include: " + " -> ".join(map(str, cycle)))
+            active.append(child)
+            stack.append((child, iter({i.source for i in parsed[child][1]})))
+            break
+        else:
+            stack.pop()
+            active.pop()
+            node_content, node_includes = parsed[node]
+            if node_includes:
+                node_content = _substitute(node_content, assembled)
+            assembled[node] = node_content
+    if source is not None and not source.startswith("s3://"):
+        cache._set_graph(source, {s for s in parsed if not s.startswith("s3://")})
+    return assembled[source]
+
+
+def _substitute(x, assembled):
+    # build new containers, so that cached content is never changed
+    if type(x) is Include:
+        return assembled[x.source]
+    if isinstance(x, dict):
+        return {k: _substitute(v, assembled) for k, v in x.items()}
+    if isinstance(x, list):
+        return [_substitute(v, assembled) for v in x]
+    return x
@@ -0,0 +1,191 @@
+"""
+Secondary indexes on a List of records, made by `List.index_by`.
+
+Indexing a List switches it to a subclass of its class whose mutating
+methods keep its indexes up to date, so Lists without an index pay nothing.
+"""
+
+_absent = object()
+
+_indexed_classes = {}
+
+
+class Index(object):
+    """
+    Records of a List, looked up by the values of one or more keys.
+
+    With one key, look up by its value; with several, by a tuple of values.
+    Records that are not mappings or lack a key are not indexed.  Records
+    with the same key are kept in list order.
+
+    The index follows changes to the List itself (append, extend, insert,
+    pop, remove, item assignment, sort, ...): appending, removing and
+    replacing a record update it in place, and other changes rebuild it.
+    Lookups never check whether the index is stale, so they cost a dict
+    lookup.  Changing the key of a record in place is not seen, so call
+    `rebuild` after doing that.
+    """
+
+    def __init__(self, records, keys):
+        self.keys = keys
+        self._records = records
+        self._groups = {}
+        self.rebuild()
+
+    def _key(self, record):
+        if not isinstance(record, dict):
+            return _absent
+        if len(self.keys) == 1:
+            return dict.get(record, self.keys[0], _absent)
+        values = tuple(dict.get(record, k, _absent) for k in self.keys)
+        return _absent if _absent in values else values
+
+    def rebuild(self):
+        """Index all the records again."""
+        self._groups = {}
+        self._add(self._records)
+
+    def _add(self, records):
+        groups = self._groups
+        for record in records:
+            key = self._key(record)
+            if key is not _absent:
+                group = groups.get(key)
+                if group is None:
+                    groups[key] = [record]
+                else:
+                    group.append(record)
+
+    def _discard(self, records):
+        groups = self._groups
+        for record in records:
+            key = self._key(record)
+            group = groups.get(key) if key is not _absent else None
+            if group is None:
+                continue
+            for i, other in enumerate(group):
+                if other is record:
+                    del group[i]
+                    break
+            if not group:
+                del groups[key]
+
+    def get(self, key, default=None):
+        """The first record with this key, or `default`."""
+        group = self._groups.get(key)
+        return default if group is None else group[0]
+
+    def __getitem__(self, key):
+        group = self._groups.get(key)
+        if group is None:
+            raise KeyError(key)
+        return group[0]
+
+    def filter(self, key):
+        """All the records with this key, in list order."""
+        return list(self._groups.get(key, ()))
+
+    def __contains__(self, key):
+        return key in self._groups
+
+    def __len__(self):
+        return len(self._groups)
+
+    def __iter__(self):
+        return iter(self._groups)
+
+    def __repr__(self):
+        keys = ", ".join(map(repr, self.keys))
+        return f"<Index by {keys}: {len(self._groups)} keys>"
+
+
+def _rebuilding(name):
+    method = getattr(list, name)
+
+    def mutate(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        for index in self._indexes.values():
+            index.rebuild()
+        return result
+    mutate.__name__ = name
+    return mutate
+
+
+class _Indexed(object):
+    """Mutating methods of an indexed List, keeping its indexes current."""
+
+    __slots__ = ()
+
+    def append(self, item):
+        list.append(self, item)
+        for index in self._indexes.values():
+            index._add((item,))
+
+    def extend(self, items):
+        start = len(self)
+        list.extend(self, items)
+        added = self[start:]
+        for index in self._indexes.values():
+            index._add(added)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def pop(self, i=-1):
+        item = list.pop(self, i)
+        for index in self._indexes.values():
+            index._discard((item,))
+        return item
+
+    def remove(self, item):
+        self.pop(self.index(item))
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            list.__delitem__(self, i)
+            for index in self._indexes.values():
+                index.rebuild()
+        else:
+            self.pop(i)
+
+    def __setitem__(self, i, item):
+        old = self[i]
+        list.__setitem__(self, i, item)
+        for index in self._indexes.values():
+            if not isinstance(i, slice) and index._key(old) == index._key(item):
+                group = index._groups.get(index._key(item))
+                if group is not None:
+                    for j, other in enumerate(group):
+                        if other is old:
+                            group[j] = item
+                            break
+                    continue
+            index.rebuild()
+
+    def clear(self):
+        list.clear(self)
+        for index in self._indexes.values():
+            index.rebuild()
+
+    insert = _rebuilding('insert')
+    sort = _rebuilding('sort')
+    reverse = _rebuilding('reverse')
+    __imul__ = _rebuilding('__imul__')
+
+    def __reduce_ex__(self, protocol):
+        # copies and pickles are plain Lists, without the indexes
+        return type(self).__bases__[1], (list(self),)
+
+
+def indexed_class(cls):
+    """The subclass of a List class used once a List has an index."""
+    if issubclass(cls, _Indexed):
+        return cls
+    result = _indexed_classes.get(cls)
+    if result is None:
+        result = type(cls.__name__, (_Indexed, cls), {
+            '__slots__': (), '__module__': cls.__module__, '__qualname__': cls.__qualname__,
+        })
+        result = _indexed_classes.setdefault(cls, result)
+    return result
@@ -0,0 +1,127 @@
+"""
+Opt-in timing of the phases of `Dict.load` and `Dict.dump`.
+
+>>> from addicty import instrument
+>>> instrument.enable()
+>>> config = Dict.load("config.yaml")
+>>> instrument.stats()["load.parse"]
+{'calls': 1, 'seconds': 0.0123, 'bytes': 4096, 'nodes': 0}
+
+The phases are:
+
+- load.read: reading the file (only timed separately from parsing when
+  instrumentation or linting is enabled; otherwise the file is streamed into
+  the parser and reading is counted in load.parse).
+- load.lint: checking the file with `yaml_check`.
+- load.parse: parsing the YAML into plain Python objects.
+- load.include: resolving `!include` tags.
+- load.hook: converting the plain objects into Dicts and Lists.
+- load.freeze: freezing the result.
+- dump.to_dict: converting a Dict or List into plain Python objects.
+- dump.emit: emitting the YAML text.
+- dump.write: writing the YAML to a file or S3.
+
+When instrumentation is disabled (the default), each phase only costs calls
+to `start` and `stop` that return at once, and nodes are not counted.
+"""
+
+import threading
+import time
+
+enabled = False
+
+_callbacks = []
+_stats = {}
+_lock = threading.Lock()
+
+
+def enable(callback=None, logger=None):
+    """
+    Start recording timings.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Called as `callback(phase, seconds, nbytes, nodes)` after each phase.
+    logger : logging.Logger, optional
+        If given, each phase is also logged at DEBUG level.
+    """
+    global enabled
+    with _lock:
+        if callback is not None:
+            _callbacks.append(callback)
+        if logger is not None:
+            _callbacks.append(
+                lambda phase, seconds, nbytes, nodes: logger.debug(
+                    "addicty %s: %.6f s, %d bytes, %d nodes",
+                    phase, seconds, nbytes, nodes,
+                )
+            )
+        enabled = True
+
+
+def disable():
+    """Stop recording timings, and remove all callbacks."""
+    global enabled
+    with _lock:
+        enabled = False
+        _callbacks.clear()
+
+
+def reset():
+    """Forget all the timings recorded so far."""
+    with _lock:
+        _stats.clear()
+
+
+def stats():
+    """
+    The totals recorded for each phase.
+
+    Returns
+    -------
+    dict
+        Maps each phase name to a dict of `calls`, `seconds`, `bytes` and
+        `nodes`.
+    """
+    with _lock:
+        return {phase: dict(totals) for phase, totals in _stats.items()}
+
+
+def start():
+    """Start timing a phase; returns None when instrumentation is disabled."""
+    if enabled:
+        return time.perf_counter()
+
+
+def stop(phase, started, nbytes=0, nodes=0):
+    """Finish timing a phase started with `start`."""
+    if started is None:
+        return
+    seconds = time.perf_counter() - started
+    with _lock:
+        totals = _stats.get(phase)
+        if totals is None:
+            totals = _stats[phase] = {'calls': 0, 'seconds': 0.0, 'bytes': 0, 'nodes': 0}
+        totals['calls'] += 1
+        totals['seconds'] += seconds
+        totals['bytes'] += nbytes
+        totals['nodes'] += nodes
+        callbacks = list(_callbacks)
+    for callback in callbacks:
+        callback(phase, seconds, nbytes, nodes)
+
+
+def count_nodes(x):
+    """Count the mappings and sequences in a tree of plain or addicty objects."""
+    count = 0
+    stack = [x]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, dict):
+            count += 1
+            stack.extend(x.values())
+        elif isinstance(x, (list, tuple)):
+            count += 1
+            stack.extend(x)
+    return count
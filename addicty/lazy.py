@@ -0,0 +1,264 @@
+"""
+Values computed on first access, and then kept.
+
+A `Lazy` stored in a Dict is evaluated the first time its key is read, by
+item or attribute access or `get`, and the result replaces it in the Dict.
+Each Lazy is evaluated once, even when several threads read it at the same
+time; if evaluation raises, the next read tries again.
+
+In YAML, a value tagged `!lazy` names a resolver registered with `register`
+and (optionally) the argument to call it with::
+
+    zones: !lazy
+      read_csv: data/zones.csv
+    today: !lazy today
+
+Only registered resolvers can be named, so loading a file never calls
+arbitrary code.
+
+Only a Dict holding a Lazy as a direct value evaluates it on access: Lazy
+values inside Lists are left as they are, and iterating over `values()` or
+`items()`, `addicty.query.search`, `addicty.paths.walk` and `flatten` see
+the Lazy itself.  `to_dict`, `dump` and `adump` evaluate them all (those
+in Lists too), or with ``lazy='keep'`` leave them as they are.  Copies and pickles keep them as
+they are, and schemas skip them.
+"""
+
+import functools
+import threading
+
+resolvers = {}
+
+# set once any Lazy is made, so that Dicts built before never look for them
+created = False
+
+_pending = object()
+_no_argument = object()
+
+_lazy_classes = {}
+
+
+def register(name, func=None):
+    """
+    Register a resolver that `!lazy` tags can name.
+
+    Use as ``register("read_csv", read_csv)``, or as a decorator with
+    ``@register("read_csv")``.  The resolver is called with the argument
+    given in the YAML, or with none.
+    """
+    if func is None:
+        return lambda func: register(name, func)
+    resolvers[name] = func
+    return func
+
+
+class Lazy(object):
+    """
+    A value computed by `func(*args, **kwargs)` when it is first needed.
+
+    Parameters
+    ----------
+    func : callable
+    *args, **kwargs
+        The arguments to call it with.
+    """
+
+    __slots__ = ('func', 'args', 'kwargs', 'tag', '_lock', '_value')
+
+    def __init__(self, func, *args, **kwargs):
+        global created
+        created = True
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        # (resolver name, argument) if made by a `!lazy` tag
+        self.tag = None
+        self._lock = threading.Lock()
+        self._value = _pending
+
+    @classmethod
+    def from_tag(cls, name, argument=_no_argument):
+        """A Lazy calling the resolver registered as `name`."""
+        try:
+            func = resolvers[name]
+        except KeyError:
+            raise ValueError(f"no resolver is registered for !lazy {name!r}") from None
+        result = cls(func) if argument is _no_argument else cls(func, argument)
+        result.tag = (name, argument)
+        return result
+
+    @property
+    def evaluated(self):
+        """Whether the value has been computed."""
+        return self._value is not _pending
+
+    def resolve(self, hook=None):
+        """
+        The value, computed on the first call.
+
+        If given, `hook` converts the computed value before it is kept.
+        """
+        value = self._value
+        if value is _pending:
+            with self._lock:
+                value = self._value
+                if value is _pending:
+                    value = self.func(*self.args, **self.kwargs)
+                    if hook is not None:
+                        value = hook(value)
+                    self._value = value
+        return value
+
+    def __eq__(self, other):
+        # by value once computed, or else by what would compute it, so that
+        # loading the same `!lazy` tag twice gives equal Dicts
+        if type(other) is not Lazy:
+            return self._value == other if self.evaluated else NotImplemented
+        if self.evaluated and other.evaluated:
+            return self._value == other._value
+        if self.tag is not None or other.tag is not None:
+            return self.tag == other.tag
+        return (self.func, self.args, self.kwargs) == (other.func, other.args, other.kwargs)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # a computed Lazy pickles as its value, another one as its call
+        if self.evaluated:
+            return _identity, (self._value,)
+        if self.tag is not None:
+            # resolvers are looked up by name again, as when loading
+            name, argument = self.tag
+            return Lazy.from_tag, (name,) if argument is _no_argument else (name, argument)
+        return _rebuild, (self.func, self.args, self.kwargs)
+
+    def __deepcopy__(self, memo):
+        import copy
+        if self.evaluated:
+            return copy.deepcopy(self._value, memo)
+        other = Lazy(self.func, *self.args, **self.kwargs)
+        other.tag = self.tag
+        return other
+
+    def __repr__(self):
+        if self.tag is not None:
+            return f"Lazy(!lazy {self.tag[0]})"
+        return f"Lazy({getattr(self.func, '__qualname__', self.func)!r})"
+
+
+def _new(cls):
+    return cls.__new__(cls)
+
+
+def _identity(value):
+    return value
+
+
+def _rebuild(func, args, kwargs):
+    return Lazy(func, *args, **kwargs)
+
+
+class _WithLazy(object):
+    """Item access of a Dict holding Lazy values, evaluating them."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is Lazy:
+            value = self._resolve(key, value)
+        return value
+
+    def get(self, key, default=None):
+        value = dict.get(self, key, _pending)
+        if value is _pending:
+            return default
+        if type(value) is Lazy:
+            value = self._resolve(key, value)
+        return value
+
+    def _resolve(self, key, lazy):
+        cls = plain_class(type(self))
+        frozen = self._Dict__frozen
+
+        def hook(value):
+            value = cls._hook(value)
+            if frozen and isinstance(value, (cls, cls._Sequence)):
+                value.freeze()
+            return value
+        value = lazy.resolve(hook)
+        # keep the value in place of the Lazy, unless the key was set since
+        if dict.get(self, key) is lazy:
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __reduce_ex__(self, protocol):
+        # copies and pickles are made as the plain class, with the items and
+        # Lazy values as they are; __setstate__ swaps the class again
+        return _new, (plain_class(type(self)),), self.__getstate__(), None, iter(dict.items(self))
+
+
+def lazy_class(cls):
+    """The subclass of a Dict class used once a Dict holds a Lazy value."""
+    if issubclass(cls, _WithLazy):
+        return cls
+    result = _lazy_classes.get(cls)
+    if result is None:
+        result = type(cls.__name__, (_WithLazy, cls), {
+            '__slots__': (), '__module__': cls.__module__, '__qualname__': cls.__qualname__,
+        })
+        result = _lazy_classes.setdefault(cls, result)
+    return result
+
+
+def plain_class(cls):
+    """The Dict class that `lazy_class` made `cls` from, or `cls` itself."""
+    return cls.__bases__[1] if issubclass(cls, _WithLazy) else cls
+
+
+def holds_lazy(values):
+    """Whether any of `values` is a Lazy."""
+    return created and any(type(value) is Lazy for value in values)
+
+
+def construct(loader, node):
+    """The YAML constructor of the `!lazy` tag."""
+    import yaml
+    if isinstance(node, yaml.ScalarNode):
+        name, argument = loader.construct_scalar(node), _no_argument
+    elif isinstance(node, yaml.MappingNode) and len(node.value) == 1:
+        (name, argument), = loader.construct_mapping(node, deep=True).items()
+    else:
+        raise yaml.constructor.ConstructorError(
+            None, None, "!lazy takes a resolver name, or a mapping of one resolver name to its argument",
+            node.start_mark,
+        )
+    try:
+        return Lazy.from_tag(name, argument)
+    except ValueError as err:
+        raise yaml.constructor.ConstructorError(None, None, str(err), node.start_mark) from None
+
+
+@functools.lru_cache(None)
+def dumper():
+    """A SafeDumper that writes the `!lazy` tags of unevaluated Lazy values."""
+    import yaml
+
+    class LazyDumper(yaml.SafeDumper):
+        pass
+
+    def represent(dumper, lazy):
+        if lazy.tag is None:
+            raise yaml.representer.RepresenterError(
+                f"cannot dump {lazy!r}, which was not made by a !lazy tag; use lazy='force'"
+            )
+        name, argument = lazy.tag
+        if argument is _no_argument:
+            return dumper.represent_scalar('!lazy', name)
+        return dumper.represent_mapping('!lazy', {name: argument})
+    LazyDumper.add_representer(Lazy, represent)
+    return LazyDumper
@@ -0,0 +1,211 @@
+"""
+Check many YAML files with yamllint in parallel.
+
+Run as ``python -m addicty.lint [options] FILE_OR_DIR ...``, or call
+`lint_files` from Python.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from . import compression
+from .yaml_checker import Format, default_config, lint_problems
+
+YAML_EXTENSIONS = ('.yaml', '.yml')
+
+
+def find_yaml_files(paths):
+    """Expand directories into the YAML files they contain, recursively."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(YAML_EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def _config_hash(config_file):
+    if config_file is None:
+        content = default_config.encode()
+    else:
+        with open(config_file, 'rb') as f:
+            content = f.read()
+    return hashlib.sha256(content).hexdigest()
+
+
+def _lint_worker(filepath, content, config_file):
+    return lint_problems(content, filepath, config_file)
+
+
+def _to_problem(record):
+    from yamllint.linter import LintProblem
+    line, column, level, desc, rule = record
+    problem = LintProblem(line, column, desc, rule)
+    problem.level = level
+    return problem
+
+
+def _to_record(problem):
+    return [problem.line, problem.column, problem.level, problem.desc, problem.rule]
+
+
+def lint_files(
+        filenames,
+        config_file=None,
+        max_workers=None,
+        executor="process",
+        cache_file=None,
+        encoding='utf-8',
+):
+    """
+    Check YAML files with yamllint, in parallel.
+
+    Parameters
+    ----------
+    filenames : Iterable[str]
+        The files to check.
+    config_file : str, optional
+        A yamllint config file, used instead of the default config of
+        `addicty.yaml_checker`.  Each worker compiles it only once.
+    max_workers : int, optional
+        The number of workers for a newly created pool.
+    executor : {'process', 'thread'} or concurrent.futures.Executor
+        Where to run the linter.  An existing executor is used without
+        shutting it down.
+    cache_file : str, optional
+        A JSON file holding the results of earlier runs, keyed by a hash of
+        each file's content.  Files that have not changed since then (under
+        the same config) are not linted again.  The cache file is updated.
+    encoding : str, default 'utf-8'
+        The encoding of the files.
+
+    Returns
+    -------
+    dict
+        The list of yamllint problems for each file, in order.
+    """
+    from concurrent.futures import (
+        Executor, ProcessPoolExecutor, ThreadPoolExecutor,
+    )
+    filenames = list(filenames)
+    config_hash = _config_hash(config_file)
+    cache = {}
+    if cache_file is not None and os.path.exists(cache_file):
+        with open(cache_file, 'r') as f:
+            stored = json.load(f)
+        if stored.get('config') == config_hash:
+            cache = stored.get('files', {})
+
+    results = {}
+    digests = {}
+    pending = []
+    for filename in filenames:
+        filepath = filename[2:] if filename.startswith('./') else filename
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        digests[filename] = digest
+        cached = cache.get(os.path.abspath(filepath))
+        if cached is not None and cached['sha256'] == digest:
+            results[filename] = [_to_problem(r) for r in cached['problems']]
+        else:
+            results[filename] = None
+            if compression.detect(filepath) is None:
+                text = raw.decode(encoding)
+            else:
+                with compression.open_text(filepath, 'r', encoding) as f:
+                    text = f.read()
+            pending.append((filename, filepath, text))
+
+    if pending:
+        if isinstance(executor, Executor):
+            pool = executor
+        elif executor == "process":
+            pool = ProcessPoolExecutor(max_workers)
+        elif executor == "thread":
+            pool = ThreadPoolExecutor(max_workers)
+        else:
+            raise ValueError(f"unknown executor {executor!r}")
+        try:
+            linted = pool.map(
+                _lint_worker,
+                [filepath for _, filepath, _ in pending],
+                [content for _, _, content in pending],
+                [config_file] * len(pending),
+                chunksize=16,
+            )
+            for (filename, _, _), problems in zip(pending, linted):
+                results[filename] = problems
+        finally:
+            if pool is not executor:
+                pool.shutdown()
+
+    if cache_file is not None:
+        for filename, problems in results.items():
+            filepath = filename[2:] if filename.startswith('./') else filename
+            cache[os.path.abspath(filepath)] = {
+                'sha256': digests[filename],
+                'problems': [_to_record(p) for p in problems],
+            }
+        with open(cache_file, 'w') as f:
+            json.dump({'config': config_hash, 'files': cache}, f)
+    return results
+
+
+def format_results(results, format='standard'):
+    """
+    Format the results of `lint_files` as lines of text.
+
+    `format` is the name of a `Format` method: 'parsable', 'standard' or
+    'standard_color'.
+    """
+    formatter = getattr(Format, format)
+    for filename, problems in results.items():
+        if not problems:
+            continue
+        if format != 'parsable':
+            yield filename
+        for problem in problems:
+            yield formatter(problem, filename)
+        if format != 'parsable':
+            yield ''
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m addicty.lint",
+        description="Check YAML files with yamllint, in parallel.",
+    )
+    parser.add_argument(
+        'paths', nargs='+', metavar='FILE_OR_DIR',
+        help="files to check, or directories to search for .yaml/.yml files",
+    )
+    parser.add_argument('-c', '--config-file', help="a yamllint config file")
+    parser.add_argument(
+        '-f', '--format', default='standard',
+        choices=['parsable', 'standard', 'standard_color'],
+    )
+    parser.add_argument('-j', '--jobs', type=int, help="the number of worker processes")
+    parser.add_argument('--cache', help="a cache file, to skip files unchanged since the last run")
+    args = parser.parse_args(argv)
+
+    results = lint_files(
+        find_yaml_files(args.paths),
+        config_file=args.config_file,
+        max_workers=args.jobs,
+        cache_file=args.cache,
+    )
+    for line in format_results(results, args.format):
+        print(line)
+    if any(p.level == 'error' for problems in results.values() for p in problems):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+The memory used by a Dict or List, broken down by subtree.
+"""
+
+import sys
+from .addict import Dict
+from .lazy import plain_class
+
+
+def memory_usage(obj, deep=True, depth=1):
+    """
+    Report the memory used by a Dict or List, broken down by subtree.
+
+    Objects referenced from more than one place are counted once, in the
+    first subtree (in iteration order) where they are found.  The size of
+    each node includes the state that Dicts keep on it (their parent, key
+    and frozen state, and any memoized results).
+
+    Parameters
+    ----------
+    obj : Dict or List
+    deep : bool, default True
+        Whether to count the keys and leaf values (strings, numbers and
+        other objects) as well as the Dicts, Lists and other containers.
+    depth : int, default 1
+        How many levels of subtrees to report separately.
+
+    Returns
+    -------
+    Dict
+        With the total `bytes` and `nodes` (containers and distinct leaf
+        values) and, down to `depth`, the same for each key's (or index's)
+        subtree under `children`.
+    """
+    dict_class = plain_class(type(obj)) if isinstance(obj, Dict) else Dict
+    return dict_class(_memory_usage(obj, depth, deep, set()))
+
+
+def _node_size(obj, seen, deep):
+    """
+    The size of a mapping or sequence itself, not counting its values.
+
+    This includes the state that Dicts keep on each node (their slots are
+    part of the size of the node itself) and, if `deep`, the keys.  Returns
+    (0, 0) if `obj` has already been counted.
+    """
+    if id(obj) in seen:
+        return 0, 0
+    seen.add(id(obj))
+    nbytes = sys.getsizeof(obj)
+    # reading __dict__ would make one on a Dict subclass that has none yet
+    attrs = obj._Dict__extra if isinstance(obj, Dict) else getattr(obj, '__dict__', None)
+    if attrs is not None and id(attrs) not in seen:
+        seen.add(id(attrs))
+        nbytes += sys.getsizeof(attrs)
+        if deep:
+            for name, value in attrs.items():
+                if not _is_singleton(value) and id(value) not in seen:
+                    seen.add(id(value))
+                    nbytes += sys.getsizeof(value)
+    if deep and isinstance(obj, dict):
+        for key in obj:
+            if id(key) not in seen:
+                seen.add(id(key))
+                nbytes += sys.getsizeof(key)
+    return nbytes, 1
+
+
+def _is_singleton(x):
+    return x is None or x is True or x is False
+
+
+def _subtree_size(obj, seen, deep):
+    nbytes = nodes = 0
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, (dict, list, tuple)):
+            b, n = _node_size(x, seen, deep)
+            if n:
+                nbytes += b
+                nodes += n
+                stack.extend(x.values() if isinstance(x, dict) else x)
+        elif not _is_singleton(x) and id(x) not in seen:
+            seen.add(id(x))
+            nodes += 1
+            if deep:
+                nbytes += sys.getsizeof(x)
+    return nbytes, nodes
+
+
+def _memory_usage(obj, depth, deep, seen):
+    if depth <= 0 or not isinstance(obj, (dict, list, tuple)):
+        nbytes, nodes = _subtree_size(obj, seen, deep)
+        return {'bytes': nbytes, 'nodes': nodes}
+    nbytes, nodes = _node_size(obj, seen, deep)
+    if not nodes:
+        # already counted elsewhere
+        return {'bytes': 0, 'nodes': 0}
+    children = {}
+    for key, value in (obj.items() if isinstance(obj, dict) else enumerate(obj)):
+        child = children[key] = _memory_usage(value, depth - 1, deep, seen)
+        nbytes += child['bytes']
+        nodes += child['nodes']
+    return {'bytes': nbytes, 'nodes': nodes, 'children': children}
@@ -0,0 +1,188 @@
+"""
+Compact storage for homogeneous numeric sequences.
+
+With ``numeric='array'`` (see `Dict.load`), a list holding only ints, or
+only ints and floats, becomes an `Array`: an `array.array` of 8-byte values
+instead of a list of boxed Python numbers.  With ``numeric='numpy'`` it
+becomes a `numpy.ndarray`, and nested lists of equal length become a single
+multi-dimensional array.  Other lists (including empty ones, and lists with
+bools, None or strings) are kept as `List`.
+"""
+
+import array
+
+MODES = (None, 'array', 'numpy')
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+class Array(array.array):
+    """
+    An `array.array` that can be frozen like a `Dict` or `List`.
+
+    Use `to_list` (or `tolist`) to get plain Python numbers back.
+    """
+
+    __slots__ = ('_frozen',)
+
+    def freeze(self, shouldFreeze=True):
+        self._frozen = shouldFreeze
+        return self
+
+    def _check(self):
+        if getattr(self, '_frozen', False):
+            raise TypeError("a frozen Array is read-only")
+
+    def __setitem__(self, index, value):
+        self._check()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self._check()
+        super().__delitem__(index)
+
+    def __iadd__(self, other):
+        self._check()
+        return super().__iadd__(other)
+
+    def __imul__(self, n):
+        self._check()
+        return super().__imul__(n)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple)):
+            return self.tolist() == list(other)
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __reduce_ex__(self, protocol):
+        return type(self), (self.typecode, self.tolist())
+
+    def __deepcopy__(self, memo):
+        return type(self)(self.typecode, self)
+
+    def _unspecialize(self):
+        return self.tolist()
+
+    to_list = _unspecialize
+
+    def __repr__(self):
+        return f"Array({self.typecode!r}, {self.tolist()!r})"
+
+
+def _mutator(name):
+    method = getattr(array.array, name)
+
+    def checked(self, *args):
+        self._check()
+        return method(self, *args)
+    checked.__name__ = name
+    checked.__doc__ = method.__doc__
+    return checked
+
+
+for _name in (
+        'append', 'byteswap', 'extend', 'frombytes', 'fromfile', 'fromlist',
+        'fromunicode', 'insert', 'pop', 'remove', 'reverse',
+):
+    setattr(Array, _name, _mutator(_name))
+
+
+# the array types that Dict and List freeze and convert back to lists
+ARRAY_TYPES = (Array,)
+
+
+def _register(cls):
+    global ARRAY_TYPES
+    if cls not in ARRAY_TYPES:
+        ARRAY_TYPES = ARRAY_TYPES + (cls,)
+
+
+def _typecode(item):
+    """'q' for int64 values, 'd' for ints and floats, or None."""
+    has_float = False
+    for v in item:
+        t = type(v)
+        if t is float:
+            has_float = True
+        elif t is not int:
+            return None
+    if has_float:
+        return 'd'
+    if _INT64_MIN <= min(item) and max(item) <= _INT64_MAX:
+        return 'q'
+    return None
+
+
+def convert(item, mode):
+    """
+    Convert a list to an array if it holds only numbers, else return None.
+    """
+    if not item:
+        return None
+    if mode == 'array':
+        typecode = _typecode(item)
+        if typecode is None:
+            return None
+        return Array(typecode, item)
+    if mode == 'numpy':
+        import numpy
+        _register(numpy.ndarray)
+        if all(type(v) is list for v in item):
+            rows = [convert(v, mode) for v in item]
+            if any(r is None for r in rows):
+                return None
+            shape, kind = rows[0].shape, rows[0].dtype.kind
+            if any(r.shape != shape for r in rows):
+                return None
+            if any(r.dtype.kind != kind for r in rows):
+                return numpy.stack(rows).astype(numpy.float64)
+            return numpy.stack(rows)
+        typecode = _typecode(item)
+        if typecode is None:
+            return None
+        return numpy.array(item, dtype=numpy.float64 if typecode == 'd' else numpy.int64)
+    raise ValueError(f"numeric must be one of {MODES}, not {mode!r}")
+
+
+def is_array(x):
+    """Whether `x` is an `Array`, or a NumPy array (once `convert` made one)."""
+    return isinstance(x, ARRAY_TYPES)
+
+
+def _is_numpy(x):
+    return isinstance(x, ARRAY_TYPES) and not isinstance(x, Array)
+
+
+def equal(a, b):
+    """
+    Whether two values are equal, comparing NumPy arrays as a whole.
+
+    ``==`` on a NumPy array compares element by element, so mappings and
+    lists holding NumPy arrays cannot be compared with it.  This compares
+    those arrays with `numpy.array_equal`, going down into mappings, lists
+    and tuples, and compares everything else with ``==``.
+    """
+    if isinstance(a, dict) and isinstance(b, dict):
+        if len(a) != len(b):
+            return False
+        return all(k in b and equal(v, dict.__getitem__(b, k)) for k, v in dict.items(a))
+    if (isinstance(a, list) and isinstance(b, list)) or (isinstance(a, tuple) and isinstance(b, tuple)):
+        return len(a) == len(b) and all(equal(x, y) for x, y in zip(a, b))
+    if _is_numpy(a) or _is_numpy(b):
+        import numpy
+        return bool(numpy.array_equal(a, b))
+    return bool(a == b)
+
+
+def freeze(x, shouldFreeze=True):
+    """Make an `Array` or NumPy array read-only (or writeable again)."""
+    if isinstance(x, Array) or not hasattr(x, 'flags'):
+        x.freeze(shouldFreeze)
+    else:
+        x.flags.writeable = shouldFreeze is False
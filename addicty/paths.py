@@ -0,0 +1,290 @@
+"""
+Walking, flattening and building Dicts by path.
+
+These are functions rather than Dict methods, so that a config can hold
+keys such as ``walk`` or ``set_many`` and still read them by attribute::
+
+    from addicty.paths import flatten, set_many, unflatten
+
+    flat = flatten(config)
+    config = unflatten(flat)
+    set_many(config, {"model.beta": 0.5})
+"""
+
+from collections.abc import Mapping
+
+from . import lazy as _lazy
+from .addict import Dict, _Missing, _materialize
+
+_absent = object()
+
+
+def walk(d, prune=None):
+    """
+    Iterate over every value in a Dict, at any depth.
+
+    Values are visited depth first, in key order, without recursion.
+    Each Dict or List is yielded before its contents, and items of
+    Lists get their index as key.  Don't change the tree while walking.
+
+    Parameters
+    ----------
+    d : Dict
+    prune : callable, optional
+        Called as `prune(path, value)` for each Dict or List; if it
+        returns True, the contents of that value are skipped.
+
+    Yields
+    ------
+    path : tuple
+        The keys leading to the value.
+    value : Any
+    """
+    stack = [((), iter(dict.items(d)))]
+    while stack:
+        path, items = stack[-1]
+        for key, value in items:
+            child = path + (key,)
+            yield child, value
+            if isinstance(value, dict):
+                contents = dict.items(value)
+            elif isinstance(value, list):
+                contents = enumerate(value)
+            else:
+                continue
+            if prune is None or not prune(child, value):
+                stack.append((child, iter(contents)))
+                break
+        else:
+            stack.pop()
+
+
+def flatten(d, sep='.', lists=False):
+    """
+    Convert a Dict to a flat dict of leaf values.
+
+    Parameters
+    ----------
+    d : Dict
+    sep : str or None, default '.'
+        Joins the keys of each path (converted with `str`) into the key
+        of the flat dict.  If None, the keys are tuples of keys instead.
+    lists : bool, default False
+        Whether to flatten Lists too, with their indexes as keys.  By
+        default Lists are leaf values.
+
+    Returns
+    -------
+    dict
+        The leaf values (not copied), in the order of `walk`.  Empty
+        Dicts are kept as leaves.  See `unflatten` for the reverse.
+    """
+    result = {}
+    containers = (dict, list) if lists else dict
+    stack = [(() if sep is None else '', iter(dict.items(d)))]
+    while stack:
+        head, items = stack[-1]
+        for key, value in items:
+            if sep is None:
+                name = head + (key,)
+            elif isinstance(key, str):
+                name = head + key
+            else:
+                name = head + str(key)
+            if isinstance(value, containers) and value:
+                contents = enumerate(value) if isinstance(value, list) else dict.items(value)
+                stack.append((name if sep is None else name + sep, iter(contents)))
+                break
+            result[name] = value
+        else:
+            stack.pop()
+    return result
+
+
+def unflatten(mapping, sep='.', dict_class=Dict):
+    """
+    Build a Dict from a flat mapping of paths to values.
+
+    The reverse of `flatten`: each key is split on `sep`, unless it is
+    a tuple of keys already.  Values are converted as in the Dict
+    constructor.  Lists flattened with `lists=True` come back as Dicts
+    keyed by the (string) indexes.
+
+    Parameters
+    ----------
+    mapping : Mapping
+    sep : str or None, default '.'
+    dict_class : type, default Dict
+        The class of the Dict to build.
+
+    Returns
+    -------
+    Dict
+
+    Raises
+    ------
+    ValueError
+        If a path runs through a value that is not a mapping.
+    """
+    result = dict_class()
+    _set_paths(result, mapping.items(), sep)
+    return result
+
+
+def set_many(d, mapping, sep='.'):
+    """
+    Set many values in a Dict at once, by path.
+
+    Each key of `mapping` (or each path of an iterable of (path, value)
+    pairs) is split on `sep`, unless it is a tuple of keys already, so
+    ``set_many(d, {"a.b.c": 1})`` does what ``d.a.b.c = 1`` does.  The
+    Dicts along the paths are created and put in place directly, without
+    the placeholders and parent wiring of chained attribute writes, and
+    paths grouped by their parent (as from `flatten`) share the walk to
+    it.  Values are converted as in the Dict constructor.
+
+    A frozen Dict in the tree accepts new values only for keys it
+    already has, as with item assignment.  A missing key read from an
+    unfrozen Dict (``set_many(d.new, ...)``) is put in its parent once a
+    value is set in it, as with chained attribute writes.
+
+    Parameters
+    ----------
+    d : Dict
+    mapping : Mapping or iterable of (path, value) pairs
+    sep : str or None, default '.'
+
+    Returns
+    -------
+    Dict
+        The Dict the values were set in.
+
+    Raises
+    ------
+    KeyError
+        If a path adds a key to a frozen Dict.  Paths before it have
+        been set.
+    ValueError
+        If a path runs through a value that is not a mapping.
+    """
+    if type(d) is _Missing:
+        d = _materialize(d)
+    items = mapping.items() if isinstance(mapping, Mapping) else mapping
+    _set_paths(d, items, sep)
+    return d
+
+
+def builder(sep='.', freeze=False, dict_class=Dict):
+    """
+    A context manager that builds a new Dict from paths, in one pass.
+
+    Values set on the builder by path are collected, and the tree is
+    built with `set_many` when the block ends without an error::
+
+        with builder() as build:
+            for name, value in rows:
+                build[f"zones.{name}.value"] = value
+        zones = build.result.zones
+
+    Parameters
+    ----------
+    sep : str, default '.'
+        The separator of the keys in the paths.
+    freeze : bool, default False
+        Freeze the result once it is built.
+    dict_class : type, default Dict
+        The class of the Dict to build.
+
+    Returns
+    -------
+    Builder
+    """
+    return Builder(dict_class(), sep, freeze)
+
+
+class Builder(object):
+    """
+    Collects values by path, to build a Dict in one pass.
+
+    Made by `builder`; set values with ``build[path] = value`` or `set`,
+    inside a ``with`` block.  The tree is built when the block ends
+    without an error, and is then the `result`.  Nothing is built if the
+    block raises.
+    """
+
+    def __init__(self, result, sep='.', freeze=False):
+        self.result = result
+        self.sep = sep
+        self.freeze = freeze
+        self._items = []
+
+    def set(self, path, value):
+        """Set the value at `path` once the tree is built."""
+        self._items.append((path, value))
+
+    __setitem__ = set
+
+    def __len__(self):
+        return len(self._items)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        items, self._items = self._items, []
+        if exc_type is None:
+            set_many(self.result, items, self.sep)
+            if self.freeze:
+                self.result.freeze()
+        return False
+
+
+def _guarded(node):
+    # whether writes to node must go through Dict.__setitem__: frozen or
+    # tracked Dicts, and autovivified ones not yet put in their parent
+    if not isinstance(node, Dict):
+        return False
+    return (
+        node._Dict__frozen
+        or node._Dict__tracker is not None
+        or node._Dict__parent is not None
+    )
+
+
+def _set_paths(root, items, sep):
+    # build the tree directly, without placeholders or parent wiring;
+    # frozen or tracked Dicts are written through __setitem__ instead
+    cls = _lazy.plain_class(type(root))
+    last_parent, last_node, guarded = None, root, _guarded(root)
+    for path, value in items:
+        if isinstance(path, tuple):
+            parent, key = path[:-1], path[-1]
+        elif sep is None:
+            parent, key = (), path
+        else:
+            parent, _, key = path.rpartition(sep)
+            if not _:
+                parent = ()
+        if parent == last_parent:
+            # paths often come grouped by their parent, as from flatten
+            node = last_node
+        else:
+            node = root
+            for k in (parent.split(sep) if isinstance(parent, str) else parent):
+                child = dict.get(node, k, _absent)
+                if child is _absent:
+                    child = cls()
+                    if _guarded(node):
+                        node[k] = child
+                    else:
+                        dict.__setitem__(node, k, child)
+                elif not isinstance(child, dict):
+                    raise ValueError(f"cannot set {path!r}, {k!r} is not a mapping")
+                node = child
+            last_parent, last_node, guarded = parent, node, _guarded(node)
+        if isinstance(value, (dict, list, tuple)):
+            value = cls._hook(value)
+        if guarded or type(value) is _lazy.Lazy:
+            node[key] = value
+        else:
+            dict.__setitem__(node, key, value)
@@ -0,0 +1,471 @@
+"""
+Queries over trees of Dicts and Lists, in a subset of JMESPath.
+
+>>> search("coefficients[?enabled].beta", config)
+[0.5, 1.25]
+
+Supported are fields (``a.b``, ``"quoted key"``), indexes and slices
+(``[0]``, ``[-1]``, ``[1:3]``), wildcard projections over lists (``[*]``)
+and over the values of mappings (``*``), flattening (``[]``), filters
+(``[?expr]`` with ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``&&``,
+``||``, ``!`` and parentheses), multiselect lists (``[a, b]``) and hashes
+(``{x: a, y: b}``), pipes (``|``), the current node (``@``) and literals
+(```` `1` ````, ``'raw string'``, or a bare integer).  Functions are not
+supported.  Unlike JMESPath, a filter applied to a mapping filters its
+values, so ``coefficients[?enabled]`` works on a mapping of coefficients.
+
+A missing key gives None, as in JMESPath, and never creates Dicts.
+"""
+
+import functools
+from . import columnar as _columnar
+from . import numeric as _numeric
+
+# bumped whenever a frozen Dict changes, to invalidate memoized results
+epoch = 0
+
+
+def invalidate():
+    """Forget the memoized query results of all frozen Dicts."""
+    global epoch
+    epoch += 1
+
+
+class QueryError(ValueError):
+    """Raised for an expression that cannot be parsed."""
+
+
+_TOKENS = r"""
+    (?P<ws>\s+)
+  | (?P<number>-?\d+)
+  | (?P<identifier>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<quoted>"(?:\\.|[^"\\])*")
+  | (?P<raw>'(?:\\.|[^'\\])*')
+  | (?P<literal>`(?:\\.|[^`\\])*`)
+  | (?P<op>\[\?|\[\]|\|\||&&|==|!=|<=|>=|[.*\[\]{}(),:|!<>@])
+"""
+
+_OPS = {
+    '[?': 'filter', '[]': 'flatten', '||': 'or', '&&': 'and',
+    '==': 'eq', '!=': 'ne', '<=': 'lte', '>=': 'gte', '<': 'lt', '>': 'gt',
+    '.': 'dot', '*': 'star', '[': 'lbracket', ']': 'rbracket',
+    '{': 'lbrace', '}': 'rbrace', '(': 'lparen', ')': 'rparen',
+    ',': 'comma', ':': 'colon', '|': 'pipe', '!': 'not', '@': 'current',
+}
+
+# binding powers, as in the JMESPath reference parser
+_BP = {
+    'eof': 0, 'identifier': 0, 'quoted': 0, 'raw': 0, 'literal': 0,
+    'number': 0, 'current': 0, 'rbracket': 0, 'rparen': 0, 'comma': 0,
+    'rbrace': 0, 'colon': 0, 'pipe': 1, 'or': 2, 'and': 3, 'eq': 5,
+    'ne': 5, 'lt': 5, 'gt': 5, 'lte': 5, 'gte': 5, 'flatten': 9,
+    'star': 20, 'filter': 21, 'dot': 40, 'not': 45, 'lbrace': 50,
+    'lbracket': 55, 'lparen': 60,
+}
+_PROJECTION_STOP = 10
+_COMPARATORS = ('eq', 'ne', 'lt', 'gt', 'lte', 'gte')
+
+
+@functools.lru_cache(None)
+def _token_pattern():
+    # compiled on first use, so that importing addicty does not import re
+    import re
+    return re.compile(_TOKENS, re.VERBOSE)
+
+
+def _tokenize(expression):
+    import json
+    pattern = _token_pattern()
+    tokens = []
+    pos = 0
+    while pos < len(expression):
+        match = pattern.match(expression, pos)
+        if match is None:
+            raise QueryError(f"unexpected {expression[pos]!r} at {pos} in {expression!r}")
+        kind = match.lastgroup
+        text = match.group()
+        if kind == 'op':
+            tokens.append((_OPS[text], text))
+        elif kind == 'number':
+            tokens.append((kind, int(text)))
+        elif kind == 'quoted':
+            tokens.append((kind, json.loads(text)))
+        elif kind == 'raw':
+            tokens.append((kind, text[1:-1].replace("\\'", "'")))
+        elif kind == 'literal':
+            try:
+                tokens.append((kind, json.loads(text[1:-1].replace("\\`", "`"))))
+            except ValueError:
+                raise QueryError(f"bad literal {text} in {expression!r}") from None
+        elif kind != 'ws':
+            tokens.append((kind, text))
+        pos = match.end()
+    tokens.append(('eof', None))
+    return tokens
+
+
+class _Parser(object):
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.pos = 0
+
+    def parse(self):
+        result = self._expression()
+        if self._peek() != 'eof':
+            self._error()
+        return result
+
+    def _peek(self, offset=0):
+        return self.tokens[self.pos + offset][0]
+
+    def _advance(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _match(self, kind):
+        if self._peek() != kind:
+            self._error()
+        return self._advance()
+
+    def _error(self):
+        kind, value = self.tokens[self.pos]
+        found = "end of expression" if kind == 'eof' else repr(value)
+        raise QueryError(f"unexpected {found} in {self.expression!r}")
+
+    def _expression(self, bp=0):
+        left = self._nud(self._advance())
+        while bp < _BP[self._peek()]:
+            left = self._led(self._advance(), left)
+        return left
+
+    def _nud(self, token):
+        kind, value = token
+        if kind in ('identifier', 'quoted'):
+            return ('field', value)
+        if kind in ('raw', 'literal', 'number'):
+            return ('literal', value)
+        if kind == 'current':
+            return ('current',)
+        if kind == 'star':
+            return ('values', ('current',), self._projection_rhs(_BP['star']))
+        if kind == 'filter':
+            return self._led(token, ('current',))
+        if kind == 'flatten':
+            return ('project', ('flatten', ('current',)), self._projection_rhs(_BP['flatten']))
+        if kind == 'not':
+            return ('not', self._expression(_BP['not']))
+        if kind == 'lparen':
+            result = self._expression()
+            self._match('rparen')
+            return result
+        if kind == 'lbrace':
+            return self._multi_hash()
+        if kind == 'lbracket':
+            if self._peek() in ('number', 'colon'):
+                return self._index_or_slice(('current',))
+            if self._peek() == 'star' and self._peek(1) == 'rbracket':
+                self.pos += 2
+                return ('project', ('current',), self._projection_rhs(_BP['star']))
+            return self._multi_list()
+        self.pos -= 1
+        self._error()
+
+    def _led(self, token, left):
+        kind = token[0]
+        if kind == 'dot':
+            return ('sub', left, self._dot_rhs(_BP['dot']))
+        if kind == 'pipe':
+            return ('pipe', left, self._expression(_BP['pipe']))
+        if kind in ('or', 'and'):
+            return (kind, left, self._expression(_BP[kind]))
+        if kind in _COMPARATORS:
+            return ('compare', kind, left, self._expression(_BP[kind]))
+        if kind == 'flatten':
+            return ('project', ('flatten', left), self._projection_rhs(_BP['flatten']))
+        if kind == 'filter':
+            condition = self._expression()
+            self._match('rbracket')
+            return ('filter', left, condition, self._projection_rhs(_BP['filter']))
+        if kind == 'lbracket':
+            if self._peek() in ('number', 'colon'):
+                return self._index_or_slice(left)
+            self._match('star')
+            self._match('rbracket')
+            return ('project', left, self._projection_rhs(_BP['star']))
+        self.pos -= 1
+        self._error()
+
+    def _index_or_slice(self, left):
+        parts = [None, None, None]
+        i = 0
+        while self._peek() != 'rbracket':
+            if self._peek() == 'colon':
+                i += 1
+                if i > 2:
+                    self._error()
+                self._advance()
+            else:
+                parts[i] = self._match('number')[1]
+        self._advance()
+        if i == 0:
+            return ('sub', left, ('index', parts[0]))
+        return ('project', ('sub', left, ('slice', *parts)), self._projection_rhs(_BP['star']))
+
+    def _projection_rhs(self, bp):
+        kind = self._peek()
+        if _BP[kind] < _PROJECTION_STOP:
+            return ('current',)
+        if kind in ('lbracket', 'filter'):
+            return self._expression(bp)
+        if kind == 'dot':
+            self._advance()
+            return self._dot_rhs(bp)
+        self._error()
+
+    def _dot_rhs(self, bp):
+        kind = self._peek()
+        if kind in ('identifier', 'quoted', 'star'):
+            return self._expression(bp)
+        if kind == 'lbracket':
+            self._advance()
+            return self._multi_list()
+        if kind == 'lbrace':
+            self._advance()
+            return self._multi_hash()
+        self._error()
+
+    def _multi_list(self):
+        items = [self._expression()]
+        while self._peek() == 'comma':
+            self._advance()
+            items.append(self._expression())
+        self._match('rbracket')
+        return ('multi_list', items)
+
+    def _multi_hash(self):
+        pairs = []
+        while True:
+            kind, key = self._advance()
+            if kind not in ('identifier', 'quoted'):
+                self.pos -= 1
+                self._error()
+            self._match('colon')
+            pairs.append((key, self._expression()))
+            if self._peek() == 'rbrace':
+                self._advance()
+                return ('multi_hash', pairs)
+            self._match('comma')
+
+
+def _is_list(x):
+    return isinstance(x, (list, tuple, _columnar.ColumnarList)) or isinstance(x, _numeric.ARRAY_TYPES)
+
+
+def _truthy(x):
+    # as in JMESPath, empty strings and containers are false, but 0 is true
+    if x is None or x is False:
+        return False
+    if isinstance(x, (str, dict)) or _is_list(x):
+        return len(x) > 0
+    return True
+
+
+def _is_number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+_COMPARE = {
+    'eq': lambda a, b: a == b,
+    'ne': lambda a, b: a != b,
+    'lt': lambda a, b: a < b,
+    'gt': lambda a, b: a > b,
+    'lte': lambda a, b: a <= b,
+    'gte': lambda a, b: a >= b,
+}
+
+
+def _build(node):
+    """Turn a parsed expression into a function of the current value."""
+    kind = node[0]
+    if kind == 'current':
+        return lambda x: x
+    if kind == 'literal':
+        value = node[1]
+        return lambda x: value
+    if kind == 'field':
+        name = node[1]
+        # dict.get does not call Dict.__missing__, so nothing is created
+        return lambda x: dict.get(x, name) if isinstance(x, dict) else None
+    if kind == 'index':
+        i = node[1]
+
+        def index(x):
+            if _is_list(x) and -len(x) <= i < len(x):
+                return x[i]
+            return None
+        return index
+    if kind == 'slice':
+        s = slice(*node[1:])
+        return lambda x: list(x[s]) if _is_list(x) else None
+    if kind == 'sub':
+        left, right = _build(node[1]), _build(node[2])
+
+        def sub(x):
+            x = left(x)
+            return None if x is None else right(x)
+        return sub
+    if kind == 'pipe':
+        left, right = _build(node[1]), _build(node[2])
+        return lambda x: right(left(x))
+    if kind == 'project':
+        left, right = _build(node[1]), _build(node[2])
+
+        def project(x):
+            x = left(x)
+            if not _is_list(x):
+                return None
+            return [v for v in map(right, x) if v is not None]
+        return project
+    if kind == 'values':
+        left, right = _build(node[1]), _build(node[2])
+
+        def values(x):
+            x = left(x)
+            if not isinstance(x, dict):
+                return None
+            return [v for v in map(right, dict.values(x)) if v is not None]
+        return values
+    if kind == 'flatten':
+        left = _build(node[1])
+
+        def flatten(x):
+            x = left(x)
+            if not _is_list(x):
+                return None
+            result = []
+            for v in x:
+                if _is_list(v):
+                    result.extend(v)
+                else:
+                    result.append(v)
+            return result
+        return flatten
+    if kind == 'filter':
+        left, condition, right = _build(node[1]), _build(node[2]), _build(node[3])
+
+        def filter_(x):
+            x = left(x)
+            if isinstance(x, dict):
+                x = dict.values(x)
+            elif not _is_list(x):
+                return None
+            return [
+                v for v in (right(v) for v in x if _truthy(condition(v)))
+                if v is not None
+            ]
+        return filter_
+    if kind == 'compare':
+        op = _COMPARE[node[1]]
+        ordered = node[1] not in ('eq', 'ne')
+        left, right = _build(node[2]), _build(node[3])
+
+        def compare(x):
+            a, b = left(x), right(x)
+            if ordered and not (_is_number(a) and _is_number(b)):
+                return None
+            return op(a, b)
+        return compare
+    if kind == 'and':
+        left, right = _build(node[1]), _build(node[2])
+
+        def and_(x):
+            a = left(x)
+            return right(x) if _truthy(a) else a
+        return and_
+    if kind == 'or':
+        left, right = _build(node[1]), _build(node[2])
+
+        def or_(x):
+            a = left(x)
+            return a if _truthy(a) else right(x)
+        return or_
+    if kind == 'not':
+        operand = _build(node[1])
+        return lambda x: not _truthy(operand(x))
+    if kind == 'multi_list':
+        items = [_build(item) for item in node[1]]
+        return lambda x: None if x is None else [item(x) for item in items]
+    if kind == 'multi_hash':
+        pairs = [(key, _build(value)) for key, value in node[1]]
+        return lambda x: None if x is None else {key: value(x) for key, value in pairs}
+    raise AssertionError(kind)
+
+
+class Query(object):
+    """A compiled query expression; use `compile` to get a cached one."""
+
+    __slots__ = ('expression', '_search')
+
+    def __init__(self, expression):
+        self.expression = expression
+        self._search = _build(_Parser(expression).parse())
+
+    def search(self, data):
+        """Evaluate the query on a tree of Dicts and Lists (or plain ones)."""
+        return self._search(data)
+
+    def __repr__(self):
+        return f"Query({self.expression!r})"
+
+
+@functools.lru_cache(maxsize=512)
+def compile(expression):
+    """
+    Parse a query expression, or get it from the cache of recent ones.
+
+    Raises
+    ------
+    QueryError
+        If the expression cannot be parsed.
+    """
+    return Query(expression)
+
+
+def search(expression, data):
+    """
+    Evaluate a query expression on `data`, a tree of Dicts and Lists.
+
+    Each expression is parsed once and cached.  On a frozen Dict the
+    results are also memoized, until a frozen Dict is changed or
+    (un)frozen anywhere.
+
+    Changes not seen by the memo, which therefore should not be made to a
+    frozen tree, are in-place changes to its Lists and changes to a part
+    of it that was unfrozen on its own.
+
+    Returns
+    -------
+    Any
+        The result, or None if the expression matches nothing.
+    """
+    compiled = compile(expression)
+    # only a Dict has the slot, and only a frozen one memoizes
+    if not getattr(data, '_Dict__frozen', False):
+        return compiled.search(data)
+    extra = data._extra()
+    memo = extra.get('queries')
+    if memo is None or memo[0] != epoch:
+        memo = extra['queries'] = (epoch, {})
+    try:
+        result = memo[1][expression]
+    except KeyError:
+        result = memo[1][expression] = compiled.search(data)
+    # lists and dicts made by the query may be changed by the caller
+    if type(result) is list:
+        return list(result)
+    if type(result) is dict:
+        return dict(result)
+    return result
@@ -0,0 +1,162 @@
+import keyword
+from . import numeric
+from .lazy import Lazy
+
+_classes = {}
+
+
+class Record(object):
+    """
+    A read-only, slotted copy of a frozen Dict, made by `compile`.
+
+    Each distinct set of keys gets its own Record subclass, with a slot per
+    key, so reading a value is a plain attribute access.  Records also
+    support item access, iteration over keys, `to_dict` and `dump`.
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    __delattr__ = __setattr__
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def get(self, key, default=None):
+        if key in self._fields:
+            return getattr(self, key)
+        return default
+
+    def keys(self):
+        return list(self._fields)
+
+    def values(self):
+        return [getattr(self, k) for k in self._fields]
+
+    def items(self):
+        return [(k, getattr(self, k)) for k in self._fields]
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def to_dict(self):
+        return {k: _unspecialize(getattr(self, k)) for k in self._fields}
+
+    def dump(self, *args, **kwargs):
+        from .addict import Dict, _dump_yaml
+        target = args[0] if len(args) and isinstance(args[0], str) else None
+        return _dump_yaml(self.to_dict(), target, **Dict._dump_kwargs(kwargs))
+
+    def __repr__(self):
+        return self.dump(explicit_start=True, explicit_end=True).rstrip("\n")
+
+
+class RecordList(tuple):
+    """A read-only copy of a List, made by `compile`."""
+
+    __slots__ = ()
+
+    def to_list(self):
+        return [_unspecialize(v) for v in self]
+
+
+_RESERVED = frozenset(dir(Record))
+
+
+def _unspecialize(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, RecordList):
+        return value.to_list()
+    if hasattr(value, '_unspecialize'):
+        return value._unspecialize()
+    if isinstance(value, numeric.ARRAY_TYPES):
+        return value.tolist()
+    return value
+
+
+def record_class(fields):
+    """Get the Record subclass for a tuple of keys, creating it if needed."""
+    cls = _classes.get(fields)
+    if cls is None:
+        cls = type('Record', (Record,), {'__slots__': fields, '_fields': fields})
+        cls = _classes.setdefault(fields, cls)
+    return cls
+
+
+def _compilable(keys):
+    return all(
+        isinstance(k, str) and k.isidentifier() and not keyword.iskeyword(k)
+        and not k.startswith('_') and k not in _RESERVED
+        for k in keys
+    )
+
+
+def compile(d):
+    """
+    Make a read-only copy of a frozen Dict for fast attribute access.
+
+    Each mapping in the tree becomes an instance of a slotted record
+    class, generated for (and shared by) each distinct set of keys, and
+    each List becomes a `RecordList` (a tuple).  Reading an attribute of a
+    record is as fast as for any plain object, several times faster than
+    through `Dict.__getattr__`.  Records still offer item access, `to_dict`
+    and `dump`.  A mapping whose keys are not all valid attribute names (or
+    clash with record methods) is kept as a Dict, with its subtree.
+
+    Returns
+    -------
+    Record
+
+    Raises
+    ------
+    ValueError
+        If `d` is not a frozen Dict.
+    """
+    from .addict import Dict
+    if not (isinstance(d, Dict) and d._Dict__frozen):
+        raise ValueError("only a frozen Dict can be compiled")
+    return compile_value(d)
+
+
+def compile_value(value):
+    """
+    Convert a tree of Dicts and Lists into Records and RecordLists.
+
+    A mapping whose keys cannot all be attribute names is left as it is,
+    with its whole subtree.  Lazy values are computed, in Lists too.
+    """
+    if type(value) is Lazy:
+        from .addict import Dict
+        value = value.resolve(Dict._hook)
+    if isinstance(value, dict):
+        fields = tuple(value)
+        if not _compilable(fields):
+            return value
+        cls = record_class(fields)
+        result = object.__new__(cls)
+        for k in fields:
+            # item access, which computes the Lazy values of a Dict
+            object.__setattr__(result, k, compile_value(value[k]))
+        return result
+    if isinstance(value, list):
+        return RecordList(compile_value(v) for v in value)
+    return value
@@ -1,37 +1,100 @@
-
 import gzip
 import io
-import yaml
+import threading
 from .addict import Dict
 
-try:
-    import boto3
-except ImportError:
-    boto3 = None
-    client = None
-else:
-    client = boto3.client('s3')
+# A client (or session) assigned here is used instead of the default one,
+# e.g. to point at a local S3 stand-in during tests.
+client = None
+session = None
+max_pool_connections = 10
 
+_local = threading.local()
+_lock = threading.Lock()
+_unset = object()
 
-def to_s3(d, bucket, key, **kwargs):
-    global client, boto3
-    if boto3 is None:
-        raise ModuleNotFoundError("boto3")
-    assert isinstance(d, Dict)
-    payload = io.BytesIO(gzip.compress(d.dump(**kwargs).encode()))
-    payload.seek(0)
-    client.upload_fileobj(payload, bucket, key)
 
+def configure(client=_unset, session=_unset, max_pool_connections=_unset):
+    """
+    Set the client, session or connection pool size used for S3 access.
+
+    Only the arguments that are given are changed; pass None to go back to
+    the default behavior.
+
+    Parameters
+    ----------
+    client : botocore client, optional
+        A ready-made S3 client, shared by all threads.  When given, no
+        client is ever created by addicty.
+    session : boto3.session.Session, optional
+        A session from which per-thread clients are created.
+    max_pool_connections : int, optional
+        The connection pool size of clients created by addicty.
+    """
+    g = globals()
+    if client is not _unset:
+        g['client'] = client
+    if session is not _unset:
+        g['session'] = session
+    if max_pool_connections is not _unset:
+        g['max_pool_connections'] = max_pool_connections
+
+
+def get_client():
+    """
+    Get the S3 client for the calling thread.
+
+    Clients are created on first use, and cached per thread and per
+    configuration, as boto3 sessions are not safe to share across threads.
+    """
+    if client is not None:
+        return client
+    clients = _local.__dict__.setdefault('clients', {})
+    cache_key = (session, max_pool_connections)
+    result = clients.get(cache_key)
+    if result is None:
+        # imported here, as importing boto3 takes a good fraction of a second
+        import boto3
+        from botocore.config import Config
+        config = Config(max_pool_connections=max_pool_connections)
+        if session is None:
+            result = boto3.session.Session().client('s3', config=config)
+        else:
+            with _lock:
+                result = session.client('s3', config=config)
+        clients[cache_key] = result
+    return result
 
-def from_s3(cls, bucket, key, freeze=False, loader=yaml.SafeLoader):
-    global client, boto3
-    if boto3 is None:
-        raise ModuleNotFoundError("boto3")
+
+def read_s3(bucket, key, client=None):
+    """Download and decompress an object, returning its content as bytes."""
+    if client is None:
+        client = get_client()
     with io.BytesIO() as data:
         client.download_fileobj(bucket, key, data)
-        content = gzip.decompress(data.getvalue())
-        result = cls(yaml.load(content, Loader=loader))
-        if freeze:
-            result.freeze(True)
-        return result
+        return gzip.decompress(data.getvalue())
+
+
+def write_s3(content, bucket, key, client=None):
+    """Compress and upload bytes as an object."""
+    if client is None:
+        client = get_client()
+    payload = io.BytesIO(gzip.compress(content))
+    payload.seek(0)
+    client.upload_fileobj(payload, bucket, key)
+
+
+def to_s3(d, bucket, key, client=None, **kwargs):
+    assert isinstance(d, Dict)
+    write_s3(d.dump(**kwargs).encode(), bucket, key, client=client)
+
 
+def from_s3(cls, bucket, key, freeze=False, loader=None, client=None):
+    import yaml
+    if loader is None:
+        loader = yaml.SafeLoader
+    content = read_s3(bucket, key, client=client)
+    result = cls(yaml.load(content, Loader=loader))
+    if freeze:
+        result.freeze(True)
+    return result
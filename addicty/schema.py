@@ -0,0 +1,384 @@
+import json
+import numbers
+import re
+import threading
+from . import numeric
+from .columnar import ColumnarList
+from .lazy import Lazy
+
+
+def _is_sequence(x):
+    return isinstance(x, (list, tuple, ColumnarList)) or isinstance(x, numeric.ARRAY_TYPES)
+
+
+_TYPES = {
+    'object': lambda x: isinstance(x, dict),
+    'array': _is_sequence,
+    'string': lambda x: isinstance(x, str),
+    # NumPy scalars are not int or float, but are registered as numbers
+    'integer': lambda x: isinstance(x, numbers.Integral) and not isinstance(x, bool),
+    'number': lambda x: isinstance(x, numbers.Real) and not isinstance(x, bool),
+    'boolean': lambda x: isinstance(x, bool),
+    'null': lambda x: x is None,
+}
+
+_validators = {}
+_validators_lock = threading.Lock()
+
+
+class ValidationError(ValueError):
+    """
+    Raised when a Dict does not match a schema.
+
+    The `errors` attribute is a list of (path, message) tuples, where each
+    path is a tuple of keys.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("\n".join(
+            f"{format_path(path)}: {message}" for path, message in errors
+        ))
+
+
+def format_path(path):
+    return ".".join(str(k) for k in path) or "<root>"
+
+
+class _Node(object):
+    """A compiled (sub)schema."""
+
+    def __init__(self, schema):
+        if schema is True or schema == {}:
+            schema = {}
+        elif schema is False:
+            schema = {'not': {}}
+        self.checks = []
+        self.properties = {}
+        self.additional = None
+        self.items = None
+        self.combined = []
+        self.required = tuple(schema.get('required', ()))
+        if 'type' in schema:
+            names = schema['type']
+            names = [names] if isinstance(names, str) else list(names)
+            tests = [_TYPES[name] for name in names]
+            expected = " or ".join(names)
+            self._add(
+                lambda x: any(t(x) for t in tests),
+                lambda x: f"expected {expected}, got {type(x).__name__}",
+            )
+        if 'enum' in schema:
+            options = list(schema['enum'])
+            self._add(lambda x: x in options, lambda x: f"{x!r} is not one of {options!r}")
+        if 'const' in schema:
+            const = schema['const']
+            self._add(lambda x: x == const, lambda x: f"{x!r} is not {const!r}")
+        for keyword, compare, text in (
+                ('minimum', lambda x, b: x >= b, "less than"),
+                ('maximum', lambda x, b: x <= b, "greater than"),
+                ('exclusiveMinimum', lambda x, b: x > b, "less than or equal to"),
+                ('exclusiveMaximum', lambda x, b: x < b, "greater than or equal to"),
+        ):
+            if keyword in schema:
+                self._add_number(schema[keyword], compare, text)
+        for keyword, compare, kind, text in (
+                ('minLength', lambda n, b: n >= b, _TYPES['string'], "shorter than"),
+                ('maxLength', lambda n, b: n <= b, _TYPES['string'], "longer than"),
+                ('minItems', lambda n, b: n >= b, _is_sequence, "fewer items than"),
+                ('maxItems', lambda n, b: n <= b, _is_sequence, "more items than"),
+                ('minProperties', lambda n, b: n >= b, _TYPES['object'], "fewer keys than"),
+                ('maxProperties', lambda n, b: n <= b, _TYPES['object'], "more keys than"),
+        ):
+            if keyword in schema:
+                self._add_length(schema[keyword], compare, kind, text)
+        if 'pattern' in schema:
+            regex = re.compile(schema['pattern'])
+            self._add(
+                lambda x: not isinstance(x, str) or regex.search(x),
+                lambda x: f"{x!r} does not match {regex.pattern!r}",
+            )
+        if self.required:
+            required = self.required
+            self._add(
+                lambda x: not isinstance(x, dict) or all(k in x for k in required),
+                lambda x: "missing required keys " + ", ".join(
+                    repr(k) for k in required if k not in x
+                ),
+            )
+        for key, subschema in schema.get('properties', {}).items():
+            self.properties[key] = _Node(subschema)
+        additional = schema.get('additionalProperties', True)
+        if additional is False:
+            allowed = set(self.properties)
+            self._add(
+                lambda x: not isinstance(x, dict) or all(k in allowed for k in x),
+                lambda x: "unexpected keys " + ", ".join(
+                    repr(k) for k in x if k not in allowed
+                ),
+            )
+        elif additional is not True:
+            self.additional = _Node(additional)
+        if 'items' in schema:
+            self.items = _Node(schema['items'])
+        for keyword in ('allOf', 'anyOf', 'oneOf'):
+            if keyword in schema:
+                self.combined.append((keyword, [_Node(s) for s in schema[keyword]]))
+        if 'not' in schema:
+            self.combined.append(('not', [_Node(schema['not'])]))
+
+    def _add(self, test, describe):
+        self.checks.append((test, describe))
+
+    def _add_number(self, bound, compare, text):
+        self._add(
+            lambda x: not _TYPES['number'](x) or compare(x, bound),
+            lambda x: f"{x!r} is {text} {bound!r}",
+        )
+
+    def _add_length(self, bound, compare, kind, text):
+        self._add(
+            lambda x: not kind(x) or compare(len(x), bound),
+            lambda x: f"has {text} {bound!r}",
+        )
+
+    def child(self, key):
+        """The node for a value under `key`, or None if not just one applies."""
+        if self.combined:
+            return None
+        if isinstance(key, int) and self.items is not None:
+            return self.items
+        node = self.properties.get(key)
+        if node is None:
+            node = self.additional
+        return node or _ANY
+
+    def check_node(self, value, path, errors):
+        """Check `value` itself, without the values it contains."""
+        if type(value) is Lazy:
+            # not computed yet, so there is nothing to check
+            return
+        for test, describe in self.checks:
+            if not test(value):
+                errors.append((path, describe(value)))
+        for keyword, nodes in self.combined:
+            passed = sum(not n.errors(value, path) for n in nodes)
+            if keyword == 'allOf' and passed < len(nodes):
+                for n in nodes:
+                    errors.extend(n.errors(value, path))
+            elif keyword == 'anyOf' and not passed:
+                errors.append((path, "does not match any of the allowed schemas"))
+            elif keyword == 'oneOf' and passed != 1:
+                errors.append((path, f"matches {passed} of the schemas, instead of one"))
+            elif keyword == 'not' and passed:
+                errors.append((path, "matches a schema that is not allowed"))
+
+    def check(self, value, path, errors):
+        """Check `value` and everything it contains."""
+        if type(value) is Lazy:
+            return
+        self.check_node(value, path, errors)
+        if isinstance(value, dict):
+            if self.properties or self.additional is not None:
+                for key, v in value.items():
+                    node = self.properties.get(key, self.additional)
+                    if node is not None:
+                        node.check(v, path + (key,), errors)
+        elif self.items is not None and _is_sequence(value):
+            for i, v in enumerate(value):
+                self.items.check(v, path + (i,), errors)
+
+    def errors(self, value, path=()):
+        errors = []
+        self.check(value, path, errors)
+        return errors
+
+
+_ANY = _Node({})
+
+
+class Validator(object):
+    """
+    A schema, compiled for validating Dicts and Lists directly.
+
+    The schema is a dict in the style of JSON Schema, supporting the
+    keywords type, enum, const, minimum, maximum, exclusiveMinimum,
+    exclusiveMaximum, minLength, maxLength, pattern, minItems, maxItems,
+    minProperties, maxProperties, required, properties,
+    additionalProperties, items, allOf, anyOf, oneOf and not.  Other
+    keywords are ignored.  Use `compile_schema` to get a cached instance.
+
+    Lazy values (see `addicty.lazy`) that have not been computed yet are
+    skipped, rather than evaluated: validating a loaded file never runs its
+    resolvers.
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.root = _Node(schema)
+
+    def errors(self, value):
+        """List the (path, message) problems with `value`."""
+        return self.root.errors(value)
+
+    def validate(self, value):
+        """Raise a ValidationError if `value` does not match the schema."""
+        errors = self.errors(value)
+        if errors:
+            raise ValidationError(errors)
+
+    def errors_at(self, root, paths):
+        """
+        List the problems at some paths of `root`, which was valid before.
+
+        Each path names a key that was set or deleted: the mapping holding it
+        is checked itself (e.g. for required keys), together with the whole
+        value now under the key.
+        """
+        errors = []
+        for path in set(paths):
+            node, value, depth = self.root, root, 0
+            # go down to the mapping holding the last key of the path
+            while depth < len(path) - 1:
+                child = node.child(path[depth])
+                if child is None:
+                    break
+                value = _get(value, path[depth])
+                node = child
+                depth += 1
+            if value is _absent:
+                # an ancestor was removed or replaced, and its path covers this
+                continue
+            prefix = tuple(path[:depth])
+            key = path[-1]
+            child = node.child(key) if depth == len(path) - 1 else None
+            if child is None:
+                # the schema can't be split here, so check the whole value
+                node.check(value, prefix, errors)
+                continue
+            node.check_node(value, prefix, errors)
+            v = _get(value, key)
+            if v is not _absent:
+                child.check(v, tuple(path), errors)
+        # a problem may be found twice, from a path and from its ancestor
+        return list(dict.fromkeys(errors))
+
+
+_absent = object()
+
+
+def _get(value, key):
+    if isinstance(value, dict):
+        return dict.get(value, key, _absent)
+    if _is_sequence(value) and isinstance(key, int) and -len(value) <= key < len(value):
+        return value[key]
+    return _absent
+
+
+def _track(value, dirty, path):
+    """Have each Dict under `value` record the keys set on it in `dirty`."""
+    from .addict import Dict
+    stack = [(value, path)]
+    while stack:
+        value, path = stack.pop()
+        if isinstance(value, Dict):
+            object.__setattr__(value, '_Dict__tracker', (dirty, path))
+            stack.extend((v, path + (k,)) for k, v in dict.items(value))
+        elif isinstance(value, list):
+            stack.extend((v, path + (i,)) for i, v in enumerate(value))
+
+
+def validate(d, schema, track=False):
+    """
+    Check a Dict against a schema.
+
+    The schema is compiled once (see `compile_schema`) and checks the Dict
+    and List nodes directly, without converting them with `to_dict`.
+
+    Parameters
+    ----------
+    d : Dict
+    schema : dict or Validator
+        A schema in the style of JSON Schema.
+    track : bool, default False
+        Whether to record the keys set or deleted in `d` from now on, so
+        that `revalidate` can check only those paths.
+
+    Returns
+    -------
+    Dict
+        `d` itself.
+
+    Raises
+    ------
+    ValidationError
+        If the Dict does not match the schema.  Tracking starts anyway.
+    """
+    if not isinstance(schema, Validator):
+        schema = compile_schema(schema)
+    errors = schema.errors(d)
+    if track:
+        dirty = set()
+        _track(d, dirty, ())
+        d._extra()['validation'] = (schema, dirty)
+    if errors:
+        raise ValidationError(errors)
+    return d
+
+
+def revalidate(d):
+    """
+    Check again only the paths changed since `validate(d, ..., track=True)`.
+
+    Each key set or deleted (with `del`) on a Dict in the tree is recorded,
+    and its mapping and new value are checked.  Changes made inside a List
+    in place (e.g. by `append`) are not recorded; assign the List again, or
+    call `validate` instead.
+
+    Returns
+    -------
+    Dict
+        `d` itself.
+
+    Raises
+    ------
+    ValidationError
+        If a changed path does not match the schema.
+    ValueError
+        If changes to `d` are not being tracked.
+    """
+    state = d._extra().get('validation')
+    if state is None:
+        raise ValueError("call validate(d, schema, track=True) first")
+    validator, dirty = state
+    paths = list(dirty)
+    dirty.clear()
+    errors = validator.errors_at(d, paths)
+    for path in paths:
+        # values set since the last check are tracked from now on
+        value = d
+        for key in path:
+            value = _get(value, key)
+        if value is not _absent:
+            _track(value, dirty, path)
+    if errors:
+        raise ValidationError(errors)
+    return d
+
+
+def compile_schema(schema):
+    """
+    Get the Validator for a schema, compiling it only the first time.
+
+    Validators are cached by the JSON text of the schema.
+    """
+    if hasattr(schema, 'to_dict'):
+        schema = schema.to_dict()
+    key = json.dumps(schema, sort_keys=True, default=repr)
+    with _validators_lock:
+        validator = _validators.get(key)
+    if validator is None:
+        validator = Validator(schema)
+        with _validators_lock:
+            validator = _validators.setdefault(key, validator)
+    return validator
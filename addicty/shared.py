@@ -0,0 +1,126 @@
+import contextlib
+import copy
+import threading
+from .addict import Dict
+from .lazy import plain_class
+
+
+def _nothing():
+    pass
+
+
+class SharedConfig(object):
+    """
+    A Dict shared between threads, updated by read-copy-update.
+
+    Readers take the current `snapshot`, a frozen Dict, without any lock:
+    it is never changed once published, so a reader sees one consistent
+    version for as long as it holds on to it.  Writers work on a copy (see
+    `edit`) and publish it with a single assignment, so readers see either
+    the old or the new version, never a half-applied update.  Writers are
+    serialized by a lock, so no update is lost.
+
+    Publishing is one attribute assignment, which is atomic on
+    free-threaded builds of Python as well.  As with any frozen Dict, the
+    Lists in a snapshot can still be changed in place, and should not be.
+
+    Parameters
+    ----------
+    initial : Mapping, optional
+        The first content.  It is copied, so later changes to it do not
+        reach the snapshots.
+    dict_class : type, optional
+        The class of the snapshots.  Defaults to the class of `initial`
+        if it is a Dict, and to Dict otherwise.
+    """
+
+    def __init__(self, initial=None, dict_class=None):
+        if dict_class is None:
+            dict_class = plain_class(type(initial)) if isinstance(initial, Dict) else Dict
+        self.dict_class = dict_class
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._version = 0
+        self._snapshot = self._frozen_copy({} if initial is None else initial)
+
+    def _frozen_copy(self, content):
+        if isinstance(content, self.dict_class):
+            result = copy.deepcopy(content)
+        else:
+            result = self.dict_class(content)
+        return result.freeze()
+
+    @property
+    def snapshot(self):
+        """The current content, as a frozen Dict."""
+        return self._snapshot
+
+    @property
+    def version(self):
+        """The number of versions published after the first one."""
+        return self._version
+
+    def subscribe(self, callback):
+        """
+        Call `callback(changed_paths, snapshot)` after each change.
+
+        `changed_paths` is a list of key tuples, as from
+        `addicty.watch.changed_paths`.  Returns the callback, so this can
+        also be used as a decorator.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers.remove(callback)
+
+    @contextlib.contextmanager
+    def edit(self):
+        """
+        Change the content, in a ``with`` block.
+
+        Yields an unfrozen copy of the current snapshot, which is frozen
+        and published when the block ends without an error, and dropped if
+        it raises.  Other writers wait for the block to end (so blocks must
+        not be nested); readers do not.
+        """
+        with self._lock:
+            draft = copy.deepcopy(self._snapshot)
+            yield draft
+            notify = self._publish(draft.freeze())
+        notify()
+
+    def publish(self, content):
+        """
+        Replace the content.
+
+        A frozen copy of `content` becomes the new snapshot.
+        """
+        new = self._frozen_copy(content)
+        with self._lock:
+            notify = self._publish(new)
+        notify()
+
+    def update(self, *args, **kwargs):
+        """Update the content as with `Dict.update`, and publish it."""
+        with self.edit() as draft:
+            draft.update(*args, **kwargs)
+
+    def _publish(self, new):
+        # called with the lock held; returns what to call once it is released
+        old = self._snapshot
+        self._snapshot = new
+        self._version += 1
+        subscribers = list(self._subscribers)
+        if not subscribers:
+            return _nothing
+        from .watch import changed_paths
+        changes = changed_paths(old, new)
+
+        def notify():
+            if changes:
+                for callback in subscribers:
+                    callback(changes, new)
+        return notify
@@ -0,0 +1,165 @@
+import logging
+import os
+import threading
+from . import numeric
+from .addict import Dict
+from .include import IncludeCache, local_signature as file_signature
+
+logger = logging.getLogger(__name__)
+
+_absent = object()
+
+
+def changed_paths(old, new):
+    """
+    List the key paths at which two nested mappings differ.
+
+    Each path is a tuple of keys.  Mappings are compared key by key, and any
+    other values (including lists and arrays) are compared as a whole.
+    """
+    changes = []
+    stack = [((), old, new)]
+    while stack:
+        path, a, b = stack.pop()
+        if isinstance(a, dict) and isinstance(b, dict):
+            # Lazy values are compared as they are, without computing them
+            for key, value in dict.items(a):
+                stack.append((path + (key,), value, dict.get(b, key, _absent)))
+            for key in b:
+                if key not in a:
+                    changes.append(path + (key,))
+        elif not numeric.equal(a, b):
+            changes.append(path)
+    return changes
+
+
+class WatchedConfig(object):
+    """
+    A YAML file that is reloaded when it changes.
+
+    The file is only re-parsed when its modification time, size or inode
+    change, and a cheap `os.stat` call is all that a `check` costs otherwise.
+    Files brought in with `!include` are watched too, and only the files
+    that changed are parsed again.
+    The loaded content is always a frozen Dict; a reload replaces it with a
+    new one in a single assignment, so readers see either the old or the new
+    version, never a mix.
+
+    Parameters
+    ----------
+    filename : str
+        The YAML file to watch.
+    dict_class : type, default Dict
+        The class used to load the file.
+    **load_kwargs
+        Other arguments passed to `Dict.load`.
+    """
+
+    def __init__(self, filename, dict_class=Dict, **load_kwargs):
+        load_kwargs['freeze'] = True
+        self.filename = filename
+        self.dict_class = dict_class
+        self._load_kwargs = load_kwargs
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._thread = None
+        self._stopping = threading.Event()
+        self._includes = IncludeCache()
+        load_kwargs['include_cache'] = self._includes
+        self._snapshot = dict_class.load(filename, **load_kwargs)
+        self._signature = self._graph_signature()
+
+    @property
+    def snapshot(self):
+        """The current content, as a frozen Dict."""
+        return self._snapshot
+
+    def subscribe(self, callback):
+        """
+        Call `callback(changed_paths, snapshot)` after each change.
+
+        `changed_paths` is a list of key tuples, as from `changed_paths`.
+        Returns the callback, so this can also be used as a decorator.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers.remove(callback)
+
+    def check(self):
+        """
+        Reload the file if it has changed.
+
+        Returns
+        -------
+        list
+            The key paths that changed, empty if nothing did.
+        """
+        with self._lock:
+            try:
+                signature = self._graph_signature()
+            except FileNotFoundError:
+                # the watched file may be in the middle of being replaced
+                return []
+            if signature == self._signature:
+                return []
+            # Remember the signature even if loading fails, so a broken file
+            # is reported once rather than on every check.
+            self._signature = signature
+            new = self.dict_class.load(self.filename, **self._load_kwargs)
+            changes = changed_paths(self._snapshot, new)
+            if not changes:
+                return []
+            self._snapshot = new
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            callback(changes, new)
+        return changes
+
+    def _graph_signature(self):
+        root = os.path.abspath(self.filename)
+        signature = []
+        for source in sorted(self._includes.dependencies(root)):
+            try:
+                signature.append((source, file_signature(source)))
+            except FileNotFoundError:
+                if source == root:
+                    raise
+                # a deleted include is a change, which loading again reports
+                signature.append((source, None))
+        return signature
+
+    def start(self, interval=2.0):
+        """Check for changes every `interval` seconds, in a daemon thread."""
+        if self._thread is not None:
+            raise RuntimeError("already started")
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._poll, args=(interval,), daemon=True,
+            name=f"addicty-watch-{self.filename}",
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the thread started by `start`."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+
+    def _poll(self, interval):
+        while not self._stopping.wait(interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("failed to reload %s", self.filename)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -1,3 +1,15 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from . import compression
+
+_configs = {}
+_problems = OrderedDict()
+_problems_lock = threading.Lock()
+_PROBLEMS_CACHE_SIZE = 1024
+_executor = None
+
 default_config = """---
 
 rules:
@@ -95,18 +107,87 @@ class Format(object):
         return line
 
 
-def yaml_check(file, config_file=None, logger=None, encoding='utf-8'):
+def _log_function(logger):
     if logger is None:
-        log = print
-    else:
-        try:
-            log = logger.error
-        except:
-            log = logger
+        return print
+    try:
+        return logger.error
+    except:
+        return logger
+
+
+def lint_config(config_file=None):
+    """
+    Get a compiled YamlLintConfig, from a file or else the default config.
+
+    Compiled configs are cached, and a config file is only read again when
+    it changes.
+    """
+    from yamllint.config import YamlLintConfig
+    key = _config_key(config_file)
+    conf = _configs.get(key)
+    if conf is None:
+        if config_file is None:
+            conf = YamlLintConfig(content=default_config)
+        else:
+            conf = YamlLintConfig(file=config_file)
+        _configs[key] = conf
+    return conf
+
+
+def _config_key(config_file):
+    # a config file is known by its path and when it was last changed
+    if config_file is None:
+        return None
+    return (os.path.abspath(config_file), os.stat(config_file).st_mtime_ns)
+
+
+def lint_problems(content, filepath, config_file=None):
+    """
+    Lint YAML text, returning a list of yamllint problems.
+
+    Results are cached by a hash of the content, the path (rules may
+    ignore some paths) and the version of the config file, so linting the
+    same file again (e.g. reloading it unchanged) is nearly free.
+    """
+    from yamllint import linter
+    conf = lint_config(config_file)
+    if conf.is_file_ignored(filepath):
+        return []
+    key = (hashlib.sha256(content.encode()).digest(), filepath, _config_key(config_file))
+    with _problems_lock:
+        problems = _problems.get(key)
+        if problems is not None:
+            _problems.move_to_end(key)
+            return problems
+    problems = list(linter.run(content, conf, filepath))
+    with _problems_lock:
+        _problems[key] = problems
+        while len(_problems) > _PROBLEMS_CACHE_SIZE:
+            _problems.popitem(last=False)
+    return problems
+
+
+def yaml_check(file, config_file=None, logger=None, encoding='utf-8', content=None):
+    """
+    Check a YAML file with yamllint, logging any problems found.
+
+    Parameters
+    ----------
+    file : str
+        The name of the file to check.
+    config_file : str, optional
+        A yamllint config file, used instead of the default config.
+    logger : logging.Logger or callable, optional
+        Where the problems are reported, defaulting to `print`.
+    encoding : str, default 'utf-8'
+        The encoding of the file.
+    content : str, optional
+        The content of the file, if it has already been read.
+    """
+    log = _log_function(logger)
 
     try:
-        from yamllint import linter
-        from yamllint.config import YamlLintConfig
         from yamllint.linter import PROBLEM_LEVELS
     except ImportError:
         log("yamllint is not installed, cannot inspect yaml file for formatting quality")
@@ -114,24 +195,36 @@ def yaml_check(file, config_file=None, logger=None, encoding='utf-8'):
 
         filepath = file[2:] if file.startswith('./') else file
 
-        if config_file is not None:
-            conf = YamlLintConfig(file=config_file)
-        else:
-            conf = YamlLintConfig(content=default_config)
+        if content is None:
+            with compression.open_text(filepath, 'r', encoding) as f:
+                content = f.read()
 
         first = True
         any_errors = False
         max_level = 0
-        with open(filepath, 'r', encoding=encoding) as f:
-            for problem in linter.run(f, conf, filepath):
-                if first:
-                    log(f"FOUND YAML ERRORS IN {file}")
-                    first = False
-                    any_errors = True
+        for problem in lint_problems(content, filepath, config_file):
+            if first:
+                log(f"FOUND YAML ERRORS IN {file}")
+                first = False
+                any_errors = True
+
+            log(Format.standard(problem, file))
+
+            max_level = max(max_level, PROBLEM_LEVELS[problem.level])
+
+        if any_errors:
+            log(f"END OF YAML ERRORS IN {file}")
 
-                log(Format.standard(problem, file))
 
-                max_level = max(max_level, PROBLEM_LEVELS[problem.level])
+def yaml_check_background(file, config_file=None, logger=None, encoding='utf-8', content=None):
+    """
+    Run `yaml_check` in a background thread.
 
-            if any_errors:
-                log(f"END OF YAML ERRORS IN {file}")
+    Returns a `concurrent.futures.Future`.
+    """
+    global _executor
+    with _problems_lock:
+        if _executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _executor = ThreadPoolExecutor(1, thread_name_prefix="addicty-lint")
+    return _executor.submit(yaml_check, file, config_file, logger, encoding, content)
@@ -0,0 +1,69 @@
+import tracemalloc
+
+import pytest
+
+from addicty import Dict
+
+# (depth, width): every node below the top has `width` children, and the
+# leaves are a mix of numbers, strings and short lists.
+SHAPES = {
+    'small': (3, 4),
+    'wide': (2, 40),
+    'deep': (10, 2),
+    'large': (3, 12),
+}
+
+
+def make_config(depth, width):
+    """Generate a plain nested dict of the given depth and width."""
+    def build(level):
+        if level == depth:
+            return {
+                'value': level * width,
+                'name': f"leaf-{level}",
+                'ratio': 0.5,
+                'values': list(range(5)),
+            }
+        return {f"key_{i}": build(level + 1) for i in range(width)}
+    return build(0)
+
+
+@pytest.fixture(params=sorted(SHAPES))
+def shape(request):
+    return SHAPES[request.param]
+
+
+@pytest.fixture
+def leaf_path(shape):
+    """The keys leading to one of the leaf values of `config`."""
+    depth, width = shape
+    return ["key_0"] * depth + ['value']
+
+
+@pytest.fixture
+def config(shape):
+    return make_config(*shape)
+
+
+@pytest.fixture
+def frozen(config):
+    return Dict(config).freeze()
+
+
+@pytest.fixture
+def track_memory(benchmark):
+    """
+    Record the peak memory of one extra call in the benchmark's extra_info.
+
+    Use as `track_memory(func, *args)` after (or instead of) timing the call.
+    """
+    def track(func, *args, **kwargs):
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info['peak_memory_bytes'] = peak
+        return peak
+    return track
@@ -0,0 +1,40 @@
+import pytest
+
+from addicty import Dict
+from addicty.paths import builder, set_many
+
+
+@pytest.fixture(params=[1000, 100000])
+def paths(request):
+    # three levels, with 100 leaves under each parent
+    return [(f"a{i // 10000}", f"b{i // 100 % 100}", f"c{i % 100}") for i in range(request.param)]
+
+
+def test_chained_writes(benchmark, paths):
+    def build():
+        d = Dict()
+        for a, b, c in paths:
+            d[a][b][c] = 1
+        return d
+    benchmark(build)
+
+
+def test_set_many(benchmark, paths):
+    mapping = {".".join(path): 1 for path in paths}
+    benchmark(lambda: set_many(Dict(), mapping))
+
+
+def test_set_many_tuples(benchmark, paths):
+    items = [(path, 1) for path in paths]
+    benchmark(lambda: set_many(Dict(), items))
+
+
+def test_builder(benchmark, paths):
+    dotted = [".".join(path) for path in paths]
+
+    def build():
+        with builder() as build:
+            for path in dotted:
+                build[path] = 1
+        return build.result
+    benchmark(build)
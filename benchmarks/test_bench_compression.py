@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+from addicty import Dict
+
+EXTENSIONS = ['', '.gz', '.bz2', '.xz']
+
+
+@pytest.fixture(params=EXTENSIONS, ids=lambda ext: ext or 'plain')
+def extension(request):
+    return request.param
+
+
+def test_dump_compressed(benchmark, tmp_path, frozen, extension):
+    counter = iter(range(10 ** 9))
+
+    def dump():
+        filename = os.path.join(tmp_path, f"dump{next(counter)}.yaml{extension}")
+        frozen.dump(filename)
+        return filename
+    filename = benchmark(dump)
+    benchmark.extra_info['bytes'] = os.path.getsize(filename)
+
+
+def test_load_compressed(benchmark, tmp_path, frozen, extension):
+    filename = os.path.join(tmp_path, f"config.yaml{extension}")
+    frozen.dump(filename)
+    benchmark.extra_info['bytes'] = os.path.getsize(filename)
+    benchmark(Dict.load, filename)
@@ -0,0 +1,106 @@
+import copy
+import pickle
+
+from addicty import Dict
+
+
+def test_construct(benchmark, config, track_memory):
+    benchmark(Dict, config)
+    track_memory(Dict, config)
+
+
+def test_attribute_read(benchmark, frozen, shape, leaf_path):
+    depth, width = shape
+    path = leaf_path
+
+    def read():
+        node = frozen
+        for key in path:
+            node = getattr(node, key)
+        return node
+    assert benchmark(read) == depth * width
+
+
+def test_item_read(benchmark, frozen, shape, leaf_path):
+    depth, width = shape
+    path = leaf_path
+
+    def read():
+        node = frozen
+        for key in path:
+            node = node[key]
+        return node
+    assert benchmark(read) == depth * width
+
+
+def test_missing_read(benchmark):
+    d = Dict()
+
+    def read():
+        return bool(d.optional.feature.enabled)
+    assert benchmark(read) is False
+
+
+def test_missing_write(benchmark):
+    def write():
+        d = Dict()
+        d.optional.feature.enabled = True
+        return d
+    assert benchmark(write).optional.feature.enabled is True
+
+
+def test_autovivifying_write(benchmark, shape):
+    depth, width = shape
+    paths = [[f"key_{i}"] * depth for i in range(width)]
+
+    def write():
+        d = Dict()
+        for path in paths:
+            node = d
+            for key in path[:-1]:
+                node = getattr(node, key)
+            setattr(node, path[-1], 1)
+        return d
+    benchmark(write)
+
+
+def test_freeze(benchmark, config, track_memory):
+    d = Dict(config)
+    benchmark(d.freeze)
+    track_memory(d.freeze)
+
+
+def test_to_dict(benchmark, frozen, track_memory):
+    benchmark(frozen.to_dict)
+    track_memory(frozen.to_dict)
+
+
+def test_update(benchmark, config):
+    other = Dict(config)
+
+    def update():
+        d = Dict(config)
+        d.update(other)
+        return d
+    benchmark(update)
+
+
+def test_or(benchmark, frozen, config):
+    other = Dict(config)
+    benchmark(lambda: frozen | other)
+
+
+def test_pickle_round_trip(benchmark, frozen, track_memory):
+    def round_trip():
+        return pickle.loads(pickle.dumps(frozen))
+    assert benchmark(round_trip) == frozen
+    track_memory(round_trip)
+
+
+def test_deepcopy(benchmark, frozen, track_memory):
+    benchmark(copy.deepcopy, frozen)
+    track_memory(copy.deepcopy, frozen)
+
+
+def test_repr(benchmark, frozen):
+    benchmark(repr, frozen)
@@ -0,0 +1,43 @@
+import pytest
+
+from addicty import Dict
+
+
+@pytest.fixture(params=[100, 10000])
+def records(request):
+    return Dict({
+        'records': [{'id': i, 'zone': i % 50, 'name': f"r{i}"} for i in range(request.param)],
+    }).freeze().records
+
+
+def _ids(records):
+    n = len(records)
+    return [i * 7919 % n for i in range(100)]
+
+
+def test_scan(benchmark, records):
+    ids = _ids(records)
+
+    def lookup():
+        return [next(r for r in records if r.id == i) for i in ids]
+    benchmark(lookup)
+
+
+def test_index_get(benchmark, records):
+    ids = _ids(records)
+    index = records.index_by('id')
+
+    def lookup():
+        return [index.get(i) for i in ids]
+    benchmark(lookup)
+
+
+def test_index_build(benchmark, records):
+    benchmark(lambda: records.index_by('id').rebuild())
+
+
+def test_indexed_append(benchmark):
+    records = Dict({'records': []}).records
+    records.index_by('id')
+    record = Dict(id=1)
+    benchmark(records.append, record)
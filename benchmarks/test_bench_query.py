@@ -0,0 +1,29 @@
+import pytest
+
+from addicty import Dict
+from addicty.query import search
+
+EXPRESSION = "coefficients[?enabled].beta"
+
+
+def make_model():
+    return Dict({
+        'coefficients': {
+            f"c{i}": {'beta': i * 0.5, 'enabled': i % 3 != 0} for i in range(200)
+        },
+    })
+
+
+def _loop(model):
+    return [c.beta for c in model.coefficients.values() if c.enabled]
+
+
+def test_hand_loop(benchmark):
+    benchmark(_loop, make_model().freeze())
+
+
+@pytest.mark.parametrize('frozen', [False, True], ids=['unfrozen', 'frozen'])
+def test_query(benchmark, frozen):
+    model = make_model().freeze(frozen)
+    assert search(EXPRESSION, model) == _loop(model)
+    benchmark(search, EXPRESSION, model)
@@ -0,0 +1,35 @@
+from addicty import Dict
+from addicty.record import compile
+
+
+def make_params():
+    return Dict({
+        'model': {
+            'coefficients': {'beta': 0.5, 'gamma': 1.5, 'delta': -0.25},
+            'settings': {'iterations': 10, 'tolerance': 1e-6},
+        },
+    }).freeze()
+
+
+def _read(cfg):
+    total = 0.0
+    for _ in range(1000):
+        c = cfg.model.coefficients
+        total += c.beta * c.gamma + c.delta * cfg.model.settings.tolerance
+    return total
+
+
+def test_dict_getattr(benchmark):
+    cfg = make_params()
+    benchmark(_read, cfg)
+
+
+def test_compiled_getattr(benchmark):
+    cfg = make_params()
+    compiled = compile(cfg)
+    assert _read(compiled) == _read(cfg)
+    benchmark(_read, compiled)
+
+
+def test_compile(benchmark, frozen):
+    benchmark(compile, frozen)
@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+
+from addicty import Dict
+from addicty.shared import SharedConfig
+
+THREADS = 8
+READS = 5000
+
+
+def _run_readers(read):
+    threads = [threading.Thread(target=read) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.fixture
+def shared(config):
+    return SharedConfig(Dict(config))
+
+
+def test_locked_reads(benchmark, config):
+    current = Dict(config).freeze()
+    lock = threading.Lock()
+
+    def read():
+        for _ in range(READS):
+            with lock:
+                current.key_0.key_1
+    benchmark(_run_readers, read)
+
+
+def test_snapshot_reads(benchmark, shared):
+    def read():
+        for _ in range(READS):
+            shared.snapshot.key_0.key_1
+    benchmark(_run_readers, read)
+
+
+def test_snapshot_reads_with_writer(benchmark, shared):
+    # one writer publishing new versions while the readers run
+    def read():
+        for _ in range(READS):
+            shared.snapshot.key_0.key_1
+
+    def run():
+        stop = threading.Event()
+
+        def write():
+            while not stop.is_set():
+                with shared.edit() as draft:
+                    draft.counter = shared.version
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            _run_readers(read)
+        finally:
+            stop.set()
+            writer.join()
+    benchmark(run)
+
+
+def test_edit(benchmark, shared):
+    def edit():
+        with shared.edit() as draft:
+            draft.counter = shared.version
+    benchmark(edit)
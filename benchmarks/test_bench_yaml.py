@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from addicty import Dict
+from addicty.checkpoint import checkpoint
+
+
+@pytest.fixture
+def yaml_file(tmp_path, config):
+    filename = os.path.join(tmp_path, "config.yaml")
+    Dict(config).dump(filename)
+    return filename
+
+
+def test_load(benchmark, yaml_file, track_memory):
+    benchmark(Dict.load, yaml_file)
+    track_memory(Dict.load, yaml_file)
+
+
+def test_load_string(benchmark, yaml_file):
+    with open(yaml_file) as f:
+        content = f.read()
+    benchmark(Dict.load, content)
+
+
+def test_dump_string(benchmark, frozen, track_memory):
+    benchmark(frozen.dump)
+    track_memory(frozen.dump)
+
+
+def test_dump_file(benchmark, tmp_path, frozen):
+    counter = iter(range(10 ** 9))
+
+    def dump():
+        frozen.dump(os.path.join(tmp_path, f"dump{next(counter)}.yaml"))
+    benchmark(dump)
+
+
+def test_checkpoint_unchanged(benchmark, tmp_path, config):
+    d = Dict(config)
+    filename = os.path.join(tmp_path, "state.yaml")
+    checkpoint(d, filename)
+    benchmark(checkpoint, d, filename)
+
+
+def test_checkpoint_one_key_changed(benchmark, tmp_path, config):
+    d = Dict(config)
+    filename = os.path.join(tmp_path, "state.yaml")
+    counter = iter(range(10 ** 9))
+
+    def write():
+        d.key_0.counter = next(counter)
+        checkpoint(d, filename)
+    benchmark(write)
+
+
+@pytest.fixture(scope='module')
+def records_file(tmp_path_factory):
+    # records with the same 20 keys, as in a table exported to YAML
+    keys = [f"field_{i:02d}" for i in range(20)]
+    filename = os.path.join(tmp_path_factory.mktemp("records"), "records.yaml")
+    Dict(records=[{key: n for key in keys} for n in range(2000)]).dump(filename)
+    return filename
+
+
+@pytest.mark.parametrize('intern_keys', [False, True])
+def test_load_records(benchmark, records_file, intern_keys):
+    import tracemalloc
+    benchmark.pedantic(Dict.load, (records_file,), {'intern_keys': intern_keys}, rounds=3)
+    tracemalloc.start()
+    try:
+        result = Dict.load(records_file, intern_keys=intern_keys)
+        steady, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info['peak_memory_bytes'] = peak
+    benchmark.extra_info['steady_memory_bytes'] = steady
+    assert len(result.records) == 2000
@@ -4,6 +4,7 @@ import unittest
 import pickle
 import collections
 import tempfile
+import threading
 import os
 from addicty import Dict
 
@@ -492,6 +493,23 @@ class AbstractTestsClass(object):
         a = self.dict_class(TEST_DICT)
         self.assertEqual(a, pickle.loads(pickle.dumps(a)))
 
+    def test_pickle_protocols(self):
+        a = self.dict_class(a=[1, {'b': 2}], c={'d': [[3]]})
+        a.a.index_by('b')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for frozen in (False, True):
+                restored = pickle.loads(pickle.dumps(a.freeze(frozen), protocol))
+                self.assertEqual(restored, a)
+                self.assertIsInstance(restored.a[1], self.dict_class)
+                self.assertIs(type(restored.c.d), type(a.c.d))
+                self.assertEqual(restored.a.index_by('b').get(2), {'b': 2})
+                if frozen:
+                    with self.assertRaises(KeyError):
+                        restored.missing
+                restored = pickle.loads(pickle.dumps(a.c.d, protocol))
+                self.assertEqual(restored, [[3]])
+                self.assertIs(type(restored[0]), type(a.c.d))
+
     def test_pickle_with_freeze(self):
         a = self.dict_class(TEST_DICT)
         a.freeze()
@@ -572,6 +590,729 @@ class AbstractTestsClass(object):
             self.fail(e)
         self.assertEqual(a, {'y': {'x': 1}})
 
+    def test_missing_read_placeholder(self):
+        d = self.dict_class()
+        value = d.optional.feature.enabled
+        self.assertFalse(value)
+        self.assertEqual(value, {})
+        self.assertEqual(len(value), 0)
+        self.assertNotIn('x', value)
+        self.assertEqual(list(value), [])
+        self.assertEqual(repr(value), repr(self.dict_class()))
+        self.assertEqual(d, {})
+        # assigning through a kept placeholder, more than once
+        p = d.a.b
+        p.c = 1
+        p['d'] = 2
+        self.assertEqual(d, {'a': {'b': {'c': 1, 'd': 2}}})
+        self.assertIsInstance(d.a.b, self.dict_class)
+        d.a.x.y = 3
+        self.assertEqual(d.a, {'b': {'c': 1, 'd': 2}, 'x': {'y': 3}})
+        # Dict methods work on the placeholder
+        self.assertEqual(d.missing.to_dict(), {})
+        d.other.update({'k': 'v'})
+        self.assertEqual(d.other, {'k': 'v'})
+        if self.dict_class is CHILD_CLASS:
+            self.assertEqual(d.child.child_class_attribute, 'child class attribute')
+
+    def test_missing_placeholder_not_stored(self):
+        from addicty.paths import set_many
+        d = self.dict_class()
+        d.x = d.missing
+        d.update(y=d.missing.deeper)
+        d.z = [1]
+        set_many(d, {'w.v': d.missing})
+        nested = self.dict_class(x=d.missing)
+        for value in (d.x, d.y, d.w.v, nested.x):
+            self.assertIs(type(value), self.dict_class)
+            self.assertEqual(value, {})
+        self.assertEqual(json.loads(json.dumps(d)), {'x': {}, 'y': {}, 'z': [1], 'w': {'v': {}}})
+        self.assertEqual(d.dump(), "x: {}\ny: {}\nz:\n- 1\nw:\n  v: {}\n")
+        self.assertEqual(repr(nested), "---\nx: {}\n...")
+        # the new Dict is attached where it was stored, not where it was read
+        d.x.a = 1
+        self.assertEqual(d.x, {'a': 1})
+        self.assertNotIn('missing', d)
+
+    def test_missing_placeholder_keys(self):
+        # the state of a placeholder hides no keys
+        d = self.dict_class()
+        for name in ('_key', '_parent', '_dict_class', '_materialize'):
+            self.assertEqual(getattr(d.meta, name), {})
+            self.assertFalse(getattr(d.meta, name))
+        d.meta._key.x = 1
+        self.assertEqual(d.to_dict(), {'meta': {'_key': {'x': 1}}})
+        self.assertEqual(json.dumps(d.missing), "{}")
+        self.assertEqual(json.dumps({'a': d.missing.deeper}), '{"a": {}}')
+        self.assertEqual(d.missing.keys(), {}.keys())
+        self.assertNotIn('missing', d)
+
+    def test_compile(self):
+        from addicty.record import compile
+        prop = self.dict_class({
+            'a': {'b': [1, {'c': 2}], 'd': 'x'},
+            'e': {'f': 3, 'd': 'y'},
+            'g': {'h': 1, 'not valid': 2, 'i': {'j': 3}},
+        })
+        with self.assertRaises(ValueError):
+            compile(prop)
+        compiled = compile(prop.freeze())
+        self.assertEqual(compiled.a.b[1].c, 2)
+        self.assertEqual(compiled['a']['d'], 'x')
+        self.assertEqual(compiled.e.f, 3)
+        self.assertEqual(compiled.g['not valid'], 2)
+        self.assertIsInstance(compiled.g, self.dict_class)
+        self.assertIs(type(compiled.a.b[1]), type(compile(self.dict_class({'c': 0}).freeze())))
+        self.assertEqual(compiled.to_dict(), prop.to_dict())
+        self.assertEqual(compiled, prop)
+        self.assertEqual(compiled.dump(), prop.dump())
+        with self.assertRaises(AttributeError):
+            compiled.a.d = 'z'
+        with self.assertRaises(AttributeError):
+            compiled.missing
+
+    def test_validate(self):
+        from addicty.schema import ValidationError, compile_schema, revalidate, validate
+        schema = {
+            'type': 'object',
+            'required': ['name', 'ports'],
+            'properties': {
+                'name': {'type': 'string', 'minLength': 1},
+                'ports': {'type': 'array', 'items': {'type': 'integer', 'minimum': 1}},
+                'db': {
+                    'type': 'object',
+                    'properties': {'host': {'type': 'string'}},
+                    'additionalProperties': False,
+                },
+            },
+        }
+        self.assertIs(compile_schema(schema), compile_schema(dict(schema)))
+        prop = self.dict_class({'name': 'x', 'ports': [80, 443], 'db': {'host': 'h'}})
+        validate(prop, schema, track=True)
+
+        prop.db.host = 5
+        prop.db.user = 'u'
+        with self.assertRaises(ValidationError) as cm:
+            revalidate(prop)
+        self.assertEqual(sorted(p for p, _ in cm.exception.errors), [('db',), ('db', 'host')])
+        prop.db.host = 'h'
+        del prop.db.user
+        revalidate(prop)
+
+        # a subtree set since the last check is itself tracked afterwards
+        prop.db = self.dict_class({'host': 'h2'})
+        revalidate(prop)
+        prop.db.port = 1
+        with self.assertRaises(ValidationError):
+            revalidate(prop)
+        del prop.db.port
+        del prop.name
+        with self.assertRaises(ValidationError) as cm:
+            revalidate(prop)
+        self.assertEqual(cm.exception.errors, [((), "missing required keys 'name'")])
+        prop.name = 'y'
+        revalidate(prop)
+        with self.assertRaises(ValueError):
+            revalidate(self.dict_class())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'config.yaml')
+            prop.dump(filename)
+            self.assertEqual(self.dict_class.load(filename, schema=schema), prop)
+            prop.ports[0] = 0
+            prop.dump(os.path.join(tmp, 'bad.yaml'))
+            with self.assertRaises(ValidationError) as cm:
+                self.dict_class.load(os.path.join(tmp, 'bad.yaml'), schema=schema)
+            self.assertEqual(cm.exception.errors[0][0], ('ports', 0))
+
+    def test_numeric_array(self):
+        from addicty.numeric import Array
+        content = {
+            'a': [1, 2, 3], 'b': [1.5, 2], 'm': [[1, 2], [3, 4.5]],
+            's': ['x', 1], 't': [True, 1], 'e': [], 'n': {'x': [0.5]},
+        }
+        prop = self.dict_class(content, __numeric='array')
+        self.assertIsInstance(prop.a, Array)
+        self.assertEqual(prop.a.typecode, 'q')
+        self.assertEqual(prop.b.typecode, 'd')
+        self.assertIsInstance(prop.m[1], Array)
+        self.assertIsInstance(prop.n.x, Array)
+        for key in 'ste':
+            self.assertNotIsInstance(prop[key], Array)
+        self.assertEqual(prop.to_dict(), {**content, 'b': [1.5, 2.0], 'm': [[1, 2], [3.0, 4.5]]})
+        self.assertEqual(prop, content)
+        self.assertEqual(self.dict_class.load(prop.dump()), prop)
+        prop.a.append(4)
+        prop.freeze()
+        with self.assertRaises(TypeError):
+            prop.a.append(5)
+        with self.assertRaises(TypeError):
+            prop.m[0][0] = 5
+        from addicty.record import compile
+        self.assertEqual(compile(prop).to_dict(), prop.to_dict())
+        prop.unfreeze()
+        prop.a[0] = 0
+        self.assertEqual(prop.a, [0, 2, 3, 4])
+        self.assertEqual(pickle.loads(pickle.dumps(prop)), prop)
+        for copied in (pickle.loads(pickle.dumps(prop.freeze())), copy.copy(prop)):
+            self.assertEqual(copied, prop)
+            self.assertIsInstance(copied.a, Array)
+            self.assertIsInstance(copied.m[0], Array)
+            self.assertIsInstance(copied.n, self.dict_class)
+            with self.assertRaises(TypeError):
+                copied.a.append(5)
+
+    def test_numeric_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        content = "a: [1, 2, 3]\nm: [[1, 2], [3, 4.5]]\nr: [[1], [2, 3]]\ns: [x, 1]\n"
+        prop = self.dict_class.load(content, numeric='numpy')
+        self.assertEqual(prop.a.dtype, numpy.int64)
+        self.assertEqual(prop.m.shape, (2, 2))
+        self.assertEqual(prop.m.dtype, numpy.float64)
+        self.assertIsInstance(prop.r[1], numpy.ndarray)
+        self.assertFalse(prop.m.flags.writeable)
+        self.assertEqual(prop.to_dict(), {
+            'a': [1, 2, 3], 'm': [[1.0, 2.0], [3.0, 4.5]], 'r': [[1], [2, 3]], 's': ['x', 1],
+        })
+        self.assertEqual(self.dict_class.load(prop.dump()), prop.to_dict())
+        # arrays are compared as a whole
+        self.assertEqual(prop, self.dict_class.load(content, numeric='numpy'))
+        self.assertNotEqual(prop, self.dict_class.load(content.replace('4.5', '5'), numeric='numpy'))
+        self.assertNotEqual(prop, {})
+        self.assertEqual(prop.r, [[1], [2, 3]])
+        copied = pickle.loads(pickle.dumps(prop))
+        self.assertIsInstance(copied.m, numpy.ndarray)
+        self.assertEqual(copied, prop)
+        from addicty.watch import changed_paths
+        changed = self.dict_class.load(content.replace('[1], [2, 3]', '[1], [2, 4]'), numeric='numpy')
+        self.assertEqual(changed_paths(prop, changed), [('r',)])
+        from addicty.record import compile
+        compiled = compile(prop)
+        self.assertIs(compiled.m, prop.m)
+        self.assertEqual(compiled.to_dict(), prop.to_dict())
+        self.assertEqual(self.dict_class.load(compiled.dump()), prop.to_dict())
+        prop.unfreeze()
+        prop.m[0, 0] = 0
+        self.assertEqual(prop.m.sum(), 9.5)
+
+    def test_to_columns(self):
+        from addicty.columnar import ColumnarList
+        from addicty.numeric import Array
+        records = [{'id': i, 'fare': i * 1.5, 'mode': 'bus', 'stop': {'x': i}} for i in range(4)]
+        prop = self.dict_class({'trips': records})
+        table = prop.trips.to_columns()
+        self.assertIsInstance(table.columns.fare, Array)
+        self.assertEqual(table.columns.mode, ['bus'] * 4)
+        self.assertEqual(len(table), 4)
+        self.assertIsInstance(table[2], self.dict_class)
+        self.assertEqual(table[-1].stop.x, 3)
+        self.assertEqual(table[1:3].to_list(), records[1:3])
+        self.assertEqual([row.id for row in table], [0, 1, 2, 3])
+        self.assertEqual(sum(table.columns.fare), 9.0)
+        self.assertEqual(table, records)
+        self.assertEqual(table.to_rows(), prop.trips)
+        table.append({'id': 4, 'fare': 6.0, 'mode': 'rail', 'stop': {'x': 4}})
+        self.assertEqual(table[4].mode, 'rail')
+        with self.assertRaises(ValueError):
+            table.append({'id': 5})
+        # a value that does not fit its column changes no column
+        with self.assertRaises(TypeError):
+            table.append({'id': 5.5, 'fare': 1.0, 'mode': 'rail', 'stop': {'x': 5}})
+        with self.assertRaises(TypeError):
+            table.append({'id': 5, 'fare': 'free', 'mode': 'rail', 'stop': {'x': 5}})
+        self.assertEqual(len(table), 5)
+        self.assertEqual({len(values) for values in table.columns.values()}, {5})
+        self.assertEqual(table[-1].id, 4)
+
+        prop.trips = table
+        self.assertEqual(prop.to_dict()['trips'], records + [table[4].to_dict()])
+        self.assertEqual(self.dict_class.load(prop.dump()).trips, prop.to_dict()['trips'])
+        prop.freeze()
+        with self.assertRaises(TypeError):
+            table.append(records[0])
+        with self.assertRaises(TypeError):
+            table.columns.id[0] = 1
+
+        # a table is not an array, and equal tables are equal
+        from addicty import numeric
+        from addicty.shared import SharedConfig
+        from addicty.watch import changed_paths
+        self.assertFalse(numeric.is_array(table))
+        self.assertTrue(numeric.equal(table, table[:]))
+        shared = SharedConfig({'t': table})
+        changes = []
+        shared.subscribe(lambda paths, snapshot: changes.append(paths))
+        with shared.edit() as draft:
+            draft.z = 1
+        self.assertEqual(changes, [[('z',)]])
+        self.assertEqual(changed_paths(self.dict_class(t=table), self.dict_class(t=table[:])), [])
+        nested = self.dict_class(l=[table])
+        self.assertEqual(nested.to_dict(), {'l': [table.to_list()]})
+        nested.freeze()
+        with self.assertRaises(TypeError):
+            table.append(records[0])
+        nested.unfreeze()
+
+        with self.assertRaises(ValueError):
+            self.dict_class({'t': [{'a': 1}, {'b': 2}]}).t.to_columns()
+        with self.assertRaises(ValueError):
+            ColumnarList({'a': [1, 2], 'b': [1]})
+
+    def test_to_columns_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        table = self.dict_class({'t': [{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'y'}]}).t.to_columns('numpy')
+        self.assertIsInstance(table.columns.a, numpy.ndarray)
+        self.assertIs(type(table[0].a), int)
+        table.append({'a': 3, 'b': 'z'})
+        self.assertEqual(table.columns.a.sum(), 6)
+        arrays = table.to_numpy()
+        self.assertEqual(arrays['b'].tolist(), ['x', 'y', 'z'])
+        try:
+            import pandas
+        except ImportError:
+            return
+        df = table.to_pandas()
+        self.assertEqual(list(df.columns), ['a', 'b'])
+        self.assertEqual(type(table).from_pandas(df), table)
+
+    def test_index_by(self):
+        prop = self.dict_class({'r': [{'id': i, 'zone': i % 3} for i in range(9)] + [5]})
+        records = prop.r
+        by_id = records.index_by('id')
+        by_zone = records.index_by('zone')
+        by_both = records.index_by('zone', 'id')
+        self.assertIs(records.index_by('id'), by_id)
+        self.assertEqual(by_id.get(3), {'id': 3, 'zone': 0})
+        self.assertIsNone(by_id.get(30))
+        self.assertEqual([r.id for r in by_zone.filter(1)], [1, 4, 7])
+        self.assertEqual(by_both[(1, 4)].id, 4)
+        self.assertEqual(len(by_id), 9)
+        with self.assertRaises(KeyError):
+            by_id[30]
+
+        records.append(self.dict_class(id=9, zone=1))
+        records.extend([self.dict_class(id=10, zone=1)])
+        self.assertEqual([r.id for r in by_zone.filter(1)], [1, 4, 7, 9, 10])
+        records.remove(by_id[4])
+        del records[0]
+        self.assertNotIn(4, by_id)
+        self.assertNotIn(0, by_id)
+        self.assertEqual([r.id for r in by_zone.filter(1)], [1, 7, 9, 10])
+        records[0] = self.dict_class(id=1, zone=2)
+        self.assertEqual(by_zone.get(2).id, 1)
+        records.insert(0, self.dict_class(id=0, zone=0))
+        records.sort(key=lambda r: -r.id if isinstance(r, dict) else 0)
+        self.assertEqual([r.id for r in by_zone.filter(1)], [10, 9, 7])
+        self.assertEqual(by_both[(0, 0)].id, 0)
+        self.assertIsInstance(records, self.dict_class._Sequence)
+
+        copied = pickle.loads(pickle.dumps(prop))
+        self.assertEqual(copied, prop)
+        self.assertIs(type(copy.copy(records)), type(self.dict_class({'r': []}).r))
+        self.assertEqual(prop.to_dict()['r'], copied.r)
+        prop.freeze()
+        self.assertEqual(by_id[10].zone, 1)
+
+    def test_query(self):
+        from addicty.query import QueryError, compile, search
+        prop = self.dict_class({
+            'coefficients': {
+                'a': {'beta': 0.5, 'enabled': True},
+                'b': {'beta': 1.5, 'enabled': False},
+                'c': {'beta': 2, 'enabled': True},
+            },
+            'zones': [
+                {'id': 1, 'pop': 500, 'tags': ['x', 'y']},
+                {'id': 2, 'pop': 5000, 'tags': ['z']},
+            ],
+        })
+        cases = {
+            'coefficients.*.beta': [0.5, 1.5, 2],
+            'coefficients[?enabled].beta': [0.5, 2],
+            'coefficients.a.beta': 0.5,
+            'zones[*].id': [1, 2],
+            'zones[?pop > `1000`].id': [2],
+            'zones[?!(pop > `1000`) && id == `1`].id': [1],
+            "zones[?tags[0] == 'x'] | [0].id": 1,
+            'zones[].tags[]': ['x', 'y', 'z'],
+            'zones[*].tags[0]': ['x', 'z'],
+            'zones[0].tags[-1]': 'y',
+            'zones[1:].id': [2],
+            'zones[*].{i: id, p: pop}': [{'i': 1, 'p': 500}, {'i': 2, 'p': 5000}],
+            'zones[*].[id, pop]': [[1, 500], [2, 5000]],
+            'missing.x[0]': None,
+        }
+        for expression, expected in cases.items():
+            self.assertEqual(search(expression, prop), expected, expression)
+        self.assertNotIn('missing', prop)
+        self.assertEqual(search('[?id == `2`].pop', prop.zones), [5000])
+        self.assertIs(compile('zones[*].id'), compile('zones[*].id'))
+        with self.assertRaises(QueryError):
+            search('zones[?', prop)
+        with self.assertRaises(QueryError):
+            search('length(zones)', prop)
+
+        prop.freeze()
+        ids = search('zones[*].id', prop)
+        ids.append(3)
+        self.assertEqual(search('zones[*].id', prop), [1, 2])
+        prop.zones[0].id = 7
+        self.assertEqual(search('zones[*].id', prop), [7, 2])
+        prop.unfreeze()
+        prop.zones[1].id = 8
+        self.assertEqual(search('zones[*].id', prop), [7, 8])
+
+    def test_query_keys(self):
+        # the example of the README: Elasticsearch bodies have 'query' keys
+        body = self.dict_class()
+        body.query.filtered.query.match.description = 'addictive'
+        body.query.filtered.filter.term.created_by = 'Mats'
+        self.assertEqual(body.to_dict(), {
+            'query': {
+                'filtered': {
+                    'query': {'match': {'description': 'addictive'}},
+                    'filter': {'term': {'created_by': 'Mats'}},
+                },
+            },
+        })
+        self.assertEqual(self.dict_class.load("query: {match: 1}\n").query, {'match': 1})
+
+    def test_walk(self):
+        from addicty.paths import walk
+        prop = self.dict_class({'a': {'b': 1, 'c': [1, {'x': 2}]}, 'f': 3})
+        self.assertEqual([path for path, _ in walk(prop)], [
+            ('a',), ('a', 'b'), ('a', 'c'), ('a', 'c', 0), ('a', 'c', 1), ('a', 'c', 1, 'x'), ('f',),
+        ])
+        walked = dict(walk(prop))
+        self.assertIs(walked[('a', 'c')], prop.a.c)
+        pruned = [path for path, _ in walk(prop, prune=lambda path, value: path == ('a', 'c'))]
+        self.assertEqual(pruned, [('a',), ('a', 'b'), ('a', 'c'), ('f',)])
+        self.assertEqual(list(walk(self.dict_class())), [])
+
+    def test_flatten(self):
+        from addicty.paths import flatten, unflatten
+        prop = self.dict_class({'a': {'b': 1, 'c': [1, {'x': 2}], 'e': {}}, 'f': 3, 2: {'g': 4}})
+        self.assertEqual(flatten(prop), {'a.b': 1, 'a.c': [1, {'x': 2}], 'a.e': {}, 'f': 3, '2.g': 4})
+        self.assertEqual(flatten(prop, sep='/', lists=True), {
+            'a/b': 1, 'a/c/0': 1, 'a/c/1/x': 2, 'a/e': {}, 'f': 3, '2/g': 4,
+        })
+        flat = flatten(prop, sep=None)
+        self.assertEqual(list(flat)[0], ('a', 'b'))
+        restored = unflatten(flat, dict_class=self.dict_class)
+        self.assertEqual(restored, prop)
+        self.assertIsInstance(restored.a, self.dict_class)
+        self.assertIsInstance(restored.a.c[1], self.dict_class)
+        self.assertEqual(unflatten(flatten(prop)), {
+            'a': {'b': 1, 'c': [1, {'x': 2}], 'e': {}}, 'f': 3, '2': {'g': 4},
+        })
+        self.assertEqual(unflatten({'x.y': 1, 'z': 2, 'x.w.v': 3}), {'x': {'y': 1, 'w': {'v': 3}}, 'z': 2})
+        with self.assertRaises(ValueError):
+            unflatten({'a': 1, 'a.b': 2})
+
+    def test_set_many(self):
+        from addicty.paths import set_many
+        prop = self.dict_class({'a': {'b': 1}})
+        self.assertIs(set_many(prop, {'a.c.d': [1, {'x': 2}], ('e', 'f.g'): 3, 'a.b': 4}), prop)
+        self.assertEqual(prop, {'a': {'b': 4, 'c': {'d': [1, {'x': 2}]}}, 'e': {'f.g': 3}})
+        self.assertIsInstance(prop.a.c, self.dict_class)
+        self.assertIsInstance(prop.a.c.d[1], self.dict_class)
+        set_many(prop, [('a/c/e', 5)], sep='/')
+        self.assertEqual(prop.a.c.e, 5)
+        with self.assertRaises(ValueError):
+            set_many(prop, {'a.b.x': 1})
+        prop.freeze()
+        set_many(prop, {'a.b': 6})
+        self.assertEqual(prop.a.b, 6)
+        with self.assertRaises(KeyError):
+            set_many(prop, {'a.z.y': 1})
+        self.assertNotIn('z', prop.a)
+
+    def test_set_many_missing(self):
+        from addicty.paths import set_many
+        prop = self.dict_class()
+        new = set_many(prop.new, {'a.b': 1, 'c': 2})
+        self.assertIs(prop.new, new)
+        self.assertIsInstance(new, self.dict_class)
+        self.assertEqual(prop, {'new': {'a': {'b': 1}, 'c': 2}})
+        other = prop.other.deeper
+        set_many(other, {'x': 1})
+        self.assertEqual(prop.other.deeper.x, 1)
+        self.assertIs(type(prop.other.deeper), self.dict_class)
+        # nothing is added when nothing is set
+        set_many(prop.empty, {})
+        self.assertNotIn('empty', prop)
+        child = self.dict_class(__parent=prop, __key='child')
+        set_many(child, [('y.z', 3)])
+        self.assertIs(prop.child, child)
+        self.assertEqual(prop.child.y.z, 3)
+
+    def test_builder(self):
+        from addicty.paths import builder
+        with builder(freeze=True, dict_class=self.dict_class) as build:
+            for i in range(3):
+                build[f"z.k{i}.v"] = i
+            build.set(('z', 'k0', 'w'), [1])
+        self.assertIsInstance(build.result, self.dict_class)
+        self.assertEqual(build.result.to_dict(), {'z': {'k0': {'v': 0, 'w': [1]}, 'k1': {'v': 1}, 'k2': {'v': 2}}})
+        with self.assertRaises(KeyError):
+            build.result.missing
+        with self.assertRaises(RuntimeError):
+            with builder(dict_class=self.dict_class) as build:
+                build['a.b'] = 1
+                raise RuntimeError
+        self.assertEqual(build.result, {})
+
+    def test_checkpoint(self):
+        from addicty.checkpoint import checkpoint
+        prop = self.dict_class({'a': {'x': 1, 'y': [1, 2]}, 'b': True, 'c': {}})
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'nested', 'state.yaml')
+            self.assertTrue(checkpoint(prop, filename))
+            self.assertEqual(os.listdir(os.path.dirname(filename)), ['state.yaml'])
+            with open(filename) as f:
+                self.assertEqual(f.read(), prop.dump())
+            self.assertFalse(checkpoint(prop, filename))
+            prop.b = 1
+            self.assertTrue(checkpoint(prop, filename, fsync=True))
+            self.assertEqual(self.dict_class.load(filename), prop)
+            self.assertIs(self.dict_class.load(filename).b, 1)
+            with open(filename, 'a') as f:
+                f.write('z: 1\n')
+            self.assertTrue(checkpoint(prop, filename))
+            self.assertEqual(self.dict_class.load(filename), prop)
+            self.assertTrue(checkpoint(prop, filename, explicit_start=True))
+            with open(filename) as f:
+                self.assertEqual(f.read(), prop.dump(explicit_start=True))
+        self.assertEqual(self.dict_class(checkpoint=1).checkpoint, 1)
+
+    def test_compressed_files(self):
+        from addicty.checkpoint import checkpoint
+        prop = self.dict_class({'a': {'x': 1, 'y': [1, 2]}, 'b': 'text'})
+        with tempfile.TemporaryDirectory() as tmp:
+            for ext, magic in (('.gz', b'\x1f\x8b'), ('.bz2', b'BZh'), ('.xz', b'\xfd7zXZ')):
+                filename = os.path.join(tmp, f'config.yaml{ext}')
+                prop.dump(filename)
+                with open(filename, 'rb') as f:
+                    self.assertEqual(f.read(len(magic)), magic)
+                self.assertEqual(self.dict_class.load(filename), prop)
+            # without a telling extension, the magic bytes are checked
+            renamed = os.path.join(tmp, 'renamed.yaml')
+            os.rename(os.path.join(tmp, 'config.yaml.xz'), renamed)
+            self.assertEqual(self.dict_class.load(renamed), prop)
+            with open(os.path.join(tmp, 'main.yaml'), 'w') as f:
+                f.write('inc: !include config.yaml.gz\n')
+            self.assertEqual(self.dict_class.load(os.path.join(tmp, 'main.yaml')).inc, prop)
+            self.assertTrue(checkpoint(prop, os.path.join(tmp, 'state.yaml.gz')))
+            self.assertEqual(self.dict_class.load(os.path.join(tmp, 'state.yaml.gz')), prop)
+
+    def test_share(self):
+        from addicty.shared import SharedConfig
+        prop = self.dict_class({'a': {'x': 0, 'y': 0}})
+        shared = SharedConfig(prop)
+        self.assertIsInstance(shared.snapshot, self.dict_class)
+        with self.assertRaises(KeyError):
+            shared.snapshot.missing
+        prop.a.x = 5
+        self.assertEqual(shared.snapshot.a.x, 0)
+        changes = []
+        shared.subscribe(lambda paths, snapshot: changes.append(paths))
+        stop = threading.Event()
+        torn = []
+
+        def read():
+            while not stop.is_set():
+                snapshot = shared.snapshot
+                if snapshot.a.x != snapshot.a.y:
+                    torn.append(snapshot)
+
+        def write():
+            for _ in range(200):
+                with shared.edit() as draft:
+                    draft.a.x = draft.a.y = draft.a.x + 1
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        writers = [threading.Thread(target=write) for _ in range(4)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        stop.set()
+        for thread in readers:
+            thread.join()
+        self.assertEqual(torn, [])
+        self.assertEqual(shared.snapshot.a.x, 800)
+        self.assertEqual(shared.version, 800)
+        self.assertEqual(sorted(changes[0]), [('a', 'x'), ('a', 'y')])
+        with self.assertRaises(RuntimeError):
+            with shared.edit() as draft:
+                draft.a.x = -1
+                raise RuntimeError
+        self.assertEqual(shared.snapshot.a.x, 800)
+        shared.update(b=1)
+        self.assertEqual(shared.snapshot.b, 1)
+        shared.publish({'c': [1]})
+        self.assertEqual(shared.snapshot, {'c': [1]})
+        self.assertIsInstance(shared.snapshot, self.dict_class)
+        self.assertIs(type(SharedConfig({'a': 1}).snapshot), Dict)
+        self.assertEqual(self.dict_class(share=1).share, 1)
+
+    def test_intern_keys(self):
+        text = "records:\n" + "".join(f"- {{name: r{i}, zone: {i}}}\n" for i in range(3))
+        plain = self.dict_class.load(text)
+        interned = self.dict_class.load(text, intern_keys=True)
+        self.assertEqual(plain, interned)
+        self.assertIsInstance(interned.records[0], self.dict_class)
+        first, second = (list(r)[0] for r in interned.records[:2])
+        self.assertIs(first, second)
+        first, second = (list(r)[0] for r in plain.records[:2])
+        self.assertIsNot(first, second)
+        # the state of each node lives in slots, not in an instance dict
+        self.assertEqual(Dict.__dictoffset__, 0)
+        self.assertTrue(interned.records[0]._Dict__frozen)
+
+    def test_lazy(self):
+        from addicty import lazy
+        calls = []
+        started = threading.Event()
+
+        def expensive():
+            calls.append(1)
+            started.wait(5)
+            return {'zones': [1, 2, 3]}
+
+        d = self.dict_class(name='x', data=lazy.Lazy(expensive))
+        self.assertIsInstance(d, self.dict_class)
+        threads = [threading.Thread(target=lambda: d.data.zones) for _ in range(8)]
+        for t in threads:
+            t.start()
+        started.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(calls), 1)
+        # the value is kept in place of the Lazy, converted like any other
+        self.assertIsInstance(dict.__getitem__(d, 'data'), self.dict_class)
+        self.assertEqual(d['data'].zones, [1, 2, 3])
+        self.assertEqual(d.get('data'), {'zones': [1, 2, 3]})
+        self.assertIsNone(d.get('missing'))
+        self.assertEqual(len(calls), 1)
+
+        # a frozen Dict freezes what its Lazy values compute
+        frozen = self.dict_class(a=lazy.Lazy(dict, b=1)).freeze()
+        self.assertEqual(frozen.a.b, 1)
+        with self.assertRaises(KeyError):
+            frozen.a.c
+
+        # to_dict evaluates, unless asked to keep the Lazy values
+        d = self.dict_class()
+        d.inner.value = lazy.Lazy(lambda: 7)
+        kept = d.to_dict(lazy='keep')
+        self.assertIsInstance(kept['inner']['value'], lazy.Lazy)
+        self.assertEqual(d.to_dict(), {'inner': {'value': 7}})
+        self.assertEqual(d.to_dict(lazy='keep'), {'inner': {'value': 7}})
+        with self.assertRaises(ValueError):
+            d.to_dict(lazy='never')
+
+        # copies and pickles keep the Lazy values, without computing them
+        d = self.dict_class(a=lazy.Lazy(lambda: 1), b=lazy.Lazy(lambda: 2))
+        self.assertEqual(copy.deepcopy(d).to_dict(), {'a': 1, 'b': 2})
+        calls = []
+        d = self.dict_class(a=lazy.Lazy(lambda: calls.append(1) or 1), n={'b': {'c': 2}})
+        copies = [d.copy(), copy.copy(d)]
+        for other in copies:
+            self.assertIs(type(other.n), self.dict_class)
+            self.assertEqual(other.n.b.c, 2)
+            self.assertIs(other.n, d.n)
+        self.assertEqual(calls, [])
+        self.assertEqual([other.a for other in copies], [1, 1])
+        self.assertEqual(calls, [1])
+        d = self.dict_class(a=lazy.Lazy(abs, -1), n={'b': {'c': 2}}).freeze()
+        restored = pickle.loads(pickle.dumps(d))
+        self.assertIsInstance(dict.__getitem__(restored, 'a'), lazy.Lazy)
+        self.assertIs(type(restored.n.b), self.dict_class)
+        self.assertEqual(restored.n.b.c, 2)
+        self.assertEqual(restored.a, 1)
+        self.assertEqual(restored.to_dict(), {'a': 1, 'n': {'b': {'c': 2}}})
+        with self.assertRaises(KeyError):
+            restored.missing
+        # a computed Lazy pickles as its value
+        value = lazy.Lazy(abs, -1)
+        value.resolve()
+        self.assertEqual(pickle.loads(pickle.dumps(value)), 1)
+
+        # !lazy tags call registered resolvers only
+        lazy.register('test_double', lambda x: x * 2)
+        self.addCleanup(lazy.resolvers.pop, 'test_double')
+        text = "a: !lazy {test_double: 21}\nb: 1\n"
+        d = self.dict_class.load(text)
+        self.assertIsInstance(dict.__getitem__(d, 'a'), lazy.Lazy)
+        self.assertEqual(self.dict_class.load(d.dump(lazy='keep')).to_dict(), {'a': 42, 'b': 1})
+        self.assertEqual(d.a, 42)
+        self.assertEqual(d.dump(lazy='keep'), d.dump())
+        import yaml
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            self.dict_class.load("a: !lazy test_undefined\n")
+
+        # Lazy items of Lists are evaluated by to_dict and dump, but kept
+        lazy.register('test_one', lambda: {'x': 1})
+        self.addCleanup(lazy.resolvers.pop, 'test_one')
+        d = self.dict_class.load("items:\n- !lazy test_one\n- 2\n")
+        self.assertEqual(self.dict_class.load(d.dump(lazy='keep'))['items'][0].tag, ('test_one', lazy._no_argument))
+        self.assertEqual(d.to_dict(), {'items': [{'x': 1}, 2]})
+        self.assertEqual(repr(d), "---\nitems:\n- x: 1\n- 2\n...")
+        self.assertIsInstance(d['items'][0], lazy.Lazy)
+        self.assertIsInstance(d['items'][0].resolve(), Dict)
+        with self.assertRaises(ValueError):
+            d['items'].to_list(lazy='never')
+
+        # the same !lazy tags compare equal, and are not seen as changed
+        from addicty.watch import changed_paths
+        first, second = self.dict_class.load(text), self.dict_class.load(text)
+        self.assertEqual(first, second)
+        self.assertEqual(changed_paths(first, second), [])
+        self.assertIsInstance(dict.__getitem__(first, 'a'), lazy.Lazy)
+        self.assertNotEqual(first, self.dict_class.load(text.replace('21', '20')))
+        self.assertEqual(changed_paths(first, self.dict_class.load(text.replace('21', '20'))), [('a',)])
+        self.assertEqual(lazy.Lazy(abs, -1), lazy.Lazy(abs, -1))
+        self.assertNotEqual(lazy.Lazy(abs, -1), lazy.Lazy(abs, 1))
+        self.assertNotEqual(lazy.Lazy(abs, -1), 1)
+        computed = lazy.Lazy(abs, -1)
+        computed.resolve()
+        self.assertEqual(computed, 1)
+        self.assertEqual(computed, lazy.Lazy(abs, -1))
+
+        # compiling a frozen Dict computes its Lazy values
+        from addicty.record import compile
+        frozen = self.dict_class(a=lazy.Lazy(lambda: 1), l=[lazy.Lazy(dict, x=2)]).freeze()
+        compiled = compile(frozen)
+        self.assertEqual(compiled.a, 1)
+        self.assertEqual(compiled.l[0].x, 2)
+        self.assertEqual(compiled.dump(), "a: 1\nl:\n- x: 2\n")
+
+        # adump can keep the tags too
+        import asyncio
+        d = self.dict_class.load(text)
+        self.assertEqual(asyncio.run(d.adump(lazy='keep')), d.dump(lazy='keep'))
+        self.assertIsInstance(dict.__getitem__(d, 'a'), lazy.Lazy)
+        self.assertEqual(asyncio.run(self.dict_class(x=[1]).x.adump(lazy='keep')), "- 1\n")
+
+        # a schema skips the values not computed yet
+        schema = {'properties': {'a': {'type': 'integer'}, 'b': {'type': 'integer'}}}
+        d = self.dict_class.load(text, schema=schema)
+        self.assertIsInstance(dict.__getitem__(d, 'a'), lazy.Lazy)
+        # a tagged Lazy pickles as its tag
+        restored = pickle.loads(pickle.dumps(d))
+        self.assertEqual(dict.__getitem__(restored, 'a').tag, ('test_double', 21))
+        self.assertEqual(restored.a, 42)
+        from addicty.schema import ValidationError
+        with self.assertRaises(ValidationError):
+            self.dict_class.load("a: !lazy {test_double: 21}\nb: x\n", schema=schema)
+
     def test_top_freeze_against_top_key(self):
         "Test that d.freeze() produces KeyError on d.missing."
         d = self.dict_class()
@@ -688,6 +1429,235 @@ class AbstractTestsClass(object):
             with self.assertRaises(ValueError):
                 x = self.dict_class.load(filename)
 
+    def test_load_many(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filenames = []
+            for i in range(4):
+                filename = os.path.join(tmpdir, f"temp{i}.yaml")
+                with open(filename, 'wt') as f:
+                    f.write(f"---\na: {i}\nb:\n  c: [{i}, {i + 1}]\n...")
+                filenames.append(filename)
+            for executor in ("thread", "process"):
+                loaded = self.dict_class.load_many(filenames, executor=executor, max_workers=2)
+                self.assertEqual(len(loaded), 4)
+                for i, x in enumerate(loaded):
+                    self.assertIsInstance(x, self.dict_class)
+                    self.assertIsInstance(x.b, self.dict_class)
+                    self.assertEqual(x.to_dict(), {'a': i, 'b': {'c': [i, i + 1]}})
+                    with self.assertRaises(KeyError):
+                        x.missing
+
+    def test_load_many_errors(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            good = os.path.join(tmpdir, "good.yaml")
+            with open(good, 'wt') as f:
+                f.write("a: 1\n")
+            broken = os.path.join(tmpdir, "broken.yaml")
+            with open(broken, 'wt') as f:
+                f.write("malformed_content\n  is not ok")
+            missing = os.path.join(tmpdir, "missing.yaml")
+            with self.assertRaises(ValueError) as cm:
+                self.dict_class.load_many([good, broken], executor="thread")
+            self.assertIn("FOUND YAML ERRORS", str(cm.exception))
+            loaded = self.dict_class.load_many(
+                [good, broken, missing], executor="thread", return_exceptions=True,
+            )
+            self.assertEqual(loaded[0], {'a': 1})
+            self.assertIsInstance(loaded[1], ValueError)
+            self.assertIsInstance(loaded[2], FileNotFoundError)
+
+    def test_aload_adump(self):
+        import asyncio
+        prop = self.dict_class(TEST_DICT)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filenames = [os.path.join(tmpdir, f"temp{i}.yaml") for i in range(3)]
+
+            async def round_trip():
+                await asyncio.gather(*(prop.adump(f) for f in filenames))
+                one = await self.dict_class.aload(filenames[0])
+                many = await self.dict_class.aload_many(filenames)
+                text = await prop.adump(explicit_start=True, explicit_end=True)
+                return one, many, text
+
+            one, many, text = asyncio.run(round_trip())
+        self.assertIsInstance(one, self.dict_class)
+        self.assertEqual(one, prop)
+        self.assertEqual(many, [prop, prop, prop])
+        self.assertEqual(text, TEST_DICT_YAML + "\n")
+
+    def test_watch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "temp.yaml")
+            with open(filename, 'wt') as f:
+                f.write("a: 1\nb:\n  c: 2\n  d: 3\n")
+            from addicty.watch import WatchedConfig
+            watched = WatchedConfig(filename, dict_class=self.dict_class)
+            first = watched.snapshot
+            self.assertIsInstance(first, self.dict_class)
+            notified = []
+            watched.subscribe(lambda changes, snapshot: notified.append((changes, snapshot)))
+            self.assertEqual(watched.check(), [])
+            with open(filename, 'wt') as f:
+                f.write("a: 1\nb:\n  c: 22\n  d: 3\ne: 4\n")
+            changes = watched.check()
+            self.assertEqual(sorted(changes), [('b', 'c'), ('e',)])
+            self.assertEqual(notified, [(changes, watched.snapshot)])
+            self.assertEqual(watched.snapshot.b.c, 22)
+            self.assertEqual(first.b.c, 2)
+            with self.assertRaises(KeyError):
+                watched.snapshot.missing
+            # rewriting the same content is not a change
+            with open(filename, 'wt') as f:
+                f.write("a: 1\nb:\n  c: 22\n  d: 3\ne: 4\n  ")
+            self.assertEqual(watched.check(), [])
+            self.assertEqual(len(notified), 1)
+            # included files are watched until an edit drops the include
+            included = os.path.join(tmpdir, "inc.yaml")
+            with open(included, 'wt') as f:
+                f.write("x: 1\n")
+            with open(filename, 'wt') as f:
+                f.write("a: 1\ni: !include inc.yaml\n")
+            self.assertEqual(sorted(watched.check()), [('b',), ('e',), ('i',)])
+            with open(included, 'wt') as f:
+                f.write("x: 22\n")
+            self.assertEqual(watched.check(), [('i', 'x')])
+            with open(filename, 'wt') as f:
+                f.write("a: 2\n")
+            os.remove(included)
+            self.assertEqual(sorted(watched.check()), [('a',), ('i',)])
+            self.assertEqual(watched.snapshot, {'a': 2})
+            self.assertEqual(watched._graph_signature()[0][0], os.path.abspath(filename))
+            self.assertEqual(len(watched._graph_signature()), 1)
+
+    def test_load_lint_modes(self):
+        from addicty import yaml_checker
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "temp.yaml")
+            with open(filename, 'wt') as f:
+                f.write("a: 1\nb: 2")  # no newline at end of file
+            messages = []
+            x = self.dict_class.load(filename, logger=messages.append, lint="on_error")
+            self.assertEqual(x, {'a': 1, 'b': 2})
+            self.assertEqual(messages, [])
+            self.dict_class.load(filename, logger=messages.append)
+            self.assertEqual(messages[0], f"FOUND YAML ERRORS IN {filename}")
+            self.assertIn("new-line-at-end-of-file", messages[1])
+            eager = list(messages)
+            messages.clear()
+            self.dict_class.load(filename, logger=messages.append, lint="background")
+            yaml_checker._executor.submit(lambda: None).result()
+            self.assertEqual(messages, eager)
+            with self.assertRaises(ValueError):
+                self.dict_class.load(filename, logger=messages.append, lint="sometimes")
+
+    def test_lint_cache(self):
+        from addicty import yaml_checker
+        content = "a: 1\nb:  [1,2]\n"
+        first = yaml_checker.lint_problems(content, "a.yaml")
+        self.assertTrue(first)
+        self.assertIs(yaml_checker.lint_problems(content, "a.yaml"), first)
+        self.assertIs(yaml_checker.lint_config(), yaml_checker.lint_config())
+        with tempfile.TemporaryDirectory() as tmp:
+            config_file = os.path.join(tmp, "yamllint.yaml")
+            with open(config_file, 'w') as f:
+                f.write("rules:\n  colons: enable\n  commas:\n    ignore: b.yaml\n")
+            content = "a: [1,2]\n"
+            # rules that ignore some paths are applied per path
+            self.assertEqual(len(yaml_checker.lint_problems(content, "b.yaml", config_file)), 0)
+            self.assertEqual(len(yaml_checker.lint_problems(content, "a.yaml", config_file)), 1)
+            # a changed config file is read again, and the results with it
+            st = os.stat(config_file)
+            with open(config_file, 'w') as f:
+                f.write("rules:\n  colons: enable\n  commas: disable\n")
+            os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+            self.assertEqual(yaml_checker.lint_problems(content, "a.yaml", config_file), [])
+
+    def test_load_include(self):
+        from addicty.include import IncludeCache
+        with tempfile.TemporaryDirectory() as tmpdir:
+            def write(name, content):
+                filename = os.path.join(tmpdir, name)
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                with open(filename, 'wt') as f:
+                    f.write(content)
+                return filename
+            main = write("main.yaml", "a: !include parts/a.yaml\nb: !include parts/b.yaml\n")
+            write("parts/a.yaml", "x: 1\nshared: !include shared.yaml\n")
+            write("parts/b.yaml", "- !include shared.yaml\n- 2\n")
+            write("parts/shared.yaml", "s: [1, 2]\n")
+            cache = IncludeCache()
+            x = self.dict_class.load(main, include_cache=cache)
+            self.assertEqual(x.to_dict(), {
+                'a': {'x': 1, 'shared': {'s': [1, 2]}},
+                'b': [{'s': [1, 2]}, 2],
+            })
+            self.assertIsInstance(x.a.shared, self.dict_class)
+            with self.assertRaises(KeyError):
+                x.a.missing
+            self.assertEqual(len(cache.dependencies(os.path.abspath(main))), 4)
+            # only the changed file is parsed again
+            write("parts/shared.yaml", "s: [3, 4, 5]\n")
+            from addicty import include
+            parsed = []
+            original = include.parse
+            include.parse = lambda stream, Loader: parsed.append(stream) or original(stream, Loader)
+            try:
+                y = self.dict_class.load(main, include_cache=cache)
+            finally:
+                include.parse = original
+            self.assertEqual(len(parsed), 1)
+            self.assertEqual(y.b[0].s, [3, 4, 5])
+            write("parts/shared.yaml", "back: !include ../main.yaml\n")
+            with self.assertRaises(ValueError) as cm:
+                self.dict_class.load(main)
+            self.assertIn("circular", str(cm.exception))
+
+    def test_instrument(self):
+        from addicty import instrument
+        calls = []
+        instrument.reset()
+        instrument.enable(callback=lambda *args: calls.append(args))
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                filename = os.path.join(tmpdir, "temp.yaml")
+                self.dict_class(TEST_DICT).dump(filename)
+                self.dict_class.load(filename)
+        finally:
+            instrument.disable()
+        stats = instrument.stats()
+        for phase in ("dump.to_dict", "dump.emit", "dump.write",
+                      "load.read", "load.parse", "load.hook", "load.freeze"):
+            self.assertEqual(stats[phase]['calls'], 1, phase)
+        self.assertEqual(stats["load.hook"]['nodes'], 4)
+        self.assertEqual(stats["load.read"]['bytes'], stats["dump.write"]['bytes'])
+        self.assertEqual(len(calls), 7)
+        self.dict_class.load(TEST_DICT_YAML)
+        self.assertEqual(instrument.stats(), stats)
+        instrument.reset()
+        self.assertEqual(instrument.stats(), {})
+
+    def test_memory_usage(self):
+        import sys
+        from addicty.memory import memory_usage
+        prop = self.dict_class({'a': {'b': [1.5, 'x' * 1000]}, 'c': {'d': 2.5}})
+        prop.shared = prop.a.b
+        usage = memory_usage(prop, depth=2)
+        self.assertIsInstance(usage, self.dict_class)
+        self.assertEqual(set(usage.children), {'a', 'c', 'shared'})
+        self.assertEqual(
+            usage.bytes, sum(child.bytes for child in usage.children.values())
+            + sys.getsizeof(prop)
+            + sum(sys.getsizeof(k) for k in prop)
+        )
+        self.assertGreater(usage.children.a.children.b.bytes, 1000)
+        # the shared list is only counted once
+        self.assertEqual(usage.children.shared.bytes, 0)
+        self.assertEqual(usage.children.shared.nodes, 0)
+        self.assertEqual(usage.nodes, 7)
+        shallow = memory_usage(prop, deep=False)
+        self.assertLess(shallow.bytes, usage.bytes - 1000)
+        self.assertEqual(memory_usage(prop.a.b).nodes, 3)
+
 class DictTests(unittest.TestCase, AbstractTestsClass):
     dict_class = Dict
 
@@ -695,12 +1665,112 @@ class DictTests(unittest.TestCase, AbstractTestsClass):
 class ChildDictTests(unittest.TestCase, AbstractTestsClass):
     dict_class = CHILD_CLASS
 
+class FakeS3Client(object):
+    """An in-memory stand-in for a boto3 S3 client."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def upload_fileobj(self, fileobj, bucket, key):
+        self.objects[(bucket, key)] = fileobj.read()
+
+    def download_fileobj(self, bucket, key, fileobj):
+        fileobj.write(self.objects[(bucket, key)])
+
+
+class S3Tests(unittest.TestCase):
+
+    def setUp(self):
+        from addicty import s3
+        self.s3 = s3
+        self.client = FakeS3Client()
+        s3.configure(client=self.client)
+
+    def tearDown(self):
+        self.s3.configure(client=None)
+
+    def test_injected_client_round_trip(self):
+        prop = Dict(TEST_DICT)
+        prop.dump("s3://bucket/path/to/config.yaml")
+        self.assertIn(("bucket", "path/to/config.yaml"), self.client.objects)
+        loaded = Dict.load("s3://bucket/path/to/config.yaml")
+        self.assertEqual(loaded, prop)
+
+    def test_explicit_client(self):
+        other = FakeS3Client()
+        self.s3.to_s3(Dict(TEST_DICT), "bucket", "key", client=other)
+        self.assertEqual(self.client.objects, {})
+        loaded = self.s3.from_s3(Dict, "bucket", "key", client=other)
+        self.assertEqual(loaded, TEST_DICT)
+
+    def test_configure_keeps_unset_arguments(self):
+        self.s3.configure(max_pool_connections=25)
+        try:
+            self.assertIs(self.s3.get_client(), self.client)
+            self.assertEqual(self.s3.max_pool_connections, 25)
+        finally:
+            self.s3.configure(max_pool_connections=10)
+
+
+class LintTests(unittest.TestCase):
+
+    def test_lint_files(self):
+        from addicty import lint
+        with tempfile.TemporaryDirectory() as tmpdir:
+            good = os.path.join(tmpdir, "good.yaml")
+            with open(good, 'wt') as f:
+                f.write("a: 1\n")
+            bad = os.path.join(tmpdir, "sub", "bad.yml")
+            os.makedirs(os.path.dirname(bad))
+            with open(bad, 'wt') as f:
+                f.write("a: 1\na: 2\n")
+            cache_file = os.path.join(tmpdir, "cache.json")
+            files = list(lint.find_yaml_files([tmpdir]))
+            self.assertEqual(files, [good, bad])
+            results = lint.lint_files(files, cache_file=cache_file, executor="thread")
+            self.assertEqual(results[good], [])
+            self.assertEqual([p.rule for p in results[bad]], ['key-duplicates'])
+            lines = list(lint.format_results(results, 'parsable'))
+            self.assertEqual(len(lines), 1)
+            self.assertTrue(lines[0].startswith(f"{bad}:2:1: [error] "))
+            # a second run is served from the cache
+            cached = lint.lint_files(files, cache_file=cache_file, executor="not-needed")
+            self.assertEqual(list(lint.format_results(cached, 'parsable')), lines)
+            self.assertEqual(lint.main([tmpdir, '-j', '2']), 1)
+            self.assertEqual(lint.main([good]), 0)
+
+
+class ImportTests(unittest.TestCase):
+
+    # generous, as it includes compiling the modules when there is no
+    # bytecode cache; importing yaml alone costs about as much again
+    BUDGET_SECONDS = 0.15
+
+    def test_import_time(self):
+        import subprocess
+        import sys
+        root = os.path.dirname(os.path.abspath(__file__))
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'from addicty import Dict; Dict(a=1).a'],
+            capture_output=True, text=True, check=True, cwd=root,
+        )
+        imported = {}
+        for line in result.stderr.splitlines():
+            if line.startswith('import time:') and '|' in line:
+                _, cumulative, name = line[len('import time:'):].split('|')
+                if cumulative.strip().isdigit():
+                    imported[name.strip()] = int(cumulative) / 1e6
+        for heavy in ('yaml', 'yamllint', 'boto3', 'botocore', 'numpy'):
+            self.assertNotIn(heavy, imported)
+        self.assertLess(imported['addicty'], self.BUDGET_SECONDS)
+
+
 """
 Allow for these test cases to be run from the command line
 via `python test_addict.py`
 """
 if __name__ == '__main__':
-    test_classes = (DictTests, ChildDictTests)
+    test_classes = (DictTests, ChildDictTests, S3Tests, LintTests, ImportTests)
     loader = unittest.TestLoader()
     runner = unittest.TextTestRunner(verbosity=2)
     for class_ in test_classes: